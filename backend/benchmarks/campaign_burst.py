@@ -0,0 +1,104 @@
+"""
+Campaign Burst Benchmark
+Simulates an ad campaign landing many visitors on the same page at once: every
+visitor sends the same opening message concurrently. Counts upstream Groq
+calls and turn latency with single-flight coalescing off and on, and reports
+how close the database connection pool came to saturation.
+
+Usage (from backend/):
+    python benchmarks/campaign_burst.py --visitors 50 --latency 0.5
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import tempfile
+import time
+import uuid
+from pathlib import Path
+
+# Add backend directory to path
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from benchmarks.fakes import FakeServer, create_fake_groq_app
+
+
+async def burst(visitors: int, message: str, page: str) -> list:
+    """Run one opening turn per visitor, all at once; returns turn latencies."""
+    from core.database import SessionLocal
+    from services.container import ServiceContainer
+    from utils.chatbot import ProVisionChatbot
+
+    services = ServiceContainer()
+
+    async def visit() -> float:
+        db = SessionLocal()
+        try:
+            start = time.perf_counter()
+            await ProVisionChatbot(db, services).process_message(
+                message, session_id=str(uuid.uuid4()), page_context=page
+            )
+            return time.perf_counter() - start
+        finally:
+            db.close()
+
+    try:
+        return await asyncio.gather(*(visit() for _ in range(visitors)))
+    finally:
+        await services.aclose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--visitors", type=int, default=50)
+    parser.add_argument("--latency", type=float, default=0.5)
+    parser.add_argument("--message", default="Hi! I saw your ad, what's this about?")
+    parser.add_argument("--page", default="facebook")
+    parser.add_argument("--port", type=int, default=8772)
+    args = parser.parse_args()
+
+    fake_app = create_fake_groq_app(latency=args.latency)
+
+    with FakeServer(fake_app, args.port), tempfile.TemporaryDirectory() as tmp:
+        # Point the app at the local stand-in and a scratch database before
+        # settings are loaded
+        os.environ["GROQ_BASE_URL"] = f"http://127.0.0.1:{args.port}"
+        os.environ.setdefault("GROQ_API_KEY", "benchmark-key")
+        os.environ["DATABASE_URL"] = f"sqlite:///{tmp}/burst.db"
+        os.environ["DEBUG"] = "false"
+        # Keep the intent router out of it: every visitor needs the LLM
+        os.environ["INTENT_ROUTER_ENABLED"] = "false"
+
+        from core.config import settings
+        from core.database import init_db, pool_stats
+
+        init_db()
+
+        print("=" * 60)
+        print(" CAMPAIGN BURST BENCHMARK")
+        print("=" * 60)
+        print(
+            f"{args.visitors} visitors, {args.latency}s upstream latency, "
+            f"page={args.page!r}, message={args.message!r}\n"
+        )
+
+        for enabled in (False, True):
+            settings.SINGLE_FLIGHT_ENABLED = enabled
+            fake_app.state.calls = 0
+            latencies = sorted(asyncio.run(burst(args.visitors, args.message, args.page)))
+            p95 = latencies[int(0.95 * (len(latencies) - 1))]
+            print(
+                f"single-flight {'on ' if enabled else 'off'}: "
+                f"{fake_app.state.calls:4d} upstream calls, "
+                f"p50 {statistics.median(latencies):.2f}s, p95 {p95:.2f}s"
+            )
+
+        pool = pool_stats()["sync"]
+        print(
+            f"\nDB pool: peak saturation {pool['peak_saturation']:.0%} of "
+            f"{pool['pool_size']}+{pool['max_overflow']} connections, "
+            f"checkout wait p95 {pool['wait_ms_p95']} ms, {pool['timeouts']} timeouts"
+        )
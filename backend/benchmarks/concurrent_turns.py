@@ -0,0 +1,194 @@
+"""
+Concurrent Turns Stress Test
+Double-sends every qualification answer, concurrently and across two simulated
+worker processes, then checks each conversation for lost or duplicated
+updates.
+
+Each worker is its own ServiceContainer, so the per-session lock only
+serializes duplicates that land on the same worker; duplicates that land on
+different workers race and must be resolved by the conversation's row
+version. The fake Groq server extracts nothing, so only the rule-based
+extractor advances qualification and the expected state can be replayed
+exactly. A conversation passes when:
+
+- message seqs are 1..N with user and assistant strictly alternating
+- progress and answers equal a serial replay of its user messages in seq order
+
+Usage (from backend/):
+    python benchmarks/concurrent_turns.py --sessions 4 --duplicates 3
+
+Exits non-zero if any conversation fails the checks.
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import sys
+import tempfile
+import uuid
+from pathlib import Path
+
+# Add backend directory to path
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from benchmarks.fakes import FakeServer, create_fake_groq_app
+from benchmarks.load_test import ANSWERS
+
+
+async def visitor(workers: list, duplicates: int, rng: random.Random) -> tuple:
+    """
+    Answer all 7 questions, sending each answer `duplicates` times at once.
+
+    Returns:
+        (session_id, number of turns that failed with an error)
+    """
+    from core.database import SessionLocal
+    from utils.chatbot import ProVisionChatbot
+
+    session_id = str(uuid.uuid4())
+    errors = 0
+
+    async def send(services, message: str) -> None:
+        db = SessionLocal()
+        try:
+            await ProVisionChatbot(db, services).process_message(
+                message, session_id=session_id
+            )
+        finally:
+            db.close()
+
+    for variants in ANSWERS:
+        # Parseable phrasings only, so the expected state is well defined
+        message = rng.choice(variants[:3])
+        results = await asyncio.gather(
+            *(send(workers[i % len(workers)], message) for i in range(duplicates)),
+            return_exceptions=True,
+        )
+        for result in results:
+            if isinstance(result, Exception):
+                errors += 1
+                print(f"   turn failed: {type(result).__name__}: {result}")
+
+    return session_id, errors
+
+
+def check_conversation(session_id: str) -> list:
+    """Compare a conversation's stored state with a serial replay of its messages."""
+    from core.database import SessionLocal
+    from models.conversation import Conversation
+    from models.conversation_message import ConversationMessage
+    from services.qualification_service import QualificationService
+
+    db = SessionLocal()
+    try:
+        conversation = (
+            db.query(Conversation).filter(Conversation.session_id == session_id).one()
+        )
+        messages = (
+            db.query(ConversationMessage)
+            .filter(ConversationMessage.conversation_id == conversation.id)
+            .order_by(ConversationMessage.seq)
+            .all()
+        )
+    finally:
+        db.close()
+
+    problems = []
+    seqs = [message.seq for message in messages]
+    if seqs != list(range(1, len(messages) + 1)):
+        problems.append(f"seqs not contiguous: {seqs}")
+    roles = [message.role for message in messages]
+    if roles != ["user", "assistant"] * (len(messages) // 2) or len(messages) % 2:
+        problems.append(f"roles do not alternate: {roles}")
+
+    qualification = QualificationService()
+    progress, answers = 0, {}
+    for message in messages:
+        if message.role != "user":
+            continue
+        question = qualification.get_next_question(progress)
+        answer = question and qualification.extract_answer(question["field"], message.content)
+        if answer:
+            answers[question["field"]] = answer
+            progress += 1
+
+    if conversation.qualification_progress != progress:
+        problems.append(
+            f"progress {conversation.qualification_progress}, serial replay gives {progress}"
+        )
+    if (conversation.qualification_answers or {}) != answers:
+        problems.append(
+            f"answers {conversation.qualification_answers}, serial replay gives {answers}"
+        )
+    return problems
+
+
+async def run(args) -> int:
+    """Drive all visitors, then check every conversation; returns failed count."""
+    from services.container import ServiceContainer
+
+    workers = [ServiceContainer() for _ in range(args.workers)]
+    rng = random.Random(args.seed)
+    try:
+        results = await asyncio.gather(
+            *(visitor(workers, args.duplicates, rng) for _ in range(args.sessions))
+        )
+    finally:
+        for services in workers:
+            await services.aclose()
+
+    failed = 0
+    for session_id, errors in results:
+        problems = check_conversation(session_id)
+        if errors:
+            problems.append(f"{errors} turns raised")
+        status = "FAIL" if problems else "ok"
+        print(f"   {session_id[:8]}  {status}")
+        for problem in problems:
+            print(f"      - {problem}")
+        failed += bool(problems)
+
+    print()
+    for i, services in enumerate(workers):
+        print(f"worker {i}: {services.metrics()['session_locks']}")
+    return failed
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sessions", type=int, default=4)
+    parser.add_argument("--duplicates", type=int, default=3)
+    parser.add_argument("--workers", type=int, default=2)
+    parser.add_argument("--latency", type=float, default=0.05)
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--port", type=int, default=8773)
+    args = parser.parse_args()
+
+    fake_app = create_fake_groq_app(latency=args.latency, extraction_answers={})
+
+    with FakeServer(fake_app, args.port), tempfile.TemporaryDirectory() as tmp:
+        # Point the app at the local stand-in and a scratch database before
+        # settings are loaded
+        os.environ["GROQ_BASE_URL"] = f"http://127.0.0.1:{args.port}"
+        os.environ.setdefault("GROQ_API_KEY", "benchmark-key")
+        os.environ["DATABASE_URL"] = f"sqlite:///{tmp}/concurrent.db"
+        os.environ["DEBUG"] = "false"
+        os.environ["INTENT_ROUTER_ENABLED"] = "false"
+
+        from core.database import init_db
+
+        init_db()
+
+        print("=" * 60)
+        print(" CONCURRENT TURNS STRESS TEST")
+        print("=" * 60)
+        print(
+            f"{args.sessions} sessions x 7 answers x {args.duplicates} concurrent "
+            f"copies over {args.workers} workers\n"
+        )
+
+        failed = asyncio.run(run(args))
+        print(f"\n{'FAILED' if failed else 'PASSED'}: {failed}/{args.sessions} conversations inconsistent")
+        sys.exit(1 if failed else 0)
@@ -0,0 +1,195 @@
+"""
+Index Usage Check
+Runs the hot service queries against a fresh SQLite database migrated to
+head, captures the SQL they send, and checks EXPLAIN QUERY PLAN: each must
+read through its index from migration 0007, and none may scan its table or
+sort in a temporary B-tree.
+Exits non-zero if any query plan regresses.
+
+Usage (from backend/):
+    python benchmarks/explain_indexes.py
+"""
+
+import os
+import sys
+import tempfile
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# Add backend directory to path
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+
+def capture_selects(engine, table, action):
+    """
+    Run `action` and return the SELECTs it sent that read `table`.
+
+    Returns:
+        List of (statement, parameters)
+    """
+    from sqlalchemy import event
+
+    captured = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT") and f"FROM {table}" in statement:
+            captured.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        action()
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+    return captured
+
+
+def query_plan(engine, statement, parameters):
+    """EXPLAIN QUERY PLAN detail lines for a captured statement"""
+    with engine.connect() as connection:
+        rows = connection.exec_driver_sql("EXPLAIN QUERY PLAN " + statement, parameters)
+        return [row[-1] for row in rows]
+
+
+def main():
+    with tempfile.TemporaryDirectory() as tmp:
+        os.environ["DATABASE_URL"] = f"sqlite:///{tmp}/explain.db"
+        os.environ["DEBUG"] = "false"
+
+        from sqlalchemy import select
+
+        from core.database import SessionLocal, engine, init_db
+        from main import APPOINTMENT_ORDER
+        from models.appointment import Appointment
+        from services.conversation_service import ConversationService
+        from services.lead_service import LEAD_ORDER, LeadService
+        from services.seminar_service import SEMINAR_ORDER, SeminarService
+
+        init_db()
+        db = SessionLocal()
+        leads = LeadService(db)
+        seminars = SeminarService(db)
+        conversations = ConversationService(db)
+
+        lead = leads.create_lead(name="Index Check", email="index.check@example.com")
+        seminar = seminars.create_seminar(
+            title="Index Check",
+            description="",
+            topic="Annuities",
+            date=datetime.utcnow() + timedelta(days=7),
+        )
+        db.commit()
+
+        lead_cursor = LEAD_ORDER.encode(lead)
+        seminar_cursor = SEMINAR_ORDER.encode(seminar)
+        appointment_cursor = APPOINTMENT_ORDER.encode(
+            Appointment(id=1, scheduled_time=datetime.utcnow())
+        )
+
+        def list_appointments(lead_id=None, cursor=None):
+            query = select(Appointment)
+            if lead_id:
+                query = query.where(Appointment.lead_id == lead_id)
+            db.scalars(APPOINTMENT_ORDER.apply(query, cursor).limit(51)).all()
+
+        # (description, table, expected index, action)
+        checks = [
+            ("leads, first page", "leads", "ix_leads_score_id", lambda: leads.list_leads()),
+            (
+                "leads, next page",
+                "leads",
+                "ix_leads_score_id",
+                lambda: leads.list_leads(cursor=lead_cursor),
+            ),
+            (
+                "leads by status",
+                "leads",
+                "ix_leads_status_score",
+                lambda: leads.list_leads(qualification_status="High", cursor=lead_cursor),
+            ),
+            (
+                "leads by source",
+                "leads",
+                "ix_leads_source_score",
+                lambda: leads.list_leads(source="seminar", cursor=lead_cursor),
+            ),
+            (
+                "high value leads",
+                "leads",
+                "ix_leads_score_id",
+                lambda: leads.get_high_value_leads(),
+            ),
+            ("recent leads", "leads", "ix_leads_created_at", lambda: leads.get_recent_leads()),
+            (
+                "lead counts by status",
+                "leads",
+                "ix_leads_status_score",
+                lambda: leads.count_leads_by_status(),
+            ),
+            (
+                "upcoming seminars",
+                "seminars",
+                "ix_seminars_date_id",
+                lambda: seminars.page_upcoming_seminars(cursor=seminar_cursor),
+            ),
+            (
+                "duplicate registration check",
+                "seminar_registrations",
+                "ix_seminar_registrations_seminar_email",
+                lambda: seminars.register_attendee(
+                    seminar.id, guest_name="Guest", guest_email="guest@example.com"
+                ),
+            ),
+            (
+                "recent conversations",
+                "conversations",
+                "ix_conversations_last_updated",
+                lambda: conversations.get_recent_conversations(),
+            ),
+            (
+                "appointments",
+                "appointments",
+                "ix_appointments_scheduled",
+                lambda: list_appointments(cursor=appointment_cursor),
+            ),
+            (
+                "appointments for a lead",
+                "appointments",
+                "ix_appointments_lead_scheduled",
+                lambda: list_appointments(lead_id=lead.id),
+            ),
+        ]
+
+        print("Index usage (EXPLAIN QUERY PLAN)")
+        print("=" * 60)
+
+        failures = 0
+        for description, table, index, action in checks:
+            selects = capture_selects(engine, table, action)
+            db.rollback()
+            if not selects:
+                print(f"FAIL {description}: no SELECT on {table} captured")
+                failures += 1
+                continue
+
+            plan = query_plan(engine, *selects[0])
+            uses_index = any(f"INDEX {index}" in line for line in plan)
+            scans_table = any(line == f"SCAN {table}" for line in plan)
+            sorts = any("TEMP B-TREE" in line for line in plan)
+            ok = uses_index and not scans_table and not sorts
+            failures += not ok
+
+            print(f"{'ok  ' if ok else 'FAIL'} {description} ({index})")
+            for line in plan:
+                print(f"       {line}")
+
+        db.close()
+        engine.dispose()
+
+    print("=" * 60)
+    print(f"{len(checks) - failures}/{len(checks)} queries use their index")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,169 @@
+"""
+Fake Upstream Servers - Local stand-ins for external APIs
+Lets benchmarks run offline with predictable, configurable latency.
+"""
+
+import asyncio
+import json
+import threading
+import time
+import uuid
+
+import uvicorn
+from fastapi import FastAPI
+from fastapi.responses import StreamingResponse
+
+
+# Returned for qualification extraction prompts; the chatbot keeps whichever
+# field matches the pending question, so every turn advances the 7-question flow
+EXTRACTION_ANSWERS = {
+    "age_range": "51-65",
+    "retirement_timeline": "1-5 years",
+    "state": "FL",
+    "investable_assets": "$500k-$1M",
+    "current_annuity": "No",
+    "concerns": "Guaranteed income",
+    "goals": "Travel",
+}
+
+
+def create_fake_groq_app(
+    latency: float = 0.5,
+    completion_tokens: int = 40,
+    extraction_answers: dict = EXTRACTION_ANSWERS,
+) -> FastAPI:
+    """
+    Build an app that mimics Groq's OpenAI-compatible chat completions API.
+
+    Streaming requests (stream=True) wait `latency` for the first token and
+    then emit one chunk per word. Extraction prompts (those asking for JSON)
+    get `extraction_answers` back.
+
+    Args:
+        latency: Seconds to wait before answering each completion
+        completion_tokens: Number of words in each generated reply
+        extraction_answers: JSON returned for extraction prompts
+
+    Returns:
+        FastAPI app serving /openai/v1/chat/completions
+    """
+    app = FastAPI()
+    app.state.calls = 0
+
+    @app.post("/openai/v1/chat/completions")
+    async def chat_completions(payload: dict):
+        app.state.calls += 1
+        completion_id = f"chatcmpl-{uuid.uuid4().hex}"
+        await asyncio.sleep(latency)
+
+        if payload.get("stream"):
+            return StreamingResponse(
+                stream_chunks(completion_id, payload), media_type="text/event-stream"
+            )
+
+        if any(
+            "valid JSON" in message.get("content", "")
+            for message in payload.get("messages", [])
+        ):
+            content = json.dumps(extraction_answers)
+        else:
+            content = " ".join(["word"] * completion_tokens)
+
+        return {
+            "id": completion_id,
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": payload.get("model", "fake-model"),
+            "choices": [
+                {
+                    "index": 0,
+                    "message": {"role": "assistant", "content": content},
+                    "finish_reason": "stop",
+                }
+            ],
+            "usage": {
+                "prompt_tokens": 0,
+                "completion_tokens": completion_tokens,
+                "total_tokens": completion_tokens,
+            },
+        }
+
+    async def stream_chunks(completion_id: str, payload: dict):
+        for i in range(completion_tokens):
+            chunk = {
+                "id": completion_id,
+                "object": "chat.completion.chunk",
+                "created": int(time.time()),
+                "model": payload.get("model", "fake-model"),
+                "choices": [
+                    {
+                        "index": 0,
+                        "delta": {"content": "word" if i == 0 else " word"},
+                        "finish_reason": None,
+                    }
+                ],
+            }
+            yield f"data: {json.dumps(chunk)}\n\n"
+            await asyncio.sleep(0.005)
+        yield "data: [DONE]\n\n"
+
+    return app
+
+
+def create_fake_calcom_app(latency: float = 0.2) -> FastAPI:
+    """
+    Build an app that mimics the Cal.com v1 availability and bookings API.
+
+    Args:
+        latency: Seconds to wait before answering each request
+
+    Returns:
+        FastAPI app serving /availability and /bookings
+    """
+    app = FastAPI()
+    app.state.calls = 0
+
+    @app.get("/availability")
+    async def availability():
+        app.state.calls += 1
+        await asyncio.sleep(latency)
+        return {"busy": [], "timeZone": "America/New_York", "workingHours": []}
+
+    @app.post("/bookings")
+    async def bookings(payload: dict):
+        app.state.calls += 1
+        await asyncio.sleep(latency)
+        return {
+            "id": app.state.calls,
+            "uid": uuid.uuid4().hex,
+            "startTime": payload.get("start"),
+            "status": "ACCEPTED",
+        }
+
+    return app
+
+
+class FakeServer:
+    """Runs an ASGI app with uvicorn on a background thread."""
+
+    def __init__(self, app: FastAPI, port: int):
+        self.app = app
+        self.port = port
+        self.server = uvicorn.Server(
+            uvicorn.Config(app, host="127.0.0.1", port=port, log_level="warning")
+        )
+        self.thread = threading.Thread(target=self.server.run, daemon=True)
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.port}"
+
+    def __enter__(self) -> "FakeServer":
+        self.thread.start()
+        while not self.server.started:
+            time.sleep(0.01)
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.server.should_exit = True
+        self.thread.join(timeout=5)
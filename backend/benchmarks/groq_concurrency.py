@@ -0,0 +1,91 @@
+"""
+Groq Concurrency Benchmark
+Compares chat throughput of the blocking Groq client against the AsyncGroq
+path when many conversations share a single event loop (one uvicorn worker).
+
+Usage (from backend/):
+    python benchmarks/groq_concurrency.py --requests 32 --latency 0.25
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+from pathlib import Path
+
+# Add backend directory to path
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from benchmarks.fakes import FakeServer, create_fake_groq_app
+
+
+def run_blocking(requests: int) -> float:
+    """Old code path: sync Groq client called from inside async handlers."""
+    from groq import Groq
+    from core.config import settings
+
+    client = Groq(api_key=settings.GROQ_API_KEY, base_url=settings.GROQ_BASE_URL)
+
+    async def handle_chat(i: int):
+        response = client.chat.completions.create(
+            model=settings.GROQ_MODEL,
+            messages=[{"role": "user", "content": f"Tell me about annuities ({i})"}],
+        )
+        return response.choices[0].message.content
+
+    async def main():
+        await asyncio.gather(*(handle_chat(i) for i in range(requests)))
+
+    start = time.perf_counter()
+    asyncio.run(main())
+    return time.perf_counter() - start
+
+
+def run_async(requests: int) -> float:
+    """New code path: GroqService backed by AsyncGroq."""
+    from services.groq_service import GroqService
+
+    async def main():
+        service = GroqService()
+        await asyncio.gather(
+            *(
+                service.generate_response(f"Tell me about annuities ({i})")
+                for i in range(requests)
+            )
+        )
+
+    start = time.perf_counter()
+    asyncio.run(main())
+    return time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--requests", type=int, default=32)
+    parser.add_argument("--latency", type=float, default=0.25)
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+
+    fake_app = create_fake_groq_app(latency=args.latency)
+
+    with FakeServer(fake_app, args.port) as server:
+        # Point the Groq SDK at the local stand-in before settings are loaded
+        os.environ["GROQ_BASE_URL"] = server.url
+        os.environ.setdefault("GROQ_API_KEY", "benchmark-key")
+
+        print("=" * 60)
+        print(" GROQ CONCURRENCY BENCHMARK")
+        print("=" * 60)
+        print(f"Concurrent chats: {args.requests}")
+        print(f"Upstream latency: {args.latency * 1000:.0f} ms\n")
+
+        blocking = run_blocking(args.requests)
+        print(f"Blocking Groq client: {blocking:6.2f}s  ({args.requests / blocking:7.1f} req/s)")
+
+        non_blocking = run_async(args.requests)
+        print(f"AsyncGroq client:     {non_blocking:6.2f}s  ({args.requests / non_blocking:7.1f} req/s)")
+
+        print(f"\nSpeedup: {blocking / non_blocking:.1f}x")
+        print(f"Upstream calls served: {fake_app.state.calls}")
@@ -0,0 +1,111 @@
+"""
+Knowledge Search Benchmark
+Compares the BM25 inverted index (knowledge.search_index) and the NumPy
+character n-gram TF-IDF matcher (knowledge.semantic_matcher) with the
+original linear substring scan over FAQ_DATABASE: latency per query and what
+each returns as the top result.
+
+Usage (from backend/):
+    python benchmarks/knowledge_search.py --repeat 2000
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+# Add backend directory to path
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from knowledge.faq_database import FAQ_DATABASE
+from knowledge.search_index import knowledge_index, search_knowledge
+from knowledge.semantic_matcher import semantic_matcher
+
+QUERIES = [
+    "what is an annuity",
+    "annuity",
+    "how much do you charge",
+    "when should I claim social security",
+    "can I withdraw money early from an annuity",
+    "fixed vs variable annuities",
+    "is the seminar free",
+    "how do I log into my account",
+    "long term care costs",
+    "I'm worried about the stock market crashing",
+    "required minimum distributions",
+    "how are you paid",
+    # Paraphrases and typos
+    "what do you get paid",
+    "waht is an anuity",
+    "are the seminars recorded",
+]
+
+
+def linear_scan(query):
+    """The original search_faq: substring checks over every FAQ, unranked"""
+    query_lower = query.lower()
+    results = []
+
+    for category, faqs in FAQ_DATABASE.items():
+        for faq in faqs:
+            if (
+                query_lower in faq["question"].lower()
+                or query_lower in faq["answer"].lower()
+                or any(keyword in query_lower for keyword in faq["keywords"])
+            ):
+                results.append(faq)
+
+    return results
+
+
+def time_per_query(search, repeat: int) -> float:
+    """Mean microseconds per query over all QUERIES."""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for query in QUERIES:
+            search(query)
+    return (time.perf_counter() - start) / (repeat * len(QUERIES)) * 1e6
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=2000)
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print(" KNOWLEDGE SEARCH BENCHMARK")
+    print("=" * 60)
+    print(
+        f"Index: {len(knowledge_index.documents)} documents, "
+        f"{len(knowledge_index.postings)} terms "
+        f"(linear scan covers {sum(len(f) for f in FAQ_DATABASE.values())} FAQs)\n"
+    )
+
+    linear_us = time_per_query(linear_scan, args.repeat)
+    faq_us = time_per_query(
+        lambda q: knowledge_index.search(q, k=5, source="faq"), args.repeat
+    )
+    bm25_us = time_per_query(lambda q: knowledge_index.search(q, k=5), args.repeat)
+    semantic_us = time_per_query(lambda q: semantic_matcher.match(q, k=5), args.repeat)
+
+    print(f"{'linear scan (FAQ only)':<28} {linear_us:8.1f} us/query")
+    print(f"{'BM25 top-5 (FAQ only)':<28} {faq_us:8.1f} us/query")
+    print(f"{'BM25 top-5 (all knowledge)':<28} {bm25_us:8.1f} us/query")
+    print(f"{'n-gram TF-IDF (all)':<28} {semantic_us:8.1f} us/query")
+
+    print("\nTop result per query (linear scan / BM25 / n-gram TF-IDF):")
+    for query in QUERIES:
+        linear = linear_scan(query)
+        ranked = search_knowledge(query, k=1)
+        print(f"\n  {query!r}")
+        print(
+            f"    linear: {linear[0]['question'] if linear else '-'}"
+            f"  ({len(linear)} unranked matches)"
+        )
+        print(
+            f"    bm25:   {ranked[0]['title'] if ranked else '-'}"
+            f"  [{ranked[0]['source'] if ranked else ''}]"
+        )
+        score, document = semantic_matcher.match(query, k=1)[0]
+        print(f"    ngram:  {document['title']}  [{document['source']}, {score:.2f}]")
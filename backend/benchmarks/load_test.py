@@ -0,0 +1,362 @@
+"""
+End-to-End Load Test
+Drives realistic multi-turn qualification conversations against main.app with
+local fake Groq and Cal.com servers, so it runs offline.
+
+Each virtual user browses upcoming seminars, opens a chat over the streaming
+endpoint, answers the 7 qualification questions, checks the summary, books
+an appointment and fetches the transcript. Reports throughput, p50/p95/p99
+latency per endpoint, DB queries per chat turn and memory growth.
+
+Usage (from backend/):
+    python benchmarks/load_test.py --users 50 --concurrency 10 --latency 0.3
+    python benchmarks/load_test.py --json results.json   # keep for comparison
+"""
+
+import argparse
+import asyncio
+import contextvars
+import json
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+import uuid
+from collections import defaultdict
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import httpx
+
+# Add backend directory to path
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from benchmarks.fakes import FakeServer, create_fake_calcom_app, create_fake_groq_app
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+# Answer pools per qualification question; a mix of replies the rule-based
+# extractor parses and free-form ones that need the LLM
+ANSWERS = [
+    ["I'm 58", "62 years old", "in my early fifties", "I'd rather talk about that later"],
+    ["retiring in 4 years", "already retired", "hoping for 2032", "whenever I can afford it"],
+    ["Texas", "We live in North Carolina", "FL", "out west"],
+    ["about $600k in my 401k", "around 250,000", "1.2 million", "enough I think"],
+    ["no annuity", "yes", "not sure", "my wife handles that"],
+    ["running out of money", "taxes", "market crashes", "all of it honestly"],
+    ["travel", "support my grandkids", "keep my lifestyle", "not sure yet"],
+]
+
+OPENERS = [
+    "Hi, I'm starting to think about retirement",
+    "What are annuities?",
+    "Tell me about your seminars",
+]
+
+# Counter for the request currently being driven (propagates into the app)
+_query_counter: contextvars.ContextVar = contextvars.ContextVar("query_counter")
+
+
+def percentile(samples, pct: float) -> float:
+    """Nearest-rank percentile of a list of samples."""
+    ordered = sorted(samples)
+    index = max(0, min(len(ordered) - 1, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def rss_bytes() -> int:
+    """Peak resident set size of this process (0 if unavailable)."""
+    if resource is None:
+        return 0
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+class LoadTest:
+    """Runs virtual users against the app and collects per-endpoint stats."""
+
+    def __init__(self, client: httpx.AsyncClient, seed: int):
+        self.client = client
+        self.random = random.Random(seed)
+        self.latencies = defaultdict(list)
+        self.queries = defaultdict(list)
+        self.errors = defaultdict(int)
+
+    async def call(self, label: str, method: str, url: str, **kwargs) -> dict:
+        """Issue one request, recording latency, DB queries and failures."""
+        counter = [0]
+        token = _query_counter.set(counter)
+        start = time.perf_counter()
+        try:
+            response = await self.client.request(method, url, **kwargs)
+        finally:
+            _query_counter.reset(token)
+
+        self.latencies[label].append(time.perf_counter() - start)
+        self.queries[label].append(counter[0])
+        if response.status_code >= 400:
+            self.errors[label] += 1
+            return {}
+
+        if response.headers.get("content-type", "").startswith("text/event-stream"):
+            return {"events": response.text.count("event: ")}
+        return response.json()
+
+    async def conversation(self, user: int) -> None:
+        """One visitor from landing page to booked appointment."""
+        session_id = str(uuid.uuid4())
+        email = f"loadtest-{user}-{session_id[:8]}@example.com"
+
+        await self.call("GET /api/seminars/upcoming", "GET", "/api/seminars/upcoming")
+
+        await self.call(
+            "POST /api/chat/stream",
+            "POST",
+            "/api/chat/stream",
+            json={
+                "message": self.random.choice(OPENERS),
+                "session_id": session_id,
+                "context": {"page": "home"},
+            },
+        )
+
+        for pool in ANSWERS:
+            await self.call(
+                "POST /api/chat",
+                "POST",
+                "/api/chat",
+                json={
+                    "message": self.random.choice(pool),
+                    "session_id": session_id,
+                    "user_email": email,
+                    "user_name": f"Load Test {user}",
+                },
+            )
+
+        await self.call(
+            "GET /api/chat/summary/{id}", "GET", f"/api/chat/summary/{session_id}"
+        )
+
+        start_time = datetime.utcnow() + timedelta(days=self.random.randint(1, 14))
+        await self.call(
+            "POST /api/appointments/book",
+            "POST",
+            "/api/appointments/book",
+            json={
+                "session_id": session_id,
+                "name": f"Load Test {user}",
+                "email": email,
+                "phone": "555-0100",
+                "start_time": start_time.isoformat(),
+            },
+        )
+
+        await self.call(
+            "GET /api/chat/history/{id}", "GET", f"/api/chat/history/{session_id}"
+        )
+
+    async def run(self, users: int, concurrency: int, first_user: int = 0) -> None:
+        """Run `users` conversations with at most `concurrency` in flight."""
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def bounded(user: int):
+            async with semaphore:
+                await self.conversation(user)
+
+        await asyncio.gather(*(bounded(first_user + i) for i in range(users)))
+
+    def reset(self) -> None:
+        """Discard samples (used after warm-up)."""
+        self.latencies.clear()
+        self.queries.clear()
+        self.errors.clear()
+
+
+async def main(args) -> dict:
+    """Start the app, warm up, run the load and collect results."""
+    from sqlalchemy import event
+
+    from core.database import async_engine, engine
+    from main import app
+
+    @event.listens_for(engine, "before_cursor_execute")
+    @event.listens_for(async_engine.sync_engine, "before_cursor_execute")
+    def count_query(conn, cursor, statement, parameters, context, executemany):
+        counter = _query_counter.get(None)
+        if counter is not None:
+            counter[0] += 1
+
+    transport = httpx.ASGITransport(app=app)
+    async with app.router.lifespan_context(app):
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://loadtest", timeout=60
+        ) as client:
+            load = LoadTest(client, args.seed)
+
+            # Warm-up: imports, prompt compilation, caches, connection pools
+            await load.run(args.warmup, args.concurrency, first_user=-args.warmup)
+            load.reset()
+
+            if args.tracemalloc:
+                tracemalloc.start()
+            rss_before = rss_bytes()
+            traced_before = tracemalloc.get_traced_memory()[0]
+
+            start = time.perf_counter()
+            await load.run(args.users, args.concurrency)
+            elapsed = time.perf_counter() - start
+
+            traced_after, traced_peak = tracemalloc.get_traced_memory()
+            top_allocations = []
+            if args.tracemalloc:
+                snapshot = tracemalloc.take_snapshot()
+                top_allocations = [
+                    str(stat) for stat in snapshot.statistics("lineno")[:5]
+                ]
+                tracemalloc.stop()
+
+    chat_turns = len(load.queries["POST /api/chat"]) + len(
+        load.queries["POST /api/chat/stream"]
+    )
+    chat_queries = sum(load.queries["POST /api/chat"]) + sum(
+        load.queries["POST /api/chat/stream"]
+    )
+    total_requests = sum(len(samples) for samples in load.latencies.values())
+
+    return {
+        "users": args.users,
+        "concurrency": args.concurrency,
+        "upstream_latency_ms": args.latency * 1000,
+        "elapsed_s": round(elapsed, 2),
+        "requests": total_requests,
+        "throughput_rps": round(total_requests / elapsed, 1),
+        "conversations_per_s": round(args.users / elapsed, 2),
+        "db_queries_per_chat_turn": round(chat_queries / chat_turns, 1)
+        if chat_turns
+        else 0,
+        "endpoints": {
+            label: {
+                "count": len(samples),
+                "errors": load.errors[label],
+                "p50_ms": round(percentile(samples, 50) * 1000, 1),
+                "p95_ms": round(percentile(samples, 95) * 1000, 1),
+                "p99_ms": round(percentile(samples, 99) * 1000, 1),
+                "mean_ms": round(statistics.mean(samples) * 1000, 1),
+                "db_queries_mean": round(statistics.mean(load.queries[label]), 1),
+            }
+            for label, samples in sorted(load.latencies.items())
+        },
+        "memory": {
+            "peak_rss_growth_mb": round((rss_bytes() - rss_before) / 2**20, 1),
+            "traced_growth_mb": round((traced_after - traced_before) / 2**20, 2)
+            if args.tracemalloc
+            else None,
+            "traced_peak_mb": round(traced_peak / 2**20, 2) if args.tracemalloc else None,
+            "top_allocations": top_allocations,
+        },
+    }
+
+
+def report(results: dict) -> None:
+    """Print a human-readable summary."""
+    print(f"\nConversations: {results['users']} ({results['concurrency']} concurrent)")
+    print(f"Elapsed:       {results['elapsed_s']} s")
+    print(
+        f"Throughput:    {results['throughput_rps']} req/s, "
+        f"{results['conversations_per_s']} conversations/s"
+    )
+    print(f"DB queries per chat turn: {results['db_queries_per_chat_turn']}")
+    print(
+        f"Upstream calls: {results['upstream_calls']['groq']} Groq, "
+        f"{results['upstream_calls']['calcom']} Cal.com\n"
+    )
+
+    print(
+        f"{'endpoint':<30} {'count':>6} {'err':>4} {'p50 ms':>8} {'p95 ms':>8} "
+        f"{'p99 ms':>8} {'queries':>8}"
+    )
+    for label, stats in results["endpoints"].items():
+        print(
+            f"{label:<30} {stats['count']:>6} {stats['errors']:>4} "
+            f"{stats['p50_ms']:>8.1f} {stats['p95_ms']:>8.1f} {stats['p99_ms']:>8.1f} "
+            f"{stats['db_queries_mean']:>8.1f}"
+        )
+
+    memory = results["memory"]
+    print(f"\nPeak RSS growth: {memory['peak_rss_growth_mb']} MB")
+    if memory["traced_growth_mb"] is not None:
+        print(
+            f"Traced heap growth: {memory['traced_growth_mb']} MB "
+            f"(peak {memory['traced_peak_mb']} MB)"
+        )
+        for line in memory["top_allocations"]:
+            print(f"  {line}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--users", type=int, default=50, help="Conversations to run")
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--warmup", type=int, default=2)
+    parser.add_argument(
+        "--latency", type=float, default=0.3, help="Fake Groq latency (s)"
+    )
+    parser.add_argument("--tokens", type=int, default=40, help="Words per reply")
+    parser.add_argument(
+        "--calcom-latency", type=float, default=0.2, help="Fake Cal.com latency (s)"
+    )
+    parser.add_argument("--groq-port", type=int, default=8771)
+    parser.add_argument("--calcom-port", type=int, default=8772)
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument(
+        "--tracemalloc",
+        action="store_true",
+        help="Trace heap allocations (slower; skews latency)",
+    )
+    parser.add_argument("--json", help="Also write results to this file")
+    args = parser.parse_args()
+
+    groq_app = create_fake_groq_app(latency=args.latency, completion_tokens=args.tokens)
+    calcom_app = create_fake_calcom_app(latency=args.calcom_latency)
+
+    with FakeServer(groq_app, args.groq_port) as groq, FakeServer(
+        calcom_app, args.calcom_port
+    ) as calcom:
+        db_path = os.path.join(tempfile.mkdtemp(), "load_test.db")
+        os.environ.update(
+            GROQ_BASE_URL=groq.url,
+            GROQ_API_KEY=os.environ.get("GROQ_API_KEY", "benchmark-key"),
+            CALCOM_API_URL=calcom.url,
+            CALCOM_API_KEY="benchmark-key",
+            CALCOM_EVENT_TYPE_ID="1",
+            CALCOM_USERNAME="loadtest",
+            DATABASE_URL=f"sqlite:///{db_path}",
+            DEBUG="false",
+        )
+
+        print("=" * 60)
+        print(" END-TO-END LOAD TEST")
+        print("=" * 60)
+        print(
+            f"Fake Groq: {args.latency * 1000:.0f} ms, {args.tokens} words/reply   "
+            f"Fake Cal.com: {args.calcom_latency * 1000:.0f} ms"
+        )
+
+        results = asyncio.run(main(args))
+        results["upstream_calls"] = {
+            "groq": groq_app.state.calls,
+            "calcom": calcom_app.state.calls,
+        }
+        report(results)
+
+        if args.json:
+            Path(args.json).write_text(json.dumps(results, indent=2))
+            print(f"\nResults written to {args.json}")
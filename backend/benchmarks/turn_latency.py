@@ -0,0 +1,110 @@
+"""
+Chat Turn Latency Benchmark
+Measures end-to-end ProVisionChatbot.process_message latency (p50/p95) with
+qualification extraction run sequentially vs. concurrently with response
+generation.
+
+Usage (from backend/):
+    python benchmarks/turn_latency.py --mode both --turns 28 --latency 0.3
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import tempfile
+import time
+import uuid
+from pathlib import Path
+
+# Add backend directory to path
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from benchmarks.fakes import FakeServer, create_fake_groq_app
+
+
+def percentile(samples, pct: float) -> float:
+    """Nearest-rank percentile of a list of samples."""
+    ordered = sorted(samples)
+    index = max(0, min(len(ordered) - 1, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+async def measure(concurrent: bool, turns: int) -> list:
+    """Run `turns` qualification turns and return per-turn latencies."""
+    from core.config import settings
+    from core.database import SessionLocal
+    from utils.chatbot import ProVisionChatbot
+    from services.container import ServiceContainer
+
+    settings.CONCURRENT_QUALIFICATION_EXTRACTION = concurrent
+    services = ServiceContainer()
+    db = SessionLocal()
+    chatbot = ProVisionChatbot(db, services)
+
+    latencies = []
+    session_id = None
+    for i in range(turns):
+        # A fresh conversation every 7 turns keeps every turn in the flow
+        if i % 7 == 0:
+            session_id = str(uuid.uuid4())
+
+        start = time.perf_counter()
+        await chatbot.process_message(message=f"Answer {i}", session_id=session_id)
+        latencies.append(time.perf_counter() - start)
+
+    db.close()
+    await services.aclose()
+    return latencies
+
+
+def report(label: str, latencies: list) -> None:
+    print(
+        f"{label:<12} p50 {percentile(latencies, 50) * 1000:7.1f} ms   "
+        f"p95 {percentile(latencies, 95) * 1000:7.1f} ms   "
+        f"mean {statistics.mean(latencies) * 1000:7.1f} ms"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--mode", choices=["sequential", "concurrent", "both"], default="both"
+    )
+    parser.add_argument("--turns", type=int, default=28)
+    parser.add_argument("--latency", type=float, default=0.3)
+    parser.add_argument("--port", type=int, default=8767)
+    args = parser.parse_args()
+
+    with FakeServer(create_fake_groq_app(latency=args.latency), args.port) as server:
+        db_path = os.path.join(tempfile.mkdtemp(), "turn_latency.db")
+        os.environ.update(
+            GROQ_BASE_URL=server.url,
+            GROQ_API_KEY=os.environ.get("GROQ_API_KEY", "benchmark-key"),
+            DATABASE_URL=f"sqlite:///{db_path}",
+            DEBUG="false",
+        )
+
+        from core.database import init_db
+
+        init_db()
+
+        print("=" * 60)
+        print(" CHAT TURN LATENCY BENCHMARK")
+        print("=" * 60)
+        print(f"Turns per mode: {args.turns}")
+        print(f"Upstream latency: {args.latency * 1000:.0f} ms per LLM call\n")
+
+        results = {}
+        modes = ["sequential", "concurrent"] if args.mode == "both" else [args.mode]
+        for mode in modes:
+            results[mode] = asyncio.run(measure(mode == "concurrent", args.turns))
+            report(mode, results[mode])
+
+        if len(results) == 2:
+            speedup = percentile(results["sequential"], 50) / percentile(
+                results["concurrent"], 50
+            )
+            print(f"\np50 improvement: {speedup:.2f}x")
@@ -22,6 +22,7 @@ class Settings(BaseSettings):
     # Groq AI Configuration
     GROQ_API_KEY: str = ""
     GROQ_MODEL: str = "llama-3.1-70b-versatile"
+    GROQ_BASE_URL: str = ""  # Empty = Groq SDK default (https://api.groq.com)
 
     # Cal.com Configuration
     CALCOM_API_KEY: str = ""
@@ -38,6 +39,26 @@ class Settings(BaseSettings):
 
     # Database Configuration
     DATABASE_URL: str = "sqlite:///./provision_brokerage.db"
+    # Async engine for async routes; empty = DATABASE_URL with its async
+    # driver (sqlite -> sqlite+aiosqlite, postgresql -> postgresql+asyncpg)
+    ASYNC_DATABASE_URL: str = ""
+    # Connection pool, per engine (not used for in-memory SQLite). A sync
+    # checkout that waits holds a threadpool worker, so keep the timeout short.
+    DB_POOL_SIZE: int = 5  # Connections kept open
+    DB_MAX_OVERFLOW: int = 10  # Extra connections opened under load
+    DB_POOL_TIMEOUT: float = 10.0  # Seconds to wait for a free connection
+    DB_POOL_RECYCLE: int = 1800  # Replace connections older than this (-1 = never)
+    DB_POOL_PRE_PING: bool = True  # Test connections on checkout (drops stale ones)
+    # SQLite runs in WAL mode (readers and writers don't block each other)
+    SQLITE_SYNCHRONOUS: str = "NORMAL"  # fsync at checkpoints only; safe in WAL mode
+    SQLITE_BUSY_TIMEOUT_MS: int = 5000  # How long a writer waits for the lock
+    # Lead stats from the maintained lead_status_counts table (a few rows)
+    # instead of a GROUP BY over all leads
+    LEAD_STATUS_COUNTERS: bool = True
+    # Lead search: minimum word similarity (0-1) for a close spelling to match
+    LEAD_SEARCH_FUZZY_THRESHOLD: float = 0.4
+    # Bulk lead import: rows per INSERT ... ON CONFLICT batch (one commit each)
+    LEAD_IMPORT_BATCH_SIZE: int = 2000
 
     # Application Configuration
     DEBUG: bool = True
@@ -54,8 +75,50 @@ class Settings(BaseSettings):
 
     # AI Configuration
     MAX_CONVERSATION_HISTORY: int = 20
+    # Rolling summary: the last SUMMARY_WINDOW_MESSAGES are sent verbatim; once
+    # SUMMARY_BATCH_MESSAGES more pile up, older ones are folded into the summary
+    SUMMARY_WINDOW_MESSAGES: int = 8
+    SUMMARY_BATCH_MESSAGES: int = 6
+    SUMMARY_MAX_TOKENS: int = 250
+    PROMPT_TOKEN_BUDGET: int = 6000  # Estimated prompt tokens per request; oldest history trimmed first
+    # Knowledge chunks retrieved per message (BM25) and their share of the prompt
+    RAG_TOP_K: int = 3
+    RAG_MIN_SCORE: float = 1.5
+    RAG_TOKEN_BUDGET: int = 300
+    # A chat turn that loses an optimistic-concurrency race on its conversation
+    # is re-applied on fresh state up to this many times
+    CONVERSATION_WRITE_RETRIES: int = 2
+    # Answer clear FAQ questions from the knowledge base without an LLM call
+    # (cosine similarity of character n-gram TF-IDF vectors)
+    INTENT_ROUTER_ENABLED: bool = True
+    FAQ_MATCH_THRESHOLD: float = 0.45
+    FAQ_MATCH_MARGIN: float = 0.1
+    # Deadlines: each chat turn has an end-to-end budget; every Groq call gets
+    # what is left of it, capped per call, and is skipped if too little is left
+    REQUEST_BUDGET_SECONDS: float = 12.0
+    GROQ_CALL_TIMEOUT_SECONDS: float = 10.0
+    GROQ_MIN_CALL_SECONDS: float = 0.5
+    GROQ_MAX_RETRIES: int = 1  # SDK retries, still within the call timeout
+    # Circuit breaker: opens after consecutive failures (errors, timeouts or
+    # calls slower than CIRCUIT_SLOW_CALL_SECONDS); while open, replies come
+    # from cached answers and the knowledge base
+    CIRCUIT_FAILURE_THRESHOLD: int = 5
+    CIRCUIT_SLOW_CALL_SECONDS: float = 6.0
+    CIRCUIT_RESET_SECONDS: float = 30.0
     AI_TEMPERATURE: float = 0.7
     AI_MAX_TOKENS: int = 300  # Reduced from 1000 to enforce shorter, punchier responses
+    # Overlap qualification extraction with response generation (False = sequential)
+    CONCURRENT_QUALIFICATION_EXTRACTION: bool = True
+    # Parse obvious qualification answers with rules before calling the LLM
+    RULE_BASED_QUALIFICATION: bool = True
+    # Upcoming-seminar snapshot in chat context; also invalidated on seminar writes
+    SEMINAR_CACHE_TTL_SECONDS: int = 60
+    # Opening-turn reply cache (page + normalized message); 0 entries disables it
+    RESPONSE_CACHE_MAX_ENTRIES: int = 512
+    RESPONSE_CACHE_TTL_SECONDS: int = 900
+    RESPONSE_CACHE_MAX_MESSAGE_CHARS: int = 200
+    # Identical non-streaming Groq requests in flight at once share one call
+    SINGLE_FLIGHT_ENABLED: bool = True
 
     # Qualification Configuration
     QUALIFICATION_QUESTIONS_COUNT: int = 7
@@ -2,10 +2,53 @@
 Database configuration and session management
 """
 
-from sqlalchemy import create_engine
+from pathlib import Path
+from typing import Any, AsyncIterator, Dict, Type, Union
+
+from sqlalchemy import create_engine, event, inspect
+from sqlalchemy.engine import URL, make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, Session
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
 from core.config import settings
+from core.pool import PoolMetrics, instrumented_pool
+
+# Checkout waits and saturation per engine, reported by pool_stats()
+sync_pool_metrics = PoolMetrics()
+async_pool_metrics = PoolMetrics()
+
+
+def _pool_options(
+    url: Union[str, URL], pool_class: Type[QueuePool], metrics: PoolMetrics
+) -> Dict[str, Any]:
+    """
+    Engine keyword arguments for the pool configured in settings.
+
+    In-memory SQLite keeps SQLAlchemy's default single-connection pool: each
+    new connection would be a new, empty database.
+
+    Args:
+        url: Database URL
+        pool_class: QueuePool or AsyncAdaptedQueuePool
+        metrics: Where the pool records checkouts
+
+    Returns:
+        Keyword arguments for create_engine / create_async_engine
+    """
+    url = make_url(url)
+    if url.get_backend_name() == "sqlite" and url.database in (None, "", ":memory:"):
+        return {}
+
+    return {
+        "poolclass": instrumented_pool(pool_class, metrics),
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+    }
+
 
 # Create database engine
 engine = create_engine(
@@ -14,11 +57,90 @@ engine = create_engine(
     if "sqlite" in settings.DATABASE_URL
     else {},
     echo=settings.DEBUG,
+    **_pool_options(settings.DATABASE_URL, QueuePool, sync_pool_metrics),
 )
 
 # Create session factory
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+
+def async_database_url(url: str) -> URL:
+    """
+    The same database through an async driver: aiosqlite for SQLite, asyncpg
+    for PostgreSQL. Other URLs are returned unchanged.
+
+    Args:
+        url: Synchronous database URL (e.g. DATABASE_URL)
+
+    Returns:
+        URL for create_async_engine
+    """
+    url = make_url(url)
+    backend = url.get_backend_name()
+
+    if backend == "sqlite":
+        return url.set(drivername="sqlite+aiosqlite")
+
+    if backend in ("postgresql", "postgres"):
+        # asyncpg takes ssl=..., not libpq's sslmode=...
+        query = dict(url.query)
+        if "sslmode" in query:
+            query["ssl"] = query.pop("sslmode")
+        return url.set(drivername="postgresql+asyncpg", query=query)
+
+    return url
+
+
+# Async engine for routes that await their queries; same database, async driver
+_async_url = settings.ASYNC_DATABASE_URL or async_database_url(settings.DATABASE_URL)
+async_engine = create_async_engine(
+    _async_url,
+    echo=settings.DEBUG,
+    **_pool_options(_async_url, AsyncAdaptedQueuePool, async_pool_metrics),
+)
+
+# Objects stay readable after commit without a lazy (blocking) reload
+AsyncSessionLocal = async_sessionmaker(
+    async_engine, autoflush=False, expire_on_commit=False
+)
+
+
+def _sqlite_pragmas(dbapi_connection, connection_record):
+    """
+    Configure each new SQLite connection.
+
+    WAL mode lets readers and a writer work at the same time, so chat
+    writes no longer wait on concurrent reads. busy_timeout makes a writer
+    wait for another writer's lock instead of failing at once with
+    "database is locked".
+    """
+    cursor = dbapi_connection.cursor()
+    cursor.execute(f"PRAGMA busy_timeout={int(settings.SQLITE_BUSY_TIMEOUT_MS)}")
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute(f"PRAGMA synchronous={settings.SQLITE_SYNCHRONOUS}")
+    cursor.close()
+
+
+for _engine in (engine, async_engine.sync_engine):
+    if _engine.dialect.name == "sqlite":
+        event.listen(_engine, "connect", _sqlite_pragmas)
+
+
+def pool_stats() -> Dict[str, Any]:
+    """
+    Connection pool usage for both engines.
+
+    Returns:
+        {"sync": {...}, "async": {...}}; see PoolMetrics.stats
+    """
+    return {
+        name: metrics.stats(pool) if isinstance(pool, QueuePool) else {}
+        for name, metrics, pool in (
+            ("sync", sync_pool_metrics, engine.pool),
+            ("async", async_pool_metrics, async_engine.sync_engine.pool),
+        )
+    }
+
 # Create base class for models
 Base = declarative_base()
 
@@ -35,11 +157,65 @@ def get_db() -> Session:
         db.close()
 
 
+async def get_async_db() -> AsyncIterator[AsyncSession]:
+    """
+    Dependency function to get an async database session
+    Usage: db: AsyncSession = Depends(get_async_db)
+    """
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
+class AsyncSessionService:
+    """
+    Base for AsyncSession versions of the synchronous services.
+
+    Subclasses set `service_class`; _run calls one of its methods through
+    AsyncSession.run_sync, so the same query code runs on the async driver
+    and the event loop serves other requests while the database works.
+    """
+
+    service_class: Any = None
+
+    def __init__(self, db: AsyncSession):
+        """
+        Args:
+            db: Async database session
+        """
+        self.db = db
+
+    async def _run(self, method: str, *args, **kwargs) -> Any:
+        """Call a method of the synchronous service on this session"""
+
+        def call(session: Session) -> Any:
+            return getattr(self.service_class(session), method)(*args, **kwargs)
+
+        return await self.db.run_sync(call)
+
+
 def init_db():
-    """Initialize database - create all tables"""
-    from models import lead, conversation, appointment, seminar, seminar_registration
+    """
+    Initialize database - apply Alembic migrations up to head.
+
+    Databases created with create_all before migrations existed are stamped
+    at the baseline revision first, so only newer migrations run on them.
+    """
+    from alembic import command
+    from alembic.config import Config
+
+    backend_dir = Path(__file__).resolve().parent.parent
+    alembic_cfg = Config(str(backend_dir / "alembic.ini"))
+    alembic_cfg.set_main_option("script_location", str(backend_dir / "migrations"))
+
+    with engine.begin() as connection:
+        alembic_cfg.attributes["connection"] = connection
+        tables = inspect(connection).get_table_names()
+
+        if "alembic_version" not in tables and "leads" in tables:
+            command.stamp(alembic_cfg, "0001")
+
+        command.upgrade(alembic_cfg, "head")
 
-    Base.metadata.create_all(bind=engine)
     print(" Database initialized successfully!")
 
 
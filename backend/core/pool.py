@@ -0,0 +1,153 @@
+"""
+Connection pool instrumentation
+QueuePool subclasses that time every connection checkout, so waits for a
+free connection and pool saturation show up in the admin metrics.
+"""
+
+import threading
+import time
+from collections import deque
+from typing import Any, Dict, Type
+
+from sqlalchemy import exc
+from sqlalchemy.pool import QueuePool
+
+# Checkouts slower than this waited for a connection (or had to open one)
+SLOW_CHECKOUT_SECONDS = 0.01
+
+
+class PoolMetrics:
+    """Checkout wait times and peak usage for one engine's pool"""
+
+    def __init__(self, sample_size: int = 1000):
+        """
+        Args:
+            sample_size: Recent checkouts kept for the p95 wait
+        """
+        self._waits = deque(maxlen=sample_size)
+        self._lock = threading.Lock()
+        self.checkouts = 0
+        self.slow_checkouts = 0
+        self.timeouts = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+        self.peak_checked_out = 0
+
+    def record_checkout(self, wait: float, checked_out: int) -> None:
+        """Record a successful checkout and the connections now in use"""
+        with self._lock:
+            self.checkouts += 1
+            self.total_wait += wait
+            self.max_wait = max(self.max_wait, wait)
+            self.peak_checked_out = max(self.peak_checked_out, checked_out)
+            if wait >= SLOW_CHECKOUT_SECONDS:
+                self.slow_checkouts += 1
+            self._waits.append(wait)
+
+    def record_timeout(self) -> None:
+        """Record a checkout that gave up after the pool timeout"""
+        with self._lock:
+            self.timeouts += 1
+
+    def stats(self, pool: QueuePool) -> Dict[str, Any]:
+        """
+        Report pool usage.
+
+        Saturation is connections in use over the most the pool will open
+        (pool_size + max_overflow); at 1.0 further checkouts wait.
+
+        Args:
+            pool: The pool these metrics were recorded for
+
+        Returns:
+            Dictionary with pool state, saturation and checkout waits
+        """
+        capacity = pool.size() + max(pool._max_overflow, 0)
+        checked_out = pool.checkedout()
+        with self._lock:
+            waits = sorted(self._waits)
+            return {
+                "pool_size": pool.size(),
+                "max_overflow": pool._max_overflow,
+                "checked_out": checked_out,
+                "saturation": round(checked_out / capacity, 3) if capacity else 0.0,
+                "peak_saturation": round(self.peak_checked_out / capacity, 3)
+                if capacity
+                else 0.0,
+                "checkouts": self.checkouts,
+                "slow_checkouts": self.slow_checkouts,
+                "timeouts": self.timeouts,
+                "wait_ms_mean": round(self.total_wait / self.checkouts * 1000, 2)
+                if self.checkouts
+                else 0.0,
+                "wait_ms_p95": round(waits[int(0.95 * (len(waits) - 1))] * 1000, 2)
+                if waits
+                else 0.0,
+                "wait_ms_max": round(self.max_wait * 1000, 2),
+            }
+
+
+def instrumented_pool(pool_class: Type[QueuePool], metrics: PoolMetrics) -> Type[QueuePool]:
+    """
+    Subclass a QueuePool so every checkout is timed into `metrics`.
+
+    The metrics live on the class rather than the pool, so they carry over
+    when the engine replaces its pool (dispose() / recreate()).
+
+    Args:
+        pool_class: QueuePool or AsyncAdaptedQueuePool
+        metrics: Where checkouts are recorded
+
+    Returns:
+        Pool class to pass as create_engine(poolclass=...)
+    """
+
+    class InstrumentedPool(pool_class):
+        def _do_get(self):
+            start = time.perf_counter()
+            try:
+                record = super()._do_get()
+            except exc.TimeoutError:
+                metrics.record_timeout()
+                raise
+            metrics.record_checkout(time.perf_counter() - start, self.checkedout())
+            return record
+
+    InstrumentedPool.__name__ = InstrumentedPool.__qualname__ = (
+        f"Instrumented{pool_class.__name__}"
+    )
+    return InstrumentedPool
+
+
+if __name__ == "__main__":
+    from concurrent.futures import ThreadPoolExecutor
+
+    from sqlalchemy import create_engine, text
+
+    print("Connection pool instrumentation")
+    print("=" * 60)
+
+    metrics = PoolMetrics()
+    demo_engine = create_engine(
+        "sqlite:///file:pooldemo?mode=memory&cache=shared&uri=true",
+        poolclass=instrumented_pool(QueuePool, metrics),
+        pool_size=2,
+        max_overflow=1,
+        pool_timeout=0.35,
+        connect_args={"check_same_thread": False},
+    )
+
+    def hold(seconds: float) -> str:
+        try:
+            with demo_engine.connect() as connection:
+                connection.execute(text("SELECT 1"))
+                time.sleep(seconds)
+            return "ok"
+        except exc.TimeoutError:
+            return "timed out"
+
+    # 5 workers on 3 connections: two wait, and one of them gives up
+    with ThreadPoolExecutor(max_workers=5) as executor:
+        results = list(executor.map(hold, [0.3, 0.8, 0.8, 0.1, 0.1]))
+    print(f"   results: {results}")
+    print(f"   {metrics.stats(demo_engine.pool)}")
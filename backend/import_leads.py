@@ -0,0 +1,59 @@
+"""
+Bulk lead import - Load leads from CSV or JSON Lines files
+
+Usage (from backend/):
+    python import_leads.py seminar_2026_10.csv --source seminar
+    python import_leads.py facebook.jsonl partners.csv
+    cat leads.jsonl | python import_leads.py - --format jsonl
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+# Add backend directory to path
+backend_dir = Path(__file__).parent
+sys.path.insert(0, str(backend_dir))
+
+from core.database import SessionLocal, init_db
+from services.lead_import import LeadImporter, import_format
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Import leads from CSV / JSON Lines files")
+    parser.add_argument("files", nargs="+", help="Files to import ('-' for stdin)")
+    parser.add_argument("--format", choices=["csv", "jsonl"], help="Default: from extension")
+    parser.add_argument("--source", default="import", help="Source for rows without one")
+    parser.add_argument("--batch-size", type=int, help="Rows per upsert batch")
+    args = parser.parse_args()
+
+    init_db()
+    db = SessionLocal()
+    importer = LeadImporter(db, default_source=args.source, batch_size=args.batch_size)
+    failed = False
+
+    try:
+        for name in args.files:
+            try:
+                file_format = import_format(args.format, filename=name)
+                if name == "-":
+                    sys.stdin.reconfigure(encoding="utf-8-sig", newline="")
+                    summary = importer.import_stream(sys.stdin, file_format)
+                else:
+                    with open(name, encoding="utf-8-sig", newline="") as stream:
+                        summary = importer.import_stream(stream, file_format)
+            except (OSError, ValueError) as e:
+                print(f"{name}: {e}", file=sys.stderr)
+                failed = True
+                continue
+
+            print(f"{name}: {json.dumps(summary, indent=2)}")
+    finally:
+        db.close()
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
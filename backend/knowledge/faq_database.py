@@ -171,28 +171,42 @@ FAQ_DATABASE = {
             "question": "How do you get paid?",
             "answer": "We're compensated through commissions from insurance companies when you purchase products, or through advisory fees for planning services. All compensation is disclosed in writing before you make any decisions. There's never a fee for initial consultations.",
             "category": "Compensation",
-            "keywords": ["fees", "paid", "compensation", "commissions"],
+            "keywords": ["fees", "paid", "compensation", "commissions", "charge", "cost"],
         },
     ],
 }
 
 
-def search_faq(query):
-    """Search FAQ database for relevant questions"""
-    query_lower = query.lower()
-    results = []
+def search_faq(query, limit=5, min_similarity=0.35):
+    """
+    Search FAQ database for relevant questions
 
-    for category, faqs in FAQ_DATABASE.items():
-        for faq in faqs:
-            # Check if query matches question, answer, or keywords
-            if (
-                query_lower in faq["question"].lower()
-                or query_lower in faq["answer"].lower()
-                or any(keyword in query_lower for keyword in faq["keywords"])
-            ):
-                results.append(faq)
-
-    return results
+    Close paraphrases of a question (character n-gram similarity) come
+    first, followed by BM25 keyword matches over question, keywords and
+    answer.
+
+    Args:
+        query: Free-text query
+        limit: Maximum results
+        min_similarity: Minimum cosine similarity for a paraphrase match
+
+    Returns:
+        Matching FAQ entries, most relevant first
+    """
+    from knowledge.search_index import knowledge_index
+    from knowledge.semantic_matcher import semantic_matcher
+
+    results = [
+        document["payload"]
+        for _, document in semantic_matcher.match(
+            query, k=limit, source="faq", min_score=min_similarity
+        )
+    ]
+    for _, document in knowledge_index.search(query, k=limit, source="faq"):
+        if document["payload"] not in results:
+            results.append(document["payload"])
+
+    return results[:limit]
 
 
 def get_faq_by_category(category):
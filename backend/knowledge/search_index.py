@@ -0,0 +1,230 @@
+"""
+Knowledge Base Search Index
+Tokenized inverted index with BM25 ranking over the FAQ, retirement planning,
+annuity education and seminar topic knowledge. Built once at import.
+"""
+
+import heapq
+import math
+import re
+from collections import Counter, defaultdict
+
+from knowledge.faq_database import FAQ_DATABASE
+from knowledge.retirement_planning import RETIREMENT_PLANNING, ANNUITY_EDUCATION
+from knowledge.seminar_topics import SEMINAR_TOPICS
+
+# BM25 parameters (standard defaults)
+BM25_K1 = 1.5
+BM25_B = 0.75
+
+# Title and keyword tokens count this many times towards term frequency
+TITLE_WEIGHT = 3
+
+_TOKEN_PATTERN = re.compile(r"[a-z0-9]+(?:\([a-z]\))?")
+
+STOPWORDS = frozenset(
+    """a about an and are as at be but by can do does for from had has have how i
+    if in into is it its me my of on or our so than that the their them then there
+    these they this to was we what when where which who why will with you your
+    much many just really tell know yes no ok okay sure thanks thank hi hello hey
+    please m s t d ll re ve""".split()
+)
+
+
+def _stem(token: str) -> str:
+    """Light suffix stripping so plurals and simple verb forms match"""
+    if len(token) > 4 and token.endswith("ies"):
+        return token[:-3] + "y"
+    if len(token) > 3 and token.endswith("s") and not token.endswith(("ss", "us", "is")):
+        return token[:-1]
+    return token
+
+
+def tokenize(text: str) -> list:
+    """
+    Split text into normalized search terms
+
+    "401(k)" and "401k" both become "401k"; stopwords are dropped.
+    """
+    terms = []
+    for token in _TOKEN_PATTERN.findall(text.lower()):
+        token = token.replace("(", "").replace(")", "")
+        if token not in STOPWORDS:
+            terms.append(_stem(token))
+    return terms
+
+
+def _flatten(value) -> str:
+    """Join all strings in a nested dict/list structure"""
+    if isinstance(value, dict):
+        return " ".join(_flatten(item) for item in value.values())
+    if isinstance(value, (list, tuple)):
+        return " ".join(_flatten(item) for item in value)
+    return str(value)
+
+
+def _humanize(key: str) -> str:
+    return key.replace("_", " ").strip().capitalize()
+
+
+class KnowledgeIndex:
+    """Inverted index over knowledge documents with BM25 scoring"""
+
+    def __init__(self, documents: list):
+        """
+        Args:
+            documents: Dicts with "source", "title", "text" and optional
+                "keywords" and "payload" (the original knowledge entry)
+        """
+        self.documents = documents
+        self.postings = defaultdict(list)  # term -> [(doc_id, term frequency)]
+        self.doc_lengths = []
+
+        for doc_id, document in enumerate(documents):
+            terms = (
+                tokenize(document["title"]) * TITLE_WEIGHT
+                + tokenize(" ".join(document.get("keywords", []))) * TITLE_WEIGHT
+                + tokenize(document["text"])
+            )
+            self.doc_lengths.append(len(terms))
+            for term, frequency in Counter(terms).items():
+                self.postings[term].append((doc_id, frequency))
+
+        count = len(documents)
+        self.avg_doc_length = sum(self.doc_lengths) / count if count else 0.0
+        self.idf = {
+            term: math.log(1 + (count - len(postings) + 0.5) / (len(postings) + 0.5))
+            for term, postings in self.postings.items()
+        }
+        # Length normalization is per document, so precompute it once
+        self._length_norm = [
+            BM25_K1 * (1 - BM25_B + BM25_B * length / self.avg_doc_length)
+            for length in self.doc_lengths
+        ]
+
+    def search(self, query: str, k: int = 5, source: str = None) -> list:
+        """
+        Rank documents for a query
+
+        Args:
+            query: Free-text query
+            k: Number of results
+            source: Optional source filter ("faq", "retirement_planning",
+                "annuity_education", "seminar_topics")
+
+        Returns:
+            Up to k (score, document) tuples, best first
+        """
+        scores = defaultdict(float)
+        for term in set(tokenize(query)):
+            idf = self.idf.get(term)
+            if idf is None:
+                continue
+            for doc_id, frequency in self.postings[term]:
+                scores[doc_id] += (
+                    idf
+                    * frequency
+                    * (BM25_K1 + 1)
+                    / (frequency + self._length_norm[doc_id])
+                )
+
+        if source:
+            scores = {
+                doc_id: score
+                for doc_id, score in scores.items()
+                if self.documents[doc_id]["source"] == source
+            }
+
+        best = heapq.nlargest(k, scores.items(), key=lambda item: item[1])
+        return [(score, self.documents[doc_id]) for doc_id, score in best]
+
+
+def build_documents() -> list:
+    """Collect searchable documents from every knowledge module"""
+    documents = []
+
+    for category, faqs in FAQ_DATABASE.items():
+        for faq in faqs:
+            documents.append(
+                {
+                    "source": "faq",
+                    "title": faq["question"],
+                    "text": faq["answer"],
+                    "keywords": faq.get("keywords", []),
+                    "category": category,
+                    "payload": faq,
+                }
+            )
+
+    # Nested sections become one document per entry (e.g. each annuity type)
+    for source, knowledge in (
+        ("retirement_planning", RETIREMENT_PLANNING),
+        ("annuity_education", ANNUITY_EDUCATION),
+    ):
+        for section, content in knowledge.items():
+            if isinstance(content, dict) and all(
+                isinstance(item, dict) for item in content.values()
+            ):
+                entries = [
+                    (f"{_humanize(section)}: {_humanize(key)}", item)
+                    for key, item in content.items()
+                ]
+            else:
+                entries = [(_humanize(section), content)]
+
+            for title, item in entries:
+                documents.append(
+                    {
+                        "source": source,
+                        "title": title,
+                        "text": _flatten(item),
+                        "category": section,
+                        "payload": item,
+                    }
+                )
+
+    for key, topic in SEMINAR_TOPICS.items():
+        documents.append(
+            {
+                "source": "seminar_topics",
+                "title": topic["title"],
+                "text": _flatten({k: v for k, v in topic.items() if k != "title"}),
+                "category": key,
+                "payload": topic,
+            }
+        )
+
+    return documents
+
+
+knowledge_index = KnowledgeIndex(build_documents())
+
+
+def search_knowledge(query: str, k: int = 5, source: str = None) -> list:
+    """
+    Ranked knowledge base search
+
+    Args:
+        query: Free-text query
+        k: Number of results
+        source: Optional source filter
+
+    Returns:
+        List of documents (with "score" added), best first
+    """
+    return [
+        {**document, "score": round(score, 3)}
+        for score, document in knowledge_index.search(query, k=k, source=source)
+    ]
+
+
+if __name__ == "__main__":
+    print("Knowledge Search Index")
+    print("=" * 60)
+    print(f"Documents: {len(knowledge_index.documents)}")
+    print(f"Terms: {len(knowledge_index.postings)}")
+
+    for query in ["what is an annuity", "how much do you charge", "social security timing"]:
+        print(f"\n{query!r}")
+        for result in search_knowledge(query, k=3):
+            print(f"   {result['score']:6.2f}  [{result['source']}] {result['title']}")
@@ -0,0 +1,126 @@
+"""
+Knowledge Semantic Matcher
+TF-IDF over character n-grams, so paraphrases and typos still match
+("what do you get paid" ~ "How do you get paid?"). The document matrix is
+precomputed at import; a query is scored against the whole corpus with a
+single NumPy matrix-vector product.
+"""
+
+import re
+from collections import Counter
+
+import numpy as np
+
+from knowledge.search_index import build_documents
+
+NGRAM_SIZES = (3, 4, 5)
+
+_NON_WORD = re.compile(r"[^a-z0-9$ ]+")
+
+
+def char_ngrams(text: str) -> Counter:
+    """Character n-gram counts of each padded word ("annuity" -> " an", "ann", ...)"""
+    words = _NON_WORD.sub(" ", text.lower()).split()
+    grams = Counter()
+    for word in words:
+        padded = f" {word} "
+        for size in NGRAM_SIZES:
+            for i in range(max(1, len(padded) - size + 1)):
+                grams[padded[i : i + size]] += 1
+    return grams
+
+
+class SemanticMatcher:
+    """Cosine similarity between a query and every document, TF-IDF weighted"""
+
+    def __init__(self, documents: list):
+        """
+        Args:
+            documents: Knowledge documents from search_index.build_documents;
+                each is matched on its title (the FAQ question) and keywords
+        """
+        self.documents = documents
+        doc_grams = [
+            char_ngrams(" ".join([document["title"], *document.get("keywords", [])]))
+            for document in documents
+        ]
+
+        self.vocabulary = {}
+        for grams in doc_grams:
+            for gram in grams:
+                self.vocabulary.setdefault(gram, len(self.vocabulary))
+
+        # Sublinear TF, smoothed IDF, rows L2-normalized
+        matrix = np.zeros((len(documents), len(self.vocabulary)), dtype=np.float32)
+        for row, grams in enumerate(doc_grams):
+            for gram, count in grams.items():
+                matrix[row, self.vocabulary[gram]] = 1 + np.log(count)
+
+        document_frequency = np.count_nonzero(matrix, axis=0)
+        self.idf = (np.log((1 + len(documents)) / (1 + document_frequency)) + 1).astype(
+            np.float32
+        )
+        matrix *= self.idf
+        matrix /= np.linalg.norm(matrix, axis=1, keepdims=True) + 1e-12
+        self.matrix = matrix
+
+        self.sources = np.array([document["source"] for document in documents])
+
+    def _query_vector(self, query: str) -> np.ndarray:
+        """TF-IDF vector of a query over the corpus vocabulary (unit length)"""
+        vector = np.zeros(len(self.vocabulary), dtype=np.float32)
+        for gram, count in char_ngrams(query).items():
+            index = self.vocabulary.get(gram)
+            if index is not None:
+                vector[index] = 1 + np.log(count)
+
+        vector *= self.idf
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+    def scores(self, query: str) -> np.ndarray:
+        """Cosine similarity of the query with every document"""
+        return self.matrix @ self._query_vector(query)
+
+    def match(self, query: str, k: int = 5, source: str = None, min_score: float = 0.0) -> list:
+        """
+        Most similar documents
+
+        Args:
+            query: Free-text query
+            k: Number of results
+            source: Optional source filter (e.g. "faq")
+            min_score: Minimum cosine similarity (0-1)
+
+        Returns:
+            Up to k (score, document) tuples, best first
+        """
+        scores = self.scores(query)
+        if source:
+            scores = np.where(self.sources == source, scores, -1.0)
+
+        k = min(k, len(scores))
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top])]
+        return [
+            (float(scores[index]), self.documents[index])
+            for index in top
+            if scores[index] >= min_score
+        ]
+
+
+semantic_matcher = SemanticMatcher(build_documents())
+
+
+if __name__ == "__main__":
+    print("Knowledge Semantic Matcher")
+    print("=" * 60)
+    print(
+        f"Matrix: {semantic_matcher.matrix.shape[0]} documents x "
+        f"{semantic_matcher.matrix.shape[1]} n-grams"
+    )
+
+    for query in ["what do you get paid", "waht is an anuity", "are the seminars recorded?"]:
+        print(f"\n{query!r}")
+        for score, document in semantic_matcher.match(query, k=3):
+            print(f"   {score:5.2f}  [{document['source']}] {document['title']}")
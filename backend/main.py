@@ -3,19 +3,30 @@ ProVision Brokerage - FastAPI Server
 Main REST API server with endpoints for chat, leads, appointments, and seminars.
 """
 
-from fastapi import FastAPI, HTTPException, Depends
+from fastapi import FastAPI, HTTPException, Depends, Query, Request
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel, EmailStr
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Iterator
 from datetime import datetime
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
+import json
+
+import anyio
 
 from core.config import settings
-from core.database import get_db, init_db, SessionLocal
+from core.database import get_async_db, get_db, init_db, async_engine, SessionLocal
 from utils.chatbot import ProVisionChatbot
-from services.lead_service import LeadService
-from services.seminar_service import SeminarService
-from services.conversation_service import ConversationService
+from services.container import ServiceContainer, get_services
+from services.lead_import import LeadImporter, import_format, text_stream
+from services.lead_service import AsyncLeadService
+from services.seminar_service import AsyncSeminarService
+from services.conversation_service import AsyncConversationService
+from models.appointment import Appointment
+from utils.pagination import InvalidCursorError, Keyset
 
 # Initialize FastAPI app
 app = FastAPI(
@@ -93,8 +104,9 @@ class SeminarRegistrationRequest(BaseModel):
 
 @app.on_event("startup")
 async def startup_event():
-    """Initialize database on startup."""
+    """Initialize database and shared services on startup."""
     init_db()
+    app.state.services = ServiceContainer()
     print(" Database initialized")
     print(f" Server running in {'DEBUG' if settings.DEBUG else 'PRODUCTION'} mode")
     print(f" CORS origins: {settings.cors_origins_list}")
@@ -118,6 +130,13 @@ async def startup_event():
         print(f" Error during seminar seeding: {str(e)}")
 
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Close pooled connections held by shared services and the async engine."""
+    await app.state.services.aclose()
+    await async_engine.dispose()
+
+
 # ============================================================================
 # Root & Health Check
 # ============================================================================
@@ -134,6 +153,7 @@ async def root():
         "health": "/health",
         "endpoints": {
             "chat": "POST /api/chat",
+            "chat_stream": "POST /api/chat/stream",
             "leads": "GET /api/leads",
             "appointments": "GET /api/appointments",
             "seminars": "GET /api/seminars",
@@ -207,6 +227,18 @@ async def check_database(db: Session = Depends(get_db)):
         raise HTTPException(status_code=500, detail=f"Error checking database: {str(e)}")
 
 
+@app.get("/api/admin/metrics")
+async def get_metrics(services: ServiceContainer = Depends(get_services)):
+    """
+    Admin endpoint with runtime metrics for this worker process.
+    Includes cached system prompt sizes and per-request prompt token usage.
+    """
+    return {
+        "generated_at": datetime.utcnow().isoformat(),
+        **services.metrics(),
+    }
+
+
 @app.post("/api/admin/seed-seminars")
 async def seed_seminars(db: Session = Depends(get_db)):
     """
@@ -322,7 +354,11 @@ async def seed_seminars(db: Session = Depends(get_db)):
 
 
 @app.post("/api/chat", response_model=ChatResponse)
-async def chat(request: ChatRequest, db: Session = Depends(get_db)):
+async def chat(
+    request: ChatRequest,
+    db: Session = Depends(get_db),
+    services: ServiceContainer = Depends(get_services),
+):
     """
     Main chat endpoint - processes user messages and returns AI responses.
 
@@ -334,8 +370,8 @@ async def chat(request: ChatRequest, db: Session = Depends(get_db)):
     - Offers appointment booking when qualified
     """
     try:
-        # Create chatbot instance
-        chatbot = ProVisionChatbot(db)
+        # Bind shared services to this request's session
+        chatbot = ProVisionChatbot(db, services)
 
         # Extract page context from request context if provided
         page_context = None
@@ -358,24 +394,81 @@ async def chat(request: ChatRequest, db: Session = Depends(get_db)):
         raise HTTPException(status_code=500, detail=f"Chat error: {str(e)}")
 
 
+@app.post("/api/chat/stream")
+async def chat_stream(
+    request: ChatRequest,
+    http_request: Request,
+    services: ServiceContainer = Depends(get_services),
+):
+    """
+    Streaming chat endpoint (Server-Sent Events).
+
+    Emits `token` events with text deltas as Groq generates them, then a
+    single `done` event carrying the ChatResponse metadata (progress, lead
+    score, next action, booking URL). The assistant message is saved once
+    the stream completes; if the client disconnects, the upstream Groq call
+    is cancelled and nothing further is saved.
+    """
+    page_context = None
+    if request.context and "page" in request.context:
+        page_context = request.context["page"]
+
+    def sse(event: str, data: Dict[str, Any]) -> str:
+        return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+    async def event_stream():
+        # The session must outlive the route function, so it is owned here
+        db = SessionLocal()
+        chatbot = ProVisionChatbot(db, services)
+        events = chatbot.stream_message(
+            message=request.message,
+            session_id=request.session_id,
+            channel=request.channel,
+            user_email=request.user_email,
+            user_name=request.user_name,
+            page_context=page_context,
+        )
+        try:
+            async for event, payload in events:
+                if await http_request.is_disconnected():
+                    break
+                if event == "token":
+                    yield sse("token", {"text": payload})
+                else:
+                    yield sse("done", ChatResponse(**payload).model_dump())
+        except Exception as e:
+            yield sse("error", {"detail": f"Chat error: {str(e)}"})
+        finally:
+            await events.aclose()
+            db.close()
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @app.get("/api/chat/history/{session_id}")
-async def get_chat_history(session_id: str, db: Session = Depends(get_db)):
+async def get_chat_history(session_id: str, db: AsyncSession = Depends(get_async_db)):
     """Get conversation history for a session."""
     try:
-        conversation_service = ConversationService(db)
-        conversation = conversation_service.get_conversation(session_id)
+        conversation_service = AsyncConversationService(db)
+        conversation = await conversation_service.get_conversation(session_id)
 
         if not conversation:
             raise HTTPException(status_code=404, detail="Conversation not found")
 
         return {
             "session_id": conversation.session_id,
-            "messages": conversation.messages,
+            "messages": await conversation_service.get_message_history(session_id),
             "qualification_progress": conversation.qualification_progress,
             "is_qualified": conversation.is_qualified,
             "appointment_booked": conversation.appointment_booked,
             "created_at": conversation.created_at.isoformat(),
-            "updated_at": conversation.updated_at.isoformat(),
+            "updated_at": conversation.last_updated.isoformat()
+            if conversation.last_updated
+            else None,
         }
 
     except HTTPException:
@@ -387,11 +480,15 @@ async def get_chat_history(session_id: str, db: Session = Depends(get_db)):
 
 
 @app.get("/api/chat/summary/{session_id}")
-async def get_conversation_summary(session_id: str, db: Session = Depends(get_db)):
+async def get_conversation_summary(
+    session_id: str,
+    db: Session = Depends(get_db),
+    services: ServiceContainer = Depends(get_services),
+):
     """Get conversation summary with statistics."""
     try:
-        chatbot = ProVisionChatbot(db)
-        summary = chatbot.get_conversation_summary(session_id)
+        chatbot = ProVisionChatbot(db, services)
+        summary = await run_in_threadpool(chatbot.get_conversation_summary, session_id)
 
         if "error" in summary:
             raise HTTPException(status_code=404, detail=summary["error"])
@@ -416,40 +513,58 @@ async def list_leads(
     min_score: Optional[int] = None,
     limit: int = 50,
     offset: int = 0,
-    db: Session = Depends(get_db),
+    cursor: Optional[str] = None,
+    db: AsyncSession = Depends(get_async_db),
 ):
     """
     List and filter leads.
 
     Query parameters:
-    - query: Search by name or email
+    - query: Search by name or email (ranked; paginate with offset)
     - qualification_status: Filter by status (High Value, Qualified, Warm, Cold)
     - min_score: Minimum lead score (0-100)
     - limit: Maximum results (default 50)
-    - offset: Pagination offset
+    - cursor: next_cursor from the previous page
+    - offset: Pagination offset (deprecated for listings; use cursor)
     """
     try:
-        lead_service = LeadService(db)
-        leads = lead_service.search_leads(
-            query=query,
-            qualification_status=qualification_status,
-            min_score=min_score,
-            limit=limit,
-            offset=offset,
-        )
+        lead_service = AsyncLeadService(db)
+
+        if query or offset:
+            leads = await lead_service.search_leads(
+                query=query,
+                qualification_status=qualification_status,
+                min_score=min_score,
+                limit=limit,
+                offset=offset,
+            )
+            next_cursor = None
+        else:
+            leads, next_cursor = await lead_service.list_leads(
+                qualification_status=qualification_status,
+                min_score=min_score,
+                limit=limit,
+                cursor=cursor,
+            )
 
-        return {"leads": [lead.to_dict() for lead in leads], "count": len(leads)}
+        return {
+            "leads": [lead.to_dict() for lead in leads],
+            "count": len(leads),
+            "next_cursor": next_cursor,
+        }
 
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error listing leads: {str(e)}")
 
 
 @app.get("/api/leads/{lead_id}")
-async def get_lead(lead_id: int, db: Session = Depends(get_db)):
+async def get_lead(lead_id: int, db: AsyncSession = Depends(get_async_db)):
     """Get lead details by ID."""
     try:
-        lead_service = LeadService(db)
-        lead = lead_service.get_lead(lead_id)
+        lead_service = AsyncLeadService(db)
+        lead = await lead_service.get_lead(lead_id)
 
         if not lead:
             raise HTTPException(status_code=404, detail="Lead not found")
@@ -463,27 +578,79 @@ async def get_lead(lead_id: int, db: Session = Depends(get_db)):
 
 
 @app.get("/api/leads/stats/summary")
-async def get_lead_stats(db: Session = Depends(get_db)):
+async def get_lead_stats(db: AsyncSession = Depends(get_async_db)):
     """Get lead statistics summary."""
     try:
-        lead_service = LeadService(db)
-        stats = lead_service.get_lead_stats()
+        lead_service = AsyncLeadService(db)
+        stats = await lead_service.get_lead_stats()
         return stats
 
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error getting stats: {str(e)}")
 
 
+def _body_chunks(request: Request) -> Iterator[bytes]:
+    """Request body chunks, read as they arrive, for code in a worker thread"""
+    body = request.stream().__aiter__()
+
+    async def next_chunk() -> Optional[bytes]:
+        try:
+            return await body.__anext__()
+        except StopAsyncIteration:
+            return None
+
+    while True:
+        chunk = anyio.from_thread.run(next_chunk)
+        if chunk is None:
+            return
+        yield chunk
+
+
+@app.post("/api/leads/import")
+async def import_leads(
+    request: Request,
+    file_format: Optional[str] = Query(None, alias="format"),
+    source: str = "import",
+    db: Session = Depends(get_db),
+):
+    """
+    Bulk import leads from a CSV or JSON Lines file sent as the request body.
+
+    The body is parsed as it streams in and upserted by email in batches;
+    existing leads are updated. Set Content-Type to text/csv or
+    application/x-ndjson, or pass format=csv|jsonl.
+
+    Query parameters:
+    - format: csv or jsonl (default: from Content-Type)
+    - source: Source for rows without a source column (default "import")
+    """
+    try:
+        file_format = import_format(file_format, request.headers.get("content-type"))
+        importer = LeadImporter(db, default_source=source)
+        return await run_in_threadpool(
+            lambda: importer.import_stream(text_stream(_body_chunks(request)), file_format)
+        )
+
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error importing leads: {str(e)}")
+
+
 # ============================================================================
 # Appointment Endpoints
 # ============================================================================
 
 
 @app.post("/api/appointments/book")
-async def book_appointment(request: BookingRequest, db: Session = Depends(get_db)):
+async def book_appointment(
+    request: BookingRequest,
+    db: Session = Depends(get_db),
+    services: ServiceContainer = Depends(get_services),
+):
     """Book appointment via Cal.com."""
     try:
-        chatbot = ProVisionChatbot(db)
+        chatbot = ProVisionChatbot(db, services)
         result = await chatbot.book_appointment(
             session_id=request.session_id,
             name=request.name,
@@ -504,32 +671,47 @@ async def book_appointment(request: BookingRequest, db: Session = Depends(get_db
         raise HTTPException(status_code=500, detail=f"Booking error: {str(e)}")
 
 
+# Appointments listing order: latest scheduled first
+APPOINTMENT_ORDER = Keyset(
+    "appointments", Appointment.scheduled_time, Appointment.id, descending=True
+)
+
+
 @app.get("/api/appointments")
 async def list_appointments(
     lead_id: Optional[int] = None,
     status: Optional[str] = None,
     limit: int = 50,
-    db: Session = Depends(get_db),
+    cursor: Optional[str] = None,
+    db: AsyncSession = Depends(get_async_db),
 ):
-    """List appointments with optional filters."""
-    try:
-        from models.appointment import Appointment
+    """
+    List appointments with optional filters, latest scheduled first.
 
-        query = db.query(Appointment)
+    Paginate with the response's next_cursor.
+    """
+    try:
+        query = select(Appointment)
 
         if lead_id:
-            query = query.filter(Appointment.lead_id == lead_id)
+            query = query.where(Appointment.lead_id == lead_id)
 
         if status:
-            query = query.filter(Appointment.status == status)
+            query = query.where(Appointment.status == status)
 
-        appointments = query.limit(limit).all()
+        query = APPOINTMENT_ORDER.apply(query, cursor).limit(limit + 1)
+        appointments, next_cursor = APPOINTMENT_ORDER.page(
+            (await db.scalars(query)).all(), limit
+        )
 
         return {
             "appointments": [apt.to_dict() for apt in appointments],
             "count": len(appointments),
+            "next_cursor": next_cursor,
         }
 
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(
             status_code=500, detail=f"Error listing appointments: {str(e)}"
@@ -543,46 +725,61 @@ async def list_appointments(
 
 @app.get("/api/seminars")
 async def list_seminars(
-    topic: Optional[str] = None, limit: int = 10, db: Session = Depends(get_db)
+    topic: Optional[str] = None,
+    limit: int = 10,
+    cursor: Optional[str] = None,
+    db: AsyncSession = Depends(get_async_db),
 ):
-    """List upcoming seminars."""
+    """List upcoming seminars (paginate with the response's next_cursor)."""
     try:
-        seminar_service = SeminarService(db)
-        seminars = seminar_service.list_upcoming_seminars(limit=limit, topic=topic)
+        seminar_service = AsyncSeminarService(db)
+        seminars, next_cursor = await seminar_service.page_upcoming_seminars(
+            limit=limit, topic=topic, cursor=cursor
+        )
 
         return {
             "seminars": [seminar.to_dict() for seminar in seminars],
             "count": len(seminars),
+            "next_cursor": next_cursor,
         }
 
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error listing seminars: {str(e)}")
 
 
 @app.get("/api/seminars/upcoming")
 async def list_upcoming_seminars(
-    limit: int = 20, db: Session = Depends(get_db)
+    limit: int = 20,
+    cursor: Optional[str] = None,
+    db: AsyncSession = Depends(get_async_db),
 ):
     """List all upcoming seminars (alias for frontend)."""
     try:
-        seminar_service = SeminarService(db)
-        seminars = seminar_service.list_upcoming_seminars(limit=limit)
+        seminar_service = AsyncSeminarService(db)
+        seminars, next_cursor = await seminar_service.page_upcoming_seminars(
+            limit=limit, cursor=cursor
+        )
 
         return {
             "seminars": [seminar.to_dict() for seminar in seminars],
             "count": len(seminars),
+            "next_cursor": next_cursor,
         }
 
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error listing seminars: {str(e)}")
 
 
 @app.get("/api/seminars/{seminar_id}")
-async def get_seminar(seminar_id: int, db: Session = Depends(get_db)):
+async def get_seminar(seminar_id: int, db: AsyncSession = Depends(get_async_db)):
     """Get seminar details."""
     try:
-        seminar_service = SeminarService(db)
-        seminar = seminar_service.get_seminar(seminar_id)
+        seminar_service = AsyncSeminarService(db)
+        seminar = await seminar_service.get_seminar(seminar_id)
 
         if not seminar:
             raise HTTPException(status_code=404, detail="Seminar not found")
@@ -597,12 +794,12 @@ async def get_seminar(seminar_id: int, db: Session = Depends(get_db)):
 
 @app.post("/api/seminars/register")
 async def register_for_seminar(
-    request: SeminarRegistrationRequest, db: Session = Depends(get_db)
+    request: SeminarRegistrationRequest, db: AsyncSession = Depends(get_async_db)
 ):
     """Register for a seminar."""
     try:
-        seminar_service = SeminarService(db)
-        registration = seminar_service.register_attendee(
+        seminar_service = AsyncSeminarService(db)
+        registration = await seminar_service.register_attendee(
             seminar_id=request.seminar_id,
             lead_id=request.lead_id,
             guest_name=request.guest_name,
@@ -624,11 +821,11 @@ async def register_for_seminar(
 
 
 @app.get("/api/seminars/{seminar_id}/stats")
-async def get_seminar_stats(seminar_id: int, db: Session = Depends(get_db)):
+async def get_seminar_stats(seminar_id: int, db: AsyncSession = Depends(get_async_db)):
     """Get seminar statistics."""
     try:
-        seminar_service = SeminarService(db)
-        stats = seminar_service.get_seminar_stats(seminar_id)
+        seminar_service = AsyncSeminarService(db)
+        stats = await seminar_service.get_seminar_stats(seminar_id)
         return stats
 
     except ValueError as e:
@@ -643,19 +840,19 @@ async def get_seminar_stats(seminar_id: int, db: Session = Depends(get_db)):
 
 
 @app.get("/api/analytics/overview")
-async def get_analytics_overview(db: Session = Depends(get_db)):
+async def get_analytics_overview(db: AsyncSession = Depends(get_async_db)):
     """Get comprehensive analytics overview."""
     try:
-        lead_service = LeadService(db)
+        lead_service = AsyncLeadService(db)
 
         # Lead stats
-        lead_stats = lead_service.get_lead_stats()
+        lead_stats = await lead_service.get_lead_stats()
 
         # Recent leads
-        recent_leads = lead_service.get_recent_leads(days=7, limit=10)
+        recent_leads = await lead_service.get_recent_leads(days=7, limit=10)
 
         # High value leads
-        high_value_leads = lead_service.get_high_value_leads(limit=10)
+        high_value_leads = await lead_service.get_high_value_leads(limit=10)
 
         return {
             "lead_stats": lead_stats,
@@ -0,0 +1,83 @@
+"""
+Alembic environment - runs migrations against settings.DATABASE_URL
+"""
+
+from alembic import context
+
+from core.database import Base, engine
+from models import (  # noqa: F401 - register tables on Base.metadata
+    lead,
+    lead_status_count,
+    conversation,
+    conversation_message,
+    appointment,
+    seminar,
+    seminar_registration,
+)
+
+config = context.config
+target_metadata = Base.metadata
+
+# Lead search index from migration 0006, which is not in the models: the FTS5
+# table and its shadow tables (SQLite), generated columns and GIN indexes
+# (PostgreSQL)
+SEARCH_INDEX_TABLE_PREFIX = "leads_fts"
+SEARCH_INDEX_COLUMNS = {"search_text", "search_vector"}
+SEARCH_INDEX_INDEXES = {"ix_leads_search_text_trgm", "ix_leads_search_vector"}
+
+
+def include_object(object, name, type_, reflected, compare_to):
+    """Keep autogenerate / alembic check from dropping the lead search index"""
+    if not reflected or compare_to is not None:
+        return True
+    if type_ == "table":
+        return not name.startswith(SEARCH_INDEX_TABLE_PREFIX)
+    if type_ == "column":
+        return not (object.table.name == "leads" and name in SEARCH_INDEX_COLUMNS)
+    if type_ == "index":
+        return name not in SEARCH_INDEX_INDEXES
+    return True
+
+
+def run_migrations_offline():
+    """Emit SQL to stdout instead of executing it (alembic upgrade --sql)"""
+    context.configure(
+        url=str(engine.url),
+        target_metadata=target_metadata,
+        literal_binds=True,
+        render_as_batch=True,
+        include_object=include_object,
+    )
+
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+def run_migrations_online():
+    """Run migrations on the app engine (or a connection passed by init_db)"""
+    connection = config.attributes.get("connection")
+
+    if connection is not None:
+        _run_with_connection(connection)
+        return
+
+    with engine.connect() as connection:
+        _run_with_connection(connection)
+
+
+def _run_with_connection(connection):
+    context.configure(
+        connection=connection,
+        target_metadata=target_metadata,
+        render_as_batch=True,  # SQLite needs batch mode for ALTER TABLE
+        include_object=include_object,
+    )
+
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+if context.is_offline_mode():
+    run_migrations_offline()
+else:
+    run_migrations_online()
@@ -0,0 +1,171 @@
+"""Baseline schema (tables created by create_all before migrations existed)
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-17
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "0001"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "leads",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("name", sa.String(200), nullable=True),
+        sa.Column("email", sa.String(200), nullable=False),
+        sa.Column("phone", sa.String(20), nullable=True),
+        sa.Column("state", sa.String(50), nullable=True),
+        sa.Column("age_range", sa.String(20), nullable=True),
+        sa.Column("retirement_timeline", sa.String(20), nullable=True),
+        sa.Column("investable_assets", sa.String(50), nullable=True),
+        sa.Column("current_annuity", sa.String(20), nullable=True),
+        sa.Column("concerns", sa.Text(), nullable=True),
+        sa.Column("goals", sa.Text(), nullable=True),
+        sa.Column("lead_score", sa.Float(), nullable=True),
+        sa.Column("qualification_status", sa.String(20), nullable=True),
+        sa.Column("source", sa.String(50), nullable=True),
+        sa.Column("utm_params", sa.JSON(), nullable=True),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+            nullable=True,
+        ),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_leads_id", "leads", ["id"])
+    op.create_index("ix_leads_email", "leads", ["email"], unique=True)
+
+    op.create_table(
+        "seminars",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("title", sa.String(300), nullable=False),
+        sa.Column("description", sa.Text(), nullable=True),
+        sa.Column("topic", sa.String(100), nullable=True),
+        sa.Column("date", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("duration", sa.Integer(), nullable=True),
+        sa.Column("location_type", sa.String(20), nullable=True),
+        sa.Column("location_details", sa.Text(), nullable=True),
+        sa.Column("capacity", sa.Integer(), nullable=True),
+        sa.Column("registered_count", sa.Integer(), nullable=True),
+        sa.Column("status", sa.String(20), nullable=True),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+            nullable=True,
+        ),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_seminars_id", "seminars", ["id"])
+
+    op.create_table(
+        "conversations",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("session_id", sa.String(100), nullable=False),
+        sa.Column("lead_id", sa.Integer(), sa.ForeignKey("leads.id"), nullable=True),
+        sa.Column("channel", sa.String(20), nullable=True),
+        sa.Column("messages", sa.JSON(), nullable=True),
+        sa.Column("qualification_progress", sa.Integer(), nullable=True),
+        sa.Column("qualification_answers", sa.JSON(), nullable=True),
+        sa.Column("context", sa.JSON(), nullable=True),
+        sa.Column("is_qualified", sa.Integer(), nullable=True),
+        sa.Column("appointment_booked", sa.Integer(), nullable=True),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+            nullable=True,
+        ),
+        sa.Column(
+            "last_updated",
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+            nullable=True,
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_conversations_id", "conversations", ["id"])
+    op.create_index(
+        "ix_conversations_session_id", "conversations", ["session_id"], unique=True
+    )
+
+    op.create_table(
+        "appointments",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("lead_id", sa.Integer(), sa.ForeignKey("leads.id"), nullable=False),
+        sa.Column("calcom_event_id", sa.String(100), nullable=True),
+        sa.Column("calcom_booking_id", sa.String(100), nullable=True),
+        sa.Column("advisor_name", sa.String(200), nullable=True),
+        sa.Column("scheduled_time", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("duration", sa.Integer(), nullable=True),
+        sa.Column("status", sa.String(20), nullable=True),
+        sa.Column("source", sa.String(50), nullable=True),
+        sa.Column("outcome", sa.Text(), nullable=True),
+        sa.Column("notes", sa.Text(), nullable=True),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+            nullable=True,
+        ),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_appointments_id", "appointments", ["id"])
+
+    op.create_table(
+        "seminar_registrations",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column(
+            "seminar_id", sa.Integer(), sa.ForeignKey("seminars.id"), nullable=False
+        ),
+        sa.Column("lead_id", sa.Integer(), sa.ForeignKey("leads.id"), nullable=True),
+        sa.Column("guest_name", sa.String(200), nullable=False),
+        sa.Column("guest_email", sa.String(200), nullable=False),
+        sa.Column("guest_phone", sa.String(20), nullable=True),
+        sa.Column(
+            "registration_date",
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+            nullable=True,
+        ),
+        sa.Column("reminder_preference", sa.String(20), nullable=True),
+        sa.Column("confirmation_sent", sa.Integer(), nullable=True),
+        sa.Column("reminder_sent", sa.Integer(), nullable=True),
+        sa.Column("attendance_status", sa.String(20), nullable=True),
+        sa.Column("check_in_time", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("feedback", sa.Text(), nullable=True),
+        sa.Column("rating", sa.Integer(), nullable=True),
+        sa.Column("follow_up_interest", sa.String(20), nullable=True),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+            nullable=True,
+        ),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "ix_seminar_registrations_id", "seminar_registrations", ["id"]
+    )
+
+
+def downgrade():
+    op.drop_table("seminar_registrations")
+    op.drop_table("appointments")
+    op.drop_table("conversations")
+    op.drop_table("seminars")
+    op.drop_table("leads")
@@ -0,0 +1,99 @@
+"""Append-only conversation_messages table, backfilled from Conversation.messages
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-17
+"""
+
+from datetime import datetime
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "0002"
+down_revision = "0001"
+branch_labels = None
+depends_on = None
+
+BATCH_SIZE = 1000
+
+
+def upgrade():
+    messages_table = op.create_table(
+        "conversation_messages",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column(
+            "conversation_id",
+            sa.Integer(),
+            sa.ForeignKey("conversations.id"),
+            nullable=False,
+        ),
+        sa.Column("seq", sa.Integer(), nullable=False),
+        sa.Column("role", sa.String(20), nullable=False),
+        sa.Column("content", sa.Text(), nullable=False),
+        sa.Column("metadata", sa.JSON(), nullable=True),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+            nullable=True,
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_conversation_messages_id", "conversation_messages", ["id"])
+    op.create_index(
+        "ix_conversation_messages_conversation_seq",
+        "conversation_messages",
+        ["conversation_id", "seq"],
+        unique=True,
+    )
+
+    # Backfill: copy each legacy JSON transcript into rows (JSON column is kept)
+    conversations = sa.table(
+        "conversations", sa.column("id", sa.Integer), sa.column("messages", sa.JSON)
+    )
+    bind = op.get_bind()
+    result = bind.execution_options(stream_results=True).execute(
+        sa.select(conversations.c.id, conversations.c.messages).where(
+            conversations.c.messages.isnot(None)
+        )
+    )
+
+    batch = []
+    for conversation_id, messages in result:
+        for seq, message in enumerate(messages or [], start=1):
+            batch.append(
+                {
+                    "conversation_id": conversation_id,
+                    "seq": seq,
+                    "role": message.get("role", "user"),
+                    "content": message.get("content") or "",
+                    "metadata": message.get("metadata"),
+                    "created_at": _parse_timestamp(message.get("timestamp")),
+                }
+            )
+
+        if len(batch) >= BATCH_SIZE:
+            op.bulk_insert(messages_table, batch)
+            batch = []
+
+    if batch:
+        op.bulk_insert(messages_table, batch)
+
+
+def downgrade():
+    op.drop_index(
+        "ix_conversation_messages_conversation_seq", table_name="conversation_messages"
+    )
+    op.drop_index("ix_conversation_messages_id", table_name="conversation_messages")
+    op.drop_table("conversation_messages")
+
+
+def _parse_timestamp(value):
+    """Legacy messages stored datetime.utcnow().isoformat() strings"""
+    try:
+        return datetime.fromisoformat(value) if value else None
+    except ValueError:
+        return None
@@ -0,0 +1,35 @@
+"""Lead counts per qualification status, maintained on every lead write
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-17
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "0005"
+down_revision = "0004"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "lead_status_counts",
+        sa.Column("status", sa.String(20), primary_key=True),
+        sa.Column("count", sa.Integer(), nullable=False, server_default="0"),
+    )
+
+    # Backfill from the leads already there
+    op.execute(
+        "INSERT INTO lead_status_counts (status, count) "
+        "SELECT COALESCE(qualification_status, ''), COUNT(*) FROM leads "
+        "GROUP BY COALESCE(qualification_status, '')"
+    )
+
+
+def downgrade():
+    op.drop_table("lead_status_counts")
@@ -0,0 +1,98 @@
+"""Indexed lead search: FTS5 trigram table on SQLite, pg_trgm + tsvector on PostgreSQL
+
+SQLite: leads_fts is an external-content FTS5 table over leads.name and
+leads.email, kept in sync by triggers. A later batch migration that copies
+and recreates the leads table drops these triggers and must re-create them.
+
+PostgreSQL: generated search_text / search_vector columns (maintained by the
+database on every insert and update) with GIN indexes.
+
+Other databases get nothing; search falls back to ILIKE.
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-17
+"""
+
+import sqlite3
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "0006"
+down_revision = "0005"
+branch_labels = None
+depends_on = None
+
+# FTS5's trigram tokenizer
+SQLITE_TRIGRAM_VERSION = (3, 34, 0)
+
+SQLITE_TRIGGERS = {
+    "leads_fts_insert": """
+        CREATE TRIGGER leads_fts_insert AFTER INSERT ON leads BEGIN
+            INSERT INTO leads_fts (rowid, name, email) VALUES (new.id, new.name, new.email);
+        END
+    """,
+    "leads_fts_delete": """
+        CREATE TRIGGER leads_fts_delete AFTER DELETE ON leads BEGIN
+            INSERT INTO leads_fts (leads_fts, rowid, name, email)
+            VALUES ('delete', old.id, old.name, old.email);
+        END
+    """,
+    "leads_fts_update": """
+        CREATE TRIGGER leads_fts_update AFTER UPDATE OF name, email ON leads BEGIN
+            INSERT INTO leads_fts (leads_fts, rowid, name, email)
+            VALUES ('delete', old.id, old.name, old.email);
+            INSERT INTO leads_fts (rowid, name, email) VALUES (new.id, new.name, new.email);
+        END
+    """,
+}
+
+
+def upgrade():
+    dialect = op.get_bind().dialect.name
+
+    if dialect == "sqlite":
+        if sqlite3.sqlite_version_info < SQLITE_TRIGRAM_VERSION:
+            return
+        op.execute(
+            "CREATE VIRTUAL TABLE leads_fts USING fts5("
+            "name, email, content='leads', content_rowid='id', tokenize='trigram')"
+        )
+        for trigger in SQLITE_TRIGGERS.values():
+            op.execute(trigger)
+        op.execute("INSERT INTO leads_fts (leads_fts) VALUES ('rebuild')")
+
+    elif dialect == "postgresql":
+        op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+        op.execute(
+            "ALTER TABLE leads ADD COLUMN search_text text "
+            "GENERATED ALWAYS AS (coalesce(name, '') || ' ' || email) STORED"
+        )
+        # Email split into words, so "smith" finds john.smith@example.com
+        op.execute(
+            "ALTER TABLE leads ADD COLUMN search_vector tsvector "
+            "GENERATED ALWAYS AS (to_tsvector('simple', coalesce(name, '') || ' ' || "
+            "regexp_replace(email, '[^[:alnum:]]+', ' ', 'g'))) STORED"
+        )
+        op.execute(
+            "CREATE INDEX ix_leads_search_text_trgm ON leads "
+            "USING gin (search_text gin_trgm_ops)"
+        )
+        op.execute("CREATE INDEX ix_leads_search_vector ON leads USING gin (search_vector)")
+
+
+def downgrade():
+    dialect = op.get_bind().dialect.name
+
+    if dialect == "sqlite":
+        for name in SQLITE_TRIGGERS:
+            op.execute(f"DROP TRIGGER IF EXISTS {name}")
+        op.execute("DROP TABLE IF EXISTS leads_fts")
+
+    elif dialect == "postgresql":
+        op.execute("DROP INDEX IF EXISTS ix_leads_search_vector")
+        op.execute("DROP INDEX IF EXISTS ix_leads_search_text_trgm")
+        op.execute("ALTER TABLE leads DROP COLUMN IF EXISTS search_vector")
+        op.execute("ALTER TABLE leads DROP COLUMN IF EXISTS search_text")
@@ -0,0 +1,55 @@
+"""Composite indexes for the hot listing, filter and lookup queries
+
+Each index matches a query the services run: equality filters first, then
+the sort columns ending in id, so a keyset page is one index range read
+with no sort. Upcoming seminars filter on two statuses, which would split
+a (status, date) index into two ranges needing a merge sort, so that index
+is (date, id) and status is checked on the rows it reads.
+benchmarks/explain_indexes.py checks the query plans.
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-17
+"""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "0007"
+down_revision = "0006"
+branch_labels = None
+depends_on = None
+
+# (index name, table, columns)
+INDEXES = [
+    # Lead listing (score desc, id desc), optionally by status or source
+    ("ix_leads_score_id", "leads", ["lead_score", "id"]),
+    ("ix_leads_status_score", "leads", ["qualification_status", "lead_score", "id"]),
+    ("ix_leads_source_score", "leads", ["source", "lead_score", "id"]),
+    # Recent leads
+    ("ix_leads_created_at", "leads", ["created_at"]),
+    # Upcoming seminars (date >= now, soonest first; status filtered per row)
+    ("ix_seminars_date_id", "seminars", ["date", "id"]),
+    # Duplicate registration check and per-seminar attendee lists
+    (
+        "ix_seminar_registrations_seminar_email",
+        "seminar_registrations",
+        ["seminar_id", "guest_email"],
+    ),
+    # Recent conversations
+    ("ix_conversations_last_updated", "conversations", ["last_updated"]),
+    # Appointment listing (latest first), optionally for one lead
+    ("ix_appointments_scheduled", "appointments", ["scheduled_time", "id"]),
+    ("ix_appointments_lead_scheduled", "appointments", ["lead_id", "scheduled_time", "id"]),
+]
+
+
+def upgrade():
+    for name, table, columns in INDEXES:
+        op.create_index(name, table, columns)
+
+
+def downgrade():
+    for name, table, _ in reversed(INDEXES):
+        op.drop_index(name, table_name=table)
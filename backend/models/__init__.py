@@ -1 +1,5 @@
 """Models package - Database models"""
+
+# Lead writes update lead_status_counts through mapper events defined next to
+# the counter model; importing it here registers them wherever Lead is used
+from models import lead, lead_status_count  # noqa: F401
@@ -2,7 +2,7 @@
 Appointment model - Stores booking information
 """
 
-from sqlalchemy import Column, Integer, String, DateTime, Text, ForeignKey
+from sqlalchemy import Column, Integer, String, DateTime, Text, ForeignKey, Index
 from sqlalchemy.sql import func
 from core.database import Base
 
@@ -11,6 +11,10 @@ class Appointment(Base):
     """Appointment model for tracking bookings"""
 
     __tablename__ = "appointments"
+    __table_args__ = (
+        Index("ix_appointments_scheduled", "scheduled_time", "id"),
+        Index("ix_appointments_lead_scheduled", "lead_id", "scheduled_time", "id"),
+    )
 
     # Primary Key
     id = Column(Integer, primary_key=True, index=True)
@@ -2,7 +2,7 @@
 Conversation model - Stores chat history and context
 """
 
-from sqlalchemy import Column, Integer, String, DateTime, Text, JSON, ForeignKey
+from sqlalchemy import Column, Integer, String, DateTime, Text, JSON, ForeignKey, Index
 from sqlalchemy.sql import func
 from core.database import Base
 
@@ -11,6 +11,7 @@ class Conversation(Base):
     """Conversation model for tracking chat sessions"""
 
     __tablename__ = "conversations"
+    __table_args__ = (Index("ix_conversations_last_updated", "last_updated"),)
 
     # Primary Key
     id = Column(Integer, primary_key=True, index=True)
@@ -23,6 +24,7 @@ class Conversation(Base):
     channel = Column(String(20), default="web")  # web/sms/whatsapp/facebook
 
     # Conversation Data
+    # Legacy transcript - messages now live in conversation_messages
     messages = Column(
         JSON, default=list
     )  # [{"role": "user", "content": "...", "timestamp": "..."}]
@@ -30,6 +32,15 @@ class Conversation(Base):
     qualification_answers = Column(JSON, default=dict)  # {"age_range": "31-50", ...}
     context = Column(JSON, default=dict)  # Additional context data
 
+    # Rolling summary of messages with seq <= summary_through_seq; only newer
+    # messages are sent to the LLM verbatim
+    summary = Column(Text, nullable=True)
+    summary_through_seq = Column(Integer, default=0, nullable=False, server_default="0")
+
+    # Row version: every ORM update checks and bumps it, so a turn that read
+    # stale state fails to commit instead of overwriting a concurrent one
+    version = Column(Integer, nullable=False, server_default="1")
+
     # State Management
     is_qualified = Column(Integer, default=0)  # 0=no, 1=yes
     appointment_booked = Column(Integer, default=0)  # 0=no, 1=yes
@@ -40,6 +51,8 @@ class Conversation(Base):
         DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
     )
 
+    __mapper_args__ = {"version_id_col": version}
+
     def __repr__(self):
         return f"<Conversation(session_id={self.session_id}, channel={self.channel}, progress={self.qualification_progress})>"
 
@@ -54,6 +67,7 @@ class Conversation(Base):
             "qualification_progress": self.qualification_progress,
             "qualification_answers": self.qualification_answers,
             "context": self.context,
+            "summary": self.summary,
             "is_qualified": bool(self.is_qualified),
             "appointment_booked": bool(self.appointment_booked),
             "created_at": self.created_at.isoformat() if self.created_at else None,
@@ -0,0 +1,54 @@
+"""
+Conversation Message model - Append-only chat transcript rows
+"""
+
+from sqlalchemy import Column, Integer, String, DateTime, Text, JSON, ForeignKey, Index
+from sqlalchemy.sql import func
+from core.database import Base
+
+
+class ConversationMessage(Base):
+    """One message in a conversation, ordered by a per-conversation sequence"""
+
+    __tablename__ = "conversation_messages"
+    __table_args__ = (
+        Index(
+            "ix_conversation_messages_conversation_seq",
+            "conversation_id",
+            "seq",
+            unique=True,
+        ),
+    )
+
+    # Primary Key
+    id = Column(Integer, primary_key=True, index=True)
+
+    # Relationships
+    conversation_id = Column(Integer, ForeignKey("conversations.id"), nullable=False)
+
+    # Ordering within the conversation (1, 2, 3, ...)
+    seq = Column(Integer, nullable=False)
+
+    # Message Data
+    role = Column(String(20), nullable=False)  # user/assistant/system
+    content = Column(Text, nullable=False)
+    message_metadata = Column("metadata", JSON, nullable=True)
+
+    # Metadata
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    def __repr__(self):
+        return f"<ConversationMessage(conversation_id={self.conversation_id}, seq={self.seq}, role={self.role})>"
+
+    def to_dict(self):
+        """Convert to the message dict shape used in prompts and the history API"""
+        message = {
+            "role": self.role,
+            "content": self.content,
+            "timestamp": self.created_at.isoformat() if self.created_at else None,
+        }
+
+        if self.message_metadata:
+            message["metadata"] = self.message_metadata
+
+        return message
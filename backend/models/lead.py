@@ -2,7 +2,7 @@
 Lead model - Stores lead information and qualification data
 """
 
-from sqlalchemy import Column, Integer, String, Float, DateTime, Text, JSON
+from sqlalchemy import Column, Integer, String, Float, DateTime, Text, JSON, Index
 from sqlalchemy.sql import func
 from core.database import Base
 
@@ -11,6 +11,12 @@ class Lead(Base):
     """Lead model for tracking prospects"""
 
     __tablename__ = "leads"
+    __table_args__ = (
+        Index("ix_leads_score_id", "lead_score", "id"),
+        Index("ix_leads_status_score", "qualification_status", "lead_score", "id"),
+        Index("ix_leads_source_score", "source", "lead_score", "id"),
+        Index("ix_leads_created_at", "created_at"),
+    )
 
     # Primary Key
     id = Column(Integer, primary_key=True, index=True)
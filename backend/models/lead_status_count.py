@@ -0,0 +1,114 @@
+"""
+Lead status counters - Number of leads per qualification status
+Kept up to date by Lead mapper events in the same transaction as the lead
+write, so lead statistics are a read of a handful of rows however many leads
+there are.
+"""
+
+from typing import Optional
+
+from sqlalchemy import Column, Integer, String, event, func, inspect, select, update
+from sqlalchemy.dialects import postgresql, sqlite
+from core.database import Base
+from models.lead import Lead
+
+
+class LeadStatusCount(Base):
+    """One row per qualification status ("" for leads without one)"""
+
+    __tablename__ = "lead_status_counts"
+
+    status = Column(String(20), primary_key=True)
+    count = Column(Integer, nullable=False, default=0)
+
+    def __repr__(self):
+        return f"<LeadStatusCount(status={self.status!r}, count={self.count})>"
+
+
+def _status_key(status: Optional[str]) -> str:
+    """Counter key for a qualification status"""
+    return status or ""
+
+
+def adjust_status_count(connection, status: Optional[str], delta: int) -> None:
+    """
+    Add `delta` to a status counter, creating the row on first use.
+
+    Args:
+        connection: Connection of the transaction writing the lead
+        status: Qualification status
+        delta: +1 / -1
+    """
+    table = LeadStatusCount.__table__
+    key = _status_key(status)
+
+    dialect_insert = {"sqlite": sqlite.insert, "postgresql": postgresql.insert}.get(
+        connection.dialect.name
+    )
+    if dialect_insert is not None:
+        connection.execute(
+            dialect_insert(table)
+            .values(status=key, count=delta)
+            .on_conflict_do_update(
+                index_elements=[table.c.status],
+                set_={"count": table.c.count + delta},
+            )
+        )
+        return
+
+    result = connection.execute(
+        update(table).where(table.c.status == key).values(count=table.c.count + delta)
+    )
+    if not result.rowcount:
+        connection.execute(table.insert().values(status=key, count=delta))
+
+
+def recompute_status_counts(connection) -> None:
+    """
+    Rebuild every counter from the leads table.
+
+    Needed after writes that bypass the ORM (bulk inserts, raw SQL).
+
+    Args:
+        connection: Connection to run the rebuild on (inside a transaction)
+    """
+    table = LeadStatusCount.__table__
+    status = func.coalesce(Lead.qualification_status, "")
+    connection.execute(table.delete())
+    connection.execute(
+        table.insert().from_select(
+            ["status", "count"],
+            select(status, func.count()).select_from(Lead.__table__).group_by(status),
+        )
+    )
+
+
+@event.listens_for(Lead, "after_insert")
+def _count_inserted_lead(mapper, connection, target):
+    """A new lead adds one to its status"""
+    adjust_status_count(connection, target.qualification_status, 1)
+
+
+@event.listens_for(Lead.qualification_status, "set", active_history=True)
+def _load_previous_status(target, value, oldvalue, initiator):
+    """Load the replaced status even if expired, so after_update sees it"""
+
+
+@event.listens_for(Lead, "after_update")
+def _count_status_change(mapper, connection, target):
+    """A status change moves the lead from one counter to the other"""
+    history = inspect(target).attrs.qualification_status.history
+    if not history.has_changes():
+        return
+
+    old = history.deleted[0] if history.deleted else None
+    new = target.qualification_status
+    if _status_key(old) != _status_key(new):
+        adjust_status_count(connection, old, -1)
+        adjust_status_count(connection, new, 1)
+
+
+@event.listens_for(Lead, "after_delete")
+def _count_deleted_lead(mapper, connection, target):
+    """A deleted lead no longer counts"""
+    adjust_status_count(connection, target.qualification_status, -1)
@@ -2,7 +2,7 @@
 Seminar model - Stores seminar/webinar information
 """
 
-from sqlalchemy import Column, Integer, String, DateTime, Text
+from sqlalchemy import Column, Integer, String, DateTime, Text, Index
 from sqlalchemy.sql import func
 from core.database import Base
 
@@ -11,6 +11,7 @@ class Seminar(Base):
     """Seminar model for event management"""
 
     __tablename__ = "seminars"
+    __table_args__ = (Index("ix_seminars_date_id", "date", "id"),)
 
     # Primary Key
     id = Column(Integer, primary_key=True, index=True)
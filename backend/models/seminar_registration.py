@@ -2,7 +2,7 @@
 Seminar Registration model - Tracks seminar attendees
 """
 
-from sqlalchemy import Column, Integer, String, DateTime, Text, ForeignKey
+from sqlalchemy import Column, Integer, String, DateTime, Text, ForeignKey, Index
 from sqlalchemy.sql import func
 from core.database import Base
 
@@ -11,6 +11,9 @@ class SeminarRegistration(Base):
     """Seminar registration model for RSVP tracking"""
 
     __tablename__ = "seminar_registrations"
+    __table_args__ = (
+        Index("ix_seminar_registrations_seminar_email", "seminar_id", "guest_email"),
+    )
 
     # Primary Key
     id = Column(Integer, primary_key=True, index=True)
@@ -21,6 +21,12 @@ class CalComService:
             "Authorization": f"Bearer {self.api_key}",
             "Content-Type": "application/json",
         }
+        # Pooled client reused across calls (keeps TLS connections alive)
+        self.client = httpx.AsyncClient(headers=self.headers)
+
+    async def aclose(self):
+        """Close pooled HTTP connections"""
+        await self.client.aclose()
 
     async def get_availability(
         self, date_from: datetime = None, date_to: datetime = None
@@ -41,25 +47,23 @@ class CalComService:
             date_to = date_from + timedelta(days=14)
 
         try:
-            async with httpx.AsyncClient() as client:
-                params = {
-                    "eventTypeId": self.event_type_id,
-                    "startTime": date_from.isoformat(),
-                    "endTime": date_to.isoformat(),
-                }
-
-                response = await client.get(
-                    f"{self.api_url}/availability",
-                    headers=self.headers,
-                    params=params,
-                    timeout=10.0,
-                )
-
-                if response.status_code == 200:
-                    return response.json()
-                else:
-                    print(f"Cal.com availability error: {response.status_code}")
-                    return {"available": False, "error": "Could not fetch availability"}
+            params = {
+                "eventTypeId": self.event_type_id,
+                "startTime": date_from.isoformat(),
+                "endTime": date_to.isoformat(),
+            }
+
+            response = await self.client.get(
+                f"{self.api_url}/availability",
+                params=params,
+                timeout=10.0,
+            )
+
+            if response.status_code == 200:
+                return response.json()
+            else:
+                print(f"Cal.com availability error: {response.status_code}")
+                return {"available": False, "error": "Could not fetch availability"}
 
         except Exception as e:
             print(f"Error fetching availability: {e}")
@@ -87,43 +91,41 @@ class CalComService:
             Booking confirmation dict
         """
         try:
-            async with httpx.AsyncClient() as client:
-                booking_data = {
-                    "eventTypeId": int(self.event_type_id),
-                    "start": start_time.isoformat(),
-                    "responses": {"name": name, "email": email, "notes": notes},
-                    "timeZone": "America/New_York",
-                    "language": "en",
-                    "metadata": {},
+            booking_data = {
+                "eventTypeId": int(self.event_type_id),
+                "start": start_time.isoformat(),
+                "responses": {"name": name, "email": email, "notes": notes},
+                "timeZone": "America/New_York",
+                "language": "en",
+                "metadata": {},
+            }
+
+            if phone:
+                booking_data["responses"]["phone"] = phone
+
+            response = await self.client.post(
+                f"{self.api_url}/bookings",
+                json=booking_data,
+                timeout=15.0,
+            )
+
+            if response.status_code in [200, 201]:
+                result = response.json()
+                return {
+                    "success": True,
+                    "booking_id": result.get("id"),
+                    "booking_uid": result.get("uid"),
+                    "start_time": start_time.isoformat(),
+                    "message": "Appointment booked successfully!",
                 }
-
-                if phone:
-                    booking_data["responses"]["phone"] = phone
-
-                response = await client.post(
-                    f"{self.api_url}/bookings",
-                    headers=self.headers,
-                    json=booking_data,
-                    timeout=15.0,
+            else:
+                print(
+                    f"Cal.com booking error: {response.status_code} - {response.text}"
                 )
-
-                if response.status_code in [200, 201]:
-                    result = response.json()
-                    return {
-                        "success": True,
-                        "booking_id": result.get("id"),
-                        "booking_uid": result.get("uid"),
-                        "start_time": start_time.isoformat(),
-                        "message": "Appointment booked successfully!",
-                    }
-                else:
-                    print(
-                        f"Cal.com booking error: {response.status_code} - {response.text}"
-                    )
-                    return {
-                        "success": False,
-                        "error": f"Booking failed: {response.status_code}",
-                    }
+                return {
+                    "success": False,
+                    "error": f"Booking failed: {response.status_code}",
+                }
 
         except Exception as e:
             print(f"Error creating booking: {e}")
@@ -136,11 +138,8 @@ class CalComService:
     async def test_connection(self) -> bool:
         """Test Cal.com API connection"""
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    f"{self.api_url}/me", headers=self.headers, timeout=10.0
-                )
-                return response.status_code == 200
+            response = await self.client.get(f"{self.api_url}/me", timeout=10.0)
+            return response.status_code == 200
         except Exception as e:
             print(f"Cal.com connection test failed: {e}")
             return False
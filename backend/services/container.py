@@ -0,0 +1,64 @@
+"""
+Service Container - Application-lifetime service instances
+Holds stateless clients (and their pooled connections) shared by every request.
+"""
+
+from fastapi import Request
+
+from core.database import pool_stats
+from services.groq_service import GroqService
+from services.qualification_service import QualificationService
+from services.calcom_service import CalComService
+from services.seminar_service import seminar_snapshot_cache
+from services.summary_service import ConversationSummarizer
+from services.intent_router import IntentRouter
+from utils.locks import KeyedLock
+
+
+class ServiceContainer:
+    """
+    Process-wide holder for stateless services.
+
+    Created once at startup; only the database session is bound per request.
+    """
+
+    def __init__(self):
+        """Build shared services once"""
+        self.groq_service = GroqService()
+        self.qualification_service = QualificationService()
+        self.calcom_service = CalComService()
+        self.summarizer = ConversationSummarizer(self.groq_service)
+        self.intent_router = IntentRouter(self.qualification_service)
+
+        # Chat turns for the same session run one at a time in this worker
+        self.session_locks = KeyedLock()
+        self.write_conflicts = {"conflicts": 0, "retries_exhausted": 0}
+
+    def metrics(self) -> dict:
+        """Runtime metrics from shared services"""
+        return {
+            "prompts": self.groq_service.prompt_stats(),
+            "qualification_extraction": self.qualification_service.extraction_stats(),
+            "seminar_cache": seminar_snapshot_cache.stats(),
+            "response_cache": self.groq_service.response_cache.stats(),
+            "summaries": self.summarizer.stats(),
+            "intent_router": self.intent_router.stats(),
+            "groq_circuit": self.groq_service.resilience_stats(),
+            "groq_single_flight": self.groq_service.single_flight.stats(),
+            "session_locks": {**self.session_locks.stats(), **self.write_conflicts},
+            "db_pool": pool_stats(),
+        }
+
+    async def aclose(self):
+        """Release pooled HTTP connections on shutdown"""
+        await self.summarizer.aclose()
+        await self.groq_service.aclose()
+        await self.calcom_service.aclose()
+
+
+def get_services(request: Request) -> ServiceContainer:
+    """
+    Dependency function to get the shared service container
+    Usage: services: ServiceContainer = Depends(get_services)
+    """
+    return request.app.state.services
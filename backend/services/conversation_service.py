@@ -6,15 +6,39 @@ from typing import Dict, List, Optional, Any
 from datetime import datetime
 from sqlalchemy.orm import Session
 from sqlalchemy.orm.attributes import flag_modified
-from sqlalchemy import desc
+from sqlalchemy import desc, func
+from core.database import AsyncSessionService
 from models.conversation import Conversation
+from models.conversation_message import ConversationMessage
+
+
+class ConversationConflictError(Exception):
+    """A concurrent writer changed the conversation after it was read"""
 
 
 class ConversationService:
     """Service for managing chat conversations and tracking qualification progress."""
 
-    def __init__(self, db: Session):
+    def __init__(self, db: Session, autocommit: bool = True):
+        """
+        Initialize service bound to a database session.
+
+        Args:
+            db: Database session
+            autocommit: Commit after each write. Pass False when the caller
+                runs several writes as one unit of work and commits itself;
+                writes are then only flushed.
+        """
         self.db = db
+        self.autocommit = autocommit
+
+    def _save(self, instance) -> None:
+        """Commit and refresh, or just flush inside a caller-managed unit of work"""
+        if self.autocommit:
+            self.db.commit()
+            self.db.refresh(instance)
+        else:
+            self.db.flush()
 
     def create_conversation(
         self, session_id: str, channel: str = "web", lead_id: Optional[int] = None
@@ -43,8 +67,7 @@ class ConversationService:
         )
 
         self.db.add(conversation)
-        self.db.commit()
-        self.db.refresh(conversation)
+        self._save(conversation)
 
         return conversation
 
@@ -90,9 +113,12 @@ class ConversationService:
         role: str,
         content: str,
         metadata: Optional[Dict[str, Any]] = None,
-    ) -> Conversation:
+    ) -> ConversationMessage:
         """
-        Add a message to the conversation.
+        Append a message to the conversation.
+
+        Messages are stored as rows in conversation_messages, so each call is
+        a single-row insert regardless of how long the transcript is.
 
         Args:
             session_id: Session identifier
@@ -101,37 +127,59 @@ class ConversationService:
             metadata: Optional metadata (e.g., qualification data, intent)
 
         Returns:
-            Conversation: Updated conversation
+            ConversationMessage: Saved message
         """
         conversation = self.get_conversation(session_id)
 
         if not conversation:
             raise ValueError(f"Conversation {session_id} not found")
 
-        # Create message object
-        message = {
-            "role": role,
-            "content": content,
-            "timestamp": datetime.utcnow().isoformat(),
-        }
+        message = ConversationMessage(
+            conversation_id=conversation.id,
+            seq=self._next_seq(conversation.id),
+            role=role,
+            content=content,
+            message_metadata=metadata,
+            created_at=datetime.utcnow(),
+        )
 
-        if metadata:
-            message["metadata"] = metadata
+        self.db.add(message)
+        self._save(message)
 
-        # Add to messages array
-        if conversation.messages is None:
-            conversation.messages = []
+        return message
 
-        conversation.messages.append(message)
-        conversation.updated_at = datetime.utcnow()
+    def touch(self, conversation: Conversation, expected_version: Optional[int] = None) -> None:
+        """
+        Mark the conversation as updated, bumping its row version.
 
-        # Mark JSON field as modified for SQLAlchemy to detect changes
-        flag_modified(conversation, "messages")
+        Every turn writes the conversation row this way, so two turns that
+        read the same version cannot both commit: the UPDATE only matches the
+        row version it was loaded with.
 
-        self.db.commit()
-        self.db.refresh(conversation)
+        Args:
+            conversation: Conversation being written
+            expected_version: Version the caller's state was read at
 
-        return conversation
+        Raises:
+            ConversationConflictError: The conversation has moved on since
+        """
+        if expected_version is not None and conversation.version != expected_version:
+            raise ConversationConflictError(
+                f"Conversation {conversation.session_id} is at version "
+                f"{conversation.version}, expected {expected_version}"
+            )
+
+        conversation.last_updated = func.now()
+        self._save(conversation)
+
+    def _next_seq(self, conversation_id: int) -> int:
+        """Next message sequence number (index-only lookup on conversation_id, seq)"""
+        last_seq = (
+            self.db.query(func.max(ConversationMessage.seq))
+            .filter(ConversationMessage.conversation_id == conversation_id)
+            .scalar()
+        )
+        return (last_seq or 0) + 1
 
     def update_qualification(
         self,
@@ -165,8 +213,7 @@ class ConversationService:
         # Mark JSON field as modified for SQLAlchemy to detect changes
         flag_modified(conversation, "qualification_answers")
 
-        self.db.commit()
-        self.db.refresh(conversation)
+        self._save(conversation)
 
         return conversation
 
@@ -188,8 +235,7 @@ class ConversationService:
         conversation.appointment_booked = True
         conversation.updated_at = datetime.utcnow()
 
-        self.db.commit()
-        self.db.refresh(conversation)
+        self._save(conversation)
 
         return conversation
 
@@ -220,35 +266,111 @@ class ConversationService:
         # Mark JSON field as modified for SQLAlchemy to detect changes
         flag_modified(conversation, "context")
 
-        self.db.commit()
-        self.db.refresh(conversation)
+        self._save(conversation)
 
         return conversation
 
     def get_message_history(
-        self, session_id: str, limit: Optional[int] = None
+        self, session_id: str, limit: Optional[int] = None, after_seq: int = 0
     ) -> List[Dict[str, Any]]:
         """
         Get message history for conversation.
 
+        With a limit, only the most recent messages are read (bounded scan of
+        the (conversation_id, seq) index).
+
         Args:
             session_id: Session identifier
             limit: Optional limit on number of messages
+            after_seq: Only messages after this sequence number (e.g. those
+                not yet folded into the rolling summary)
 
         Returns:
-            List of messages
+            List of messages, oldest first
         """
-        conversation = self.get_conversation(session_id)
+        query = (
+            self.db.query(ConversationMessage)
+            .join(Conversation, ConversationMessage.conversation_id == Conversation.id)
+            .filter(
+                Conversation.session_id == session_id,
+                ConversationMessage.seq > after_seq,
+            )
+            .order_by(desc(ConversationMessage.seq))
+        )
+
+        if limit:
+            query = query.limit(limit)
 
-        if not conversation or not conversation.messages:
-            return []
+        return [message.to_dict() for message in reversed(query.all())]
 
-        messages = conversation.messages
+    def get_unsummarized_messages(self, conversation: Conversation) -> List[ConversationMessage]:
+        """
+        Get messages not yet folded into the conversation's rolling summary.
 
-        if limit:
-            messages = messages[-limit:]
+        Args:
+            conversation: Conversation
+
+        Returns:
+            Messages with seq > summary_through_seq, oldest first
+        """
+        return (
+            self.db.query(ConversationMessage)
+            .filter(
+                ConversationMessage.conversation_id == conversation.id,
+                ConversationMessage.seq > (conversation.summary_through_seq or 0),
+            )
+            .order_by(ConversationMessage.seq)
+            .all()
+        )
+
+    def update_summary(
+        self, conversation: Conversation, summary: str, through_seq: int
+    ) -> bool:
+        """
+        Store a new rolling summary covering messages up to through_seq.
 
-        return messages
+        Only applies if no other refresh has moved the summary on since
+        `conversation` was read, and touches only the summary columns.
+
+        Args:
+            conversation: Conversation the summary was built from
+            summary: New summary text
+            through_seq: Last message sequence number covered by the summary
+
+        Returns:
+            True if the summary was stored
+        """
+        updated = (
+            self.db.query(Conversation)
+            .filter(
+                Conversation.id == conversation.id,
+                Conversation.summary_through_seq == (conversation.summary_through_seq or 0),
+            )
+            .update(
+                {"summary": summary, "summary_through_seq": through_seq},
+                synchronize_session=False,
+            )
+        )
+        if self.autocommit:
+            self.db.commit()
+        return bool(updated)
+
+    def count_messages(self, session_id: str) -> int:
+        """
+        Count messages in a conversation without loading them.
+
+        Args:
+            session_id: Session identifier
+
+        Returns:
+            Number of messages
+        """
+        return (
+            self.db.query(func.count(ConversationMessage.id))
+            .join(Conversation, ConversationMessage.conversation_id == Conversation.id)
+            .filter(Conversation.session_id == session_id)
+            .scalar()
+        )
 
     def link_to_lead(self, session_id: str, lead_id: int) -> Conversation:
         """
@@ -269,8 +391,7 @@ class ConversationService:
         conversation.lead_id = lead_id
         conversation.updated_at = datetime.utcnow()
 
-        self.db.commit()
-        self.db.refresh(conversation)
+        self._save(conversation)
 
         return conversation
 
@@ -292,7 +413,25 @@ class ConversationService:
         if channel:
             query = query.filter(Conversation.channel == channel)
 
-        return query.order_by(desc(Conversation.updated_at)).limit(limit).all()
+        return query.order_by(desc(Conversation.last_updated)).limit(limit).all()
+
+
+class AsyncConversationService(AsyncSessionService):
+    """ConversationService for an AsyncSession (read paths used by the API)."""
+
+    service_class = ConversationService
+
+    async def get_conversation(self, session_id: str) -> Optional[Conversation]:
+        """Retrieve conversation (see ConversationService.get_conversation)"""
+        return await self._run("get_conversation", session_id)
+
+    async def get_message_history(
+        self, session_id: str, limit: Optional[int] = None, after_seq: int = 0
+    ) -> List[Dict[str, Any]]:
+        """Get message history (see ConversationService.get_message_history)"""
+        return await self._run(
+            "get_message_history", session_id, limit=limit, after_seq=after_seq
+        )
 
 
 # Test function
@@ -343,7 +482,7 @@ if __name__ == "__main__":
     conv = service.get_conversation(session_id)
     print(f" Progress: {conv.qualification_progress}/7")
     print(f"   Qualified: {conv.is_qualified}")
-    print(f"   Messages: {len(conv.messages)}")
+    print(f"   Messages: {service.count_messages(session_id)}")
 
     print("\n All conversation service tests passed!")
 
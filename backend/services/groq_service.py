@@ -3,25 +3,248 @@ Groq AI Service - The Brain of the Chatbot
 Handles AI-powered conversations using Groq/Llama 3.1
 """
 
-from groq import Groq
-from typing import List, Dict, Any, Optional
+from groq import AsyncGroq
+from typing import List, Dict, Any, Optional, AsyncIterator
 
 from core.config import settings
-from knowledge.company_info import get_company_info, get_elevator_pitch
-from knowledge.retirement_planning import RETIREMENT_PLANNING, ANNUITY_EDUCATION
-from knowledge.faq_database import search_faq
+from knowledge import company_info
+from knowledge.company_info import get_company_info
+from knowledge.search_index import search_knowledge
+from utils.tokens import estimate_tokens, estimate_message_tokens
+from utils.cache import SingleFlight, TTLCache
+from services.resilience import CircuitBreaker, Deadline, UpstreamUnavailableError
+import hashlib
 import json
+import re
+
+# Page contexts with a dedicated system prompt; anything else gets "home"
+PAGE_CONTEXTS = (
+    "home",
+    "seminars",
+    "appointments",
+    "facebook",
+    "instagram",
+    "leads",
+    "support",
+)
 
 
 class GroqService:
     """Service for Groq AI interactions"""
 
     def __init__(self):
-        """Initialize Groq client"""
-        self.client = Groq(api_key=settings.GROQ_API_KEY)
+        """Initialize async Groq client (never blocks the event loop)"""
+        self.client = AsyncGroq(
+            api_key=settings.GROQ_API_KEY,
+            base_url=settings.GROQ_BASE_URL or None,
+            timeout=settings.GROQ_CALL_TIMEOUT_SECONDS,
+            max_retries=settings.GROQ_MAX_RETRIES,
+        )
         self.model = settings.GROQ_MODEL
         self.company_info = get_company_info()
 
+        # Compiled system prompts per page context, keyed to the knowledge
+        # they were built from
+        self._prompt_cache: Dict[str, Dict[str, Any]] = {}
+        self._prompt_fingerprint: Optional[str] = None
+        self.prompt_usage = {
+            "requests": 0,
+            "prompt_tokens": 0,
+            "max_prompt_tokens": 0,
+            "history_messages_trimmed": 0,
+            "knowledge_chunks": 0,
+            "knowledge_tokens": 0,
+        }
+
+        # Replies to opening messages, shared by every visitor on the same page
+        self.response_cache = TTLCache(
+            max_entries=settings.RESPONSE_CACHE_MAX_ENTRIES,
+            ttl_seconds=settings.RESPONSE_CACHE_TTL_SECONDS,
+        )
+
+        # Fails calls fast while Groq is erroring or slow
+        self.breaker = CircuitBreaker(
+            "groq",
+            failure_threshold=settings.CIRCUIT_FAILURE_THRESHOLD,
+            slow_call_seconds=settings.CIRCUIT_SLOW_CALL_SECONDS,
+            reset_seconds=settings.CIRCUIT_RESET_SECONDS,
+        )
+        self.degraded_cache_hits = 0
+
+        # Identical prompts in flight at the same time share one upstream call
+        self.single_flight = SingleFlight()
+
+    async def aclose(self):
+        """Close pooled HTTP connections"""
+        await self.client.close()
+
+    def get_system_prompt(self, page_context: str = "home") -> Dict[str, Any]:
+        """
+        Get the compiled system prompt for a page context
+
+        Prompts for every known page context are built once and reused; they
+        are rebuilt only when the company knowledge they embed changes (see
+        _prompt_inputs_fingerprint).
+
+        Args:
+            page_context: Page the user is on (unknown pages fall back to home)
+
+        Returns:
+            {"text": prompt, "tokens": estimated token count}
+        """
+        fingerprint = self._prompt_inputs_fingerprint()
+        if fingerprint != self._prompt_fingerprint:
+            self._prompt_cache = {}
+            for page in PAGE_CONTEXTS:
+                text = self._build_system_prompt(page)
+                self._prompt_cache[page] = {"text": text, "tokens": estimate_tokens(text)}
+            self._prompt_fingerprint = fingerprint
+
+        return self._prompt_cache.get(page_context, self._prompt_cache["home"])
+
+    @staticmethod
+    def _prompt_inputs_fingerprint() -> str:
+        """
+        Hash of the company knowledge the system prompts are built from
+
+        Covers the whole company_info module data, not just the values the
+        prompt text quotes today, so an edit anywhere in it (e.g. a reload
+        in development) rebuilds the prompts.
+        """
+        payload = json.dumps(
+            {
+                "elevator_pitch": company_info.get_elevator_pitch(),
+                "company_info": company_info.get_company_info(),
+            },
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def prompt_stats(self) -> Dict[str, Any]:
+        """Report cached prompt sizes and per-request prompt token usage"""
+        self.get_system_prompt()
+        requests = self.prompt_usage["requests"]
+        return {
+            "system_prompt_tokens": {
+                page: prompt["tokens"] for page, prompt in self._prompt_cache.items()
+            },
+            "prompt_token_budget": settings.PROMPT_TOKEN_BUDGET,
+            "avg_prompt_tokens": round(self.prompt_usage["prompt_tokens"] / requests)
+            if requests
+            else 0,
+            **self.prompt_usage,
+        }
+
+    def _response_cache_key(
+        self, user_message: str, conversation_history: list = None, context: dict = None
+    ) -> Optional[tuple]:
+        """
+        Cache key for a turn's reply, or None if the turn is not cacheable
+
+        Only opening turns are cached: no history and no qualification, lead
+        or booking state, so the prompt depends solely on the page, the
+        message and the seminar snapshot. Without a snapshot version there is
+        nothing to expire the reply with, so the turn is not cached.
+        """
+        context = context or {}
+        if (
+            context.get("seminar_version") is None
+            or conversation_history
+            or context.get("conversation_summary")
+            or context.get("qualification_progress")
+            or context.get("qualification_answers")
+            or context.get("lead_score")
+            or context.get("appointment_booked")
+        ):
+            return None
+        return self._message_cache_key(user_message, context)
+
+    @staticmethod
+    def _message_cache_key(user_message: str, context: dict) -> Optional[tuple]:
+        """Cache key for a message on a page: (page, normalized message)"""
+        normalized = " ".join(re.sub(r"[^\w\s$']", " ", user_message.lower()).split())
+        if not normalized or len(normalized) > settings.RESPONSE_CACHE_MAX_MESSAGE_CHARS:
+            return None
+
+        page = context.get("page", "home")
+        return (page if page in PAGE_CONTEXTS else "home", normalized)
+
+    def cached_response(self, user_message: str, context: dict = None) -> Optional[str]:
+        """
+        Cached reply to the same message on the same page, ignoring conversation state
+
+        Only for degraded mode: when Groq is unavailable, a reply cached for an
+        opening turn beats the generic fallback.
+
+        Args:
+            user_message: User's current message
+            context: Turn context (page, seminar_version)
+
+        Returns:
+            Cached reply, or None
+        """
+        context = context or {}
+        cache_key = self._message_cache_key(user_message, context)
+        if not cache_key or context.get("seminar_version") is None:
+            return None
+
+        cached = self.response_cache.get(cache_key, context.get("seminar_version"))
+        if cached is not None:
+            self.degraded_cache_hits += 1
+        return cached
+
+    def resilience_stats(self) -> Dict[str, Any]:
+        """Report circuit breaker state and degraded-mode cache use"""
+        return {
+            **self.breaker.stats(),
+            "degraded_cache_hits": self.degraded_cache_hits,
+        }
+
+    async def _create_completion(self, deadline: Optional[Deadline] = None, **kwargs):
+        """
+        Call the chat completions API under the circuit breaker
+
+        The call gets what is left of the request deadline, capped at
+        GROQ_CALL_TIMEOUT_SECONDS, as both the HTTP timeout and a hard
+        wall-clock limit.
+
+        Non-streaming calls are coalesced by prompt hash (SINGLE_FLIGHT_ENABLED):
+        a request identical to one already in flight waits for that call's
+        result, within the first caller's timeout, instead of making its own.
+
+        Args:
+            deadline: Request deadline (None = just the per-call cap)
+            **kwargs: chat.completions.create arguments (model is filled in)
+
+        Returns:
+            Completion, or the stream if stream=True
+
+        Raises:
+            CircuitOpenError: The breaker is open
+            DeadlineExceeded: Too little time left, or the call timed out
+        """
+        timeout = settings.GROQ_CALL_TIMEOUT_SECONDS
+        if deadline:
+            timeout = deadline.timeout(timeout, minimum=settings.GROQ_MIN_CALL_SECONDS)
+
+        async def call():
+            return await self.breaker.call(
+                self.client.chat.completions.create(
+                    model=self.model, timeout=timeout, **kwargs
+                ),
+                timeout,
+            )
+
+        if kwargs.get("stream") or not settings.SINGLE_FLIGHT_ENABLED:
+            return await call()
+        return await self.single_flight.do(self._prompt_hash(kwargs), call)
+
+    def _prompt_hash(self, request: Dict[str, Any]) -> str:
+        """Identity of a completion request: model, messages and sampling parameters"""
+        payload = json.dumps({"model": self.model, **request}, sort_keys=True)
+        return hashlib.sha256(payload.encode()).hexdigest()
+
     def _build_system_prompt(self, page_context: str = "home"):
         """Build comprehensive system prompt with knowledge base"""
         
@@ -63,16 +286,6 @@ DON'T just tell them to click - SELL them on WHY they should click NOW:
 - "Tax rules are changing January 1st - this info could save you thousands"
 - "Every seminar, someone discovers they're making a costly mistake - I'd hate for you to keep making it"
 
-AVAILABLE SEMINAR TOPICS (check left side for current schedule):
--  Retirement Planning Strategies - Social Security optimization, withdrawal strategies, guaranteed income
--  Understanding Annuities - Fixed, Variable, and Indexed annuities explained clearly
--  Social Security Maximization - Boost benefits by up to 76%, spousal strategies, timing
--  Tax-Efficient Retirement - Roth conversions, QCDs, smart withdrawal sequencing
--  Medicare & Healthcare Costs - Navigate enrollment, coverage options, planning strategies
--  Estate Planning Basics - Wills, trusts, powers of attorney, legacy protection
--  Market Volatility Protection - Protect savings from downturns, guaranteed income
--  Women & Retirement - Unique challenges: longevity, career gaps, healthcare needs
-
 HOW TO REGISTER (IMPORTANT):
 When user wants to register:
 1. Say: "Great choice! To register, simply **click on the seminar card on the left side of the page**"
@@ -400,7 +613,7 @@ What's your biggest retirement worry?"
 {context_text}
 
 ABOUT PROVISION BROKERAGE (YOUR COMPANY):
-{get_elevator_pitch()}
+{company_info.get_elevator_pitch()}
 
 OUR SERVICES:
 - FREE Retirement Planning Consultations
@@ -445,13 +658,9 @@ HOW TO QUALIFY LEADS:
 - High-value leads: 50+, $100k+ assets, specific concerns, ready to act
 - Offer appointments to qualified leads
 
-ANNUITY KNOWLEDGE (You're an expert):
-- **Fixed Annuities**: Guaranteed interest rate, no market risk, predictable growth
-- **Variable Annuities**: Investments in market, potential for higher returns, more risk
-- **Fixed Indexed Annuities**: Linked to index (S&P 500), growth potential with downside protection
-- **Income Riders**: Add-on for guaranteed lifetime income
-- **Best for**: People worried about outliving their money, want guaranteed income, risk-averse
-- **Not for**: Those needing full liquidity, short-term (surrender charges apply)
+PRODUCT & PLANNING FACTS:
+- Use the RELEVANT KNOWLEDGE message (retrieved for each question) for facts about annuities, retirement planning and seminar topics
+- Put it in your own words - short and punchy
 
 IMPORTANT RULES:
 1. **Keep it SHORT**: 2-4 sentences MAX per response. Think text message, not email
@@ -476,24 +685,6 @@ When are you planning to retire?"
 
 ---
 
-User: "What's an annuity?"
-Sarah: "Think of it as a personal pension. You give money to an insurance company, they guarantee you income for life.
-
-Market crashes? Doesn't matter. You get paid.
-
-Is guaranteed income something you're looking for?"
-
----
-
-User: "How much do you charge?"
-Sarah: "First consultation is FREE - zero obligation.
-
-After that, it depends on what you choose. Some products pay us (not you), others have advisory fees. Always transparent upfront.
-
-Want to schedule a quick 30-min call?"
-
----
-
 User: "I'm 55 and have $200k in my 401k"
 Sarah: "Perfect timing - this is when planning makes the BIGGEST difference.
 
@@ -538,8 +729,80 @@ We have one Thursday - only 4 seats left. Want one?"
 THINK: "How would I text this to a friend?" Keep it human, brief, and engaging.
 """
 
-    def generate_response(
+    def _build_messages(
         self, user_message: str, conversation_history: list = None, context: dict = None
+    ) -> list:
+        """
+        Assemble the chat completion messages array for a turn
+
+        Oldest history messages are dropped if the prompt would exceed
+        PROMPT_TOKEN_BUDGET.
+        """
+        # Extract page context
+        page_context = "home"
+        if context and "page" in context:
+            page_context = context["page"]
+
+        # Cached system prompt for this page
+        system_prompt = self.get_system_prompt(page_context)
+
+        # Conversation history (limit to recent messages)
+        # Filter out timestamp and metadata fields that Groq API doesn't accept
+        history = [
+            {"role": msg["role"], "content": msg["content"]}
+            for msg in (conversation_history or [])[-settings.MAX_CONVERSATION_HISTORY :]
+        ]
+
+        # Knowledge retrieved for this message, then context as system messages
+        context_messages = []
+        knowledge_msg = self._build_knowledge_message(user_message)
+        if knowledge_msg:
+            context_messages.append({"role": "system", "content": knowledge_msg})
+        if context:
+            context_msg = self._build_context_message(context)
+            if context_msg:
+                context_messages.append({"role": "system", "content": context_msg})
+
+        # Current user message plus final reminder to keep responses SHORT
+        closing_messages = [
+            {"role": "user", "content": user_message},
+            {
+                "role": "system",
+                "content": "REMINDER: Keep your response SHORT (2-4 sentences max). Use line breaks. Sound like you're texting, not writing an essay. Be punchy and direct.",
+            },
+        ]
+
+        # Enforce the prompt token budget by trimming the oldest history
+        fixed_tokens = system_prompt["tokens"] + estimate_message_tokens(
+            context_messages + closing_messages
+        )
+        history_tokens = estimate_message_tokens(history)
+        while history and fixed_tokens + history_tokens > settings.PROMPT_TOKEN_BUDGET:
+            history_tokens -= estimate_message_tokens(history[:1])
+            history.pop(0)
+            self.prompt_usage["history_messages_trimmed"] += 1
+
+        prompt_tokens = fixed_tokens + history_tokens
+        self.prompt_usage["requests"] += 1
+        self.prompt_usage["prompt_tokens"] += prompt_tokens
+        self.prompt_usage["max_prompt_tokens"] = max(
+            self.prompt_usage["max_prompt_tokens"], prompt_tokens
+        )
+
+        return (
+            [{"role": "system", "content": system_prompt["text"]}]
+            + history
+            + context_messages
+            + closing_messages
+        )
+
+    async def generate_response(
+        self,
+        user_message: str,
+        conversation_history: list = None,
+        context: dict = None,
+        fallback: bool = True,
+        deadline: Optional[Deadline] = None,
     ) -> str:
         """
         Generate AI response using Groq
@@ -548,68 +811,155 @@ THINK: "How would I text this to a friend?" Keep it human, brief, and engaging.
             user_message: User's current message
             conversation_history: List of previous messages
             context: Additional context (qualification_progress, page, etc.)
+            fallback: Return the fallback response on failure instead of raising
+            deadline: Request deadline bounding the Groq call
 
         Returns:
             AI-generated response
         """
+        cache_key = self._response_cache_key(user_message, conversation_history, context)
+        seminar_version = (context or {}).get("seminar_version")
+        if cache_key:
+            cached = self.response_cache.get(cache_key, seminar_version)
+            if cached is not None:
+                return cached
+
         try:
-            # Extract page context
-            page_context = "home"
-            if context and "page" in context:
-                page_context = context["page"]
-            
-            # Build messages array with page context
-            messages = [{"role": "system", "content": self._build_system_prompt(page_context)}]
-
-            # Add conversation history (limit to recent messages)
-            if conversation_history:
-                recent_history = conversation_history[
-                    -settings.MAX_CONVERSATION_HISTORY :
-                ]
-                # Filter out timestamp and metadata fields that Groq API doesn't accept
-                filtered_history = [
-                    {"role": msg["role"], "content": msg["content"]}
-                    for msg in recent_history
-                ]
-                messages.extend(filtered_history)
-
-            # Add context as system message if provided
-            if context:
-                context_msg = self._build_context_message(context)
-                if context_msg:
-                    messages.append({"role": "system", "content": context_msg})
-
-            # Add current user message
-            messages.append({"role": "user", "content": user_message})
-            
-            # Add final reminder to keep responses SHORT
-            messages.append({
-                "role": "system", 
-                "content": "REMINDER: Keep your response SHORT (2-4 sentences max). Use line breaks. Sound like you're texting, not writing an essay. Be punchy and direct."
-            })
+            messages = self._build_messages(user_message, conversation_history, context)
 
             # Call Groq API
-            response = self.client.chat.completions.create(
-                model=self.model,
+            response = await self._create_completion(
+                deadline,
                 messages=messages,
                 temperature=settings.AI_TEMPERATURE,
                 max_tokens=settings.AI_MAX_TOKENS,
             )
 
-            return response.choices[0].message.content
+            content = response.choices[0].message.content
+            if cache_key and content:
+                self.response_cache.put(cache_key, content, seminar_version)
+            return content
 
         except Exception as e:
+            if not fallback:
+                raise
             print(f"❌ ERROR generating response: {type(e).__name__}: {str(e)}")
-            print(f"   Model: {self.model}")
-            print(f"   API Key set: {bool(settings.GROQ_API_KEY)}")
-            import traceback
-            traceback.print_exc()
             return self._fallback_response()
 
+    async def stream_response(
+        self,
+        user_message: str,
+        conversation_history: list = None,
+        context: dict = None,
+        fallback: bool = True,
+        deadline: Optional[Deadline] = None,
+    ) -> AsyncIterator[str]:
+        """
+        Stream AI response tokens from Groq as they are generated
+
+        Closing the generator (e.g. on client disconnect) closes the
+        upstream HTTP stream, which cancels the completion.
+
+        Args:
+            user_message: User's current message
+            conversation_history: List of previous messages
+            context: Additional context (qualification_progress, page, etc.)
+            fallback: Yield the fallback response if the call cannot start
+                instead of raising
+            deadline: Request deadline bounding time to the first token (the
+                per-call timeout also bounds each gap between chunks)
+
+        Yields:
+            Text deltas (a cached reply is yielded as a single delta)
+        """
+        cache_key = self._response_cache_key(user_message, conversation_history, context)
+        seminar_version = (context or {}).get("seminar_version")
+        if cache_key:
+            cached = self.response_cache.get(cache_key, seminar_version)
+            if cached is not None:
+                yield cached
+                return
+
+        messages = self._build_messages(user_message, conversation_history, context)
+
+        try:
+            stream = await self._create_completion(
+                deadline,
+                messages=messages,
+                temperature=settings.AI_TEMPERATURE,
+                max_tokens=settings.AI_MAX_TOKENS,
+                stream=True,
+            )
+        except Exception as e:
+            if not fallback:
+                raise
+            print(f"❌ ERROR starting response stream: {type(e).__name__}: {str(e)}")
+            yield self._fallback_response()
+            return
+
+        chunks = []
+        try:
+            async for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    chunks.append(chunk.choices[0].delta.content)
+                    yield chunk.choices[0].delta.content
+        except Exception:
+            self.breaker.record_failure()
+            raise
+        finally:
+            await stream.close()
+
+        # Only a fully received reply is cached
+        if cache_key and chunks:
+            self.response_cache.put(cache_key, "".join(chunks), seminar_version)
+
+    def _build_knowledge_message(self, user_message: str) -> str:
+        """
+        Retrieve the knowledge chunks most relevant to the user message
+
+        Chunks are added best-first until RAG_TOKEN_BUDGET is spent; the last
+        one is cut at a word boundary if it does not fit. Nothing is added when
+        the best match scores below RAG_MIN_SCORE (small talk, plain answers).
+
+        Args:
+            user_message: User's current message
+
+        Returns:
+            System message text, or "" if nothing relevant was found
+        """
+        results = search_knowledge(user_message, k=settings.RAG_TOP_K)
+        if not results or results[0]["score"] < settings.RAG_MIN_SCORE:
+            return ""
+        # Weak matches trailing a strong one are more noise than help
+        results = [r for r in results if r["score"] >= results[0]["score"] / 2]
+
+        chunks = []
+        remaining = settings.RAG_TOKEN_BUDGET
+        for result in results:
+            chunk = f"- {result['title']}: {result['text']}"
+            tokens = estimate_tokens(chunk)
+            if tokens > remaining:
+                if remaining < 40:
+                    break
+                chunk = chunk[: remaining * 4].rsplit(" ", 1)[0] + "..."
+                tokens = estimate_tokens(chunk)
+            chunks.append(chunk)
+            remaining -= tokens
+
+        if not chunks:
+            return ""
+
+        self.prompt_usage["knowledge_chunks"] += len(chunks)
+        self.prompt_usage["knowledge_tokens"] += settings.RAG_TOKEN_BUDGET - remaining
+        return "RELEVANT KNOWLEDGE (facts for this question):\n" + "\n".join(chunks)
+
     def _build_context_message(self, context: dict) -> str:
         """Build context message from qualification data"""
         parts = []
 
+        if context.get("conversation_summary"):
+            parts.append(f"Summary of earlier conversation: {context['conversation_summary']}")
+
         if context.get("qualification_progress", 0) > 0:
             parts.append(
                 f"Qualification Progress: {context['qualification_progress']}/7 questions answered"
@@ -654,7 +1004,9 @@ THINK: "How would I text this to a friend?" Keep it human, brief, and engaging.
             "Would you like to schedule a call, or would you prefer to call us at 1-800-XXX-XXXX?"
         )
 
-    def extract_qualification_intent(self, user_message: str) -> dict:
+    async def extract_qualification_intent(
+        self, user_message: str, deadline: Optional[Deadline] = None
+    ) -> dict:
         """
         Analyze user message to extract qualification information
         Uses AI to understand intent and extract structured data
@@ -664,6 +1016,7 @@ THINK: "How would I text this to a friend?" Keep it human, brief, and engaging.
 Extract any mentioned:
 - Age or age range
 - Retirement timeline
+- US state of residence
 - Assets or savings amount
 - Current annuity status
 - Concerns (income, growth, legacy, taxes, healthcare)
@@ -675,6 +1028,7 @@ Respond ONLY with valid JSON:
 {{
   "age_range": "31-50" or null,
   "retirement_timeline": "6-10 years" or null,
+  "state": "Florida" or null,
   "investable_assets": "500k-1M" or null,
   "current_annuity": "yes/no/unsure" or null,
   "concerns": "income" or null,
@@ -682,8 +1036,8 @@ Respond ONLY with valid JSON:
 }}
 """
 
-            response = self.client.chat.completions.create(
-                model=self.model,
+            response = await self._create_completion(
+                deadline,
                 messages=[
                     {
                         "role": "system",
@@ -700,26 +1054,71 @@ Respond ONLY with valid JSON:
             # Remove null values
             return {k: v for k, v in extracted.items() if v}
 
+        except UpstreamUnavailableError:
+            return {}
         except Exception as e:
             print(f"Error extracting qualification intent: {e}")
             return {}
 
+    async def summarize_conversation(
+        self, previous_summary: Optional[str], messages: List[Dict[str, Any]]
+    ) -> str:
+        """
+        Fold older conversation messages into a rolling summary
+
+        Args:
+            previous_summary: Existing summary (None for the first one)
+            messages: Messages to fold in, oldest first ({"role", "content"})
+
+        Returns:
+            Updated summary, or "" if summarization failed
+        """
+        try:
+            transcript = "\n".join(
+                f"{message['role'].upper()}: {message['content']}" for message in messages
+            )
+            prompt = f"""Update the running summary of a chat between a retirement planning assistant (Sarah) and a website visitor.
+
+Current summary:
+{previous_summary or "(none yet)"}
+
+New messages:
+{transcript}
+
+Write the updated summary in at most 120 words. Keep every fact the visitor shared (age, retirement timeline, state, assets, annuity status, concerns, goals, family, names, seminars or appointments discussed), questions still open and commitments Sarah made. Drop greetings and small talk. Respond with the summary text only."""
+
+            response = await self._create_completion(
+                messages=[
+                    {
+                        "role": "system",
+                        "content": "You summarize conversations accurately and concisely.",
+                    },
+                    {"role": "user", "content": prompt},
+                ],
+                temperature=0.1,
+                max_tokens=settings.SUMMARY_MAX_TOKENS,
+            )
+
+            return (response.choices[0].message.content or "").strip()
+
+        except Exception as e:
+            print(f"Error summarizing conversation: {e}")
+            return ""
+
     def search_knowledge_base(self, query: str) -> str:
-        """Search knowledge base for relevant information"""
-        # Search FAQ
-        faq_results = search_faq(query)
-        if faq_results:
-            top_result = faq_results[0]
-            return f"**{top_result['question']}**\n\n{top_result['answer']}"
-
-        # If no FAQ found, return None (AI will use general knowledge)
+        """Search knowledge base for the most relevant entry (BM25 ranked)"""
+        results = search_knowledge(query, k=1)
+        if results:
+            top_result = results[0]
+            return f"**{top_result['title']}**\n\n{top_result['text']}"
+
+        # If nothing matches, return None (AI will use general knowledge)
         return None
 
-    def test_connection(self) -> bool:
+    async def test_connection(self) -> bool:
         """Test Groq API connection"""
         try:
-            response = self.client.chat.completions.create(
-                model=self.model,
+            response = await self._create_completion(
                 messages=[
                     {"role": "user", "content": "Say 'connected' if you can read this"}
                 ],
@@ -732,29 +1131,34 @@ Respond ONLY with valid JSON:
 
 
 if __name__ == "__main__":
-    # Test the service
-    print("Testing Groq Service...")
-    print("=" * 60)
-
-    service = GroqService()
-
-    # Test connection
-    print("\n[1/2] Testing connection...")
-    if service.test_connection():
-        print(" Connected to Groq API successfully")
-    else:
-        print(" Connection failed")
-        exit(1)
-
-    # Test response generation
-    print("\n[2/2] Testing response generation...")
-    response = service.generate_response(
-        "Hi, I'm interested in learning about retirement planning",
-        conversation_history=[],
-        context={},
-    )
-    print(f" Response generated ({len(response)} characters)")
-    print(f"\nSample response:\n{response[:200]}...")
-
-    print("\n" + "=" * 60)
-    print(" Groq Service is working!")
+    import asyncio
+
+    async def test_groq_service():
+        """Test Groq service against the live API."""
+        print("Testing Groq Service...")
+        print("=" * 60)
+
+        service = GroqService()
+
+        # Test connection
+        print("\n[1/2] Testing connection...")
+        if await service.test_connection():
+            print(" Connected to Groq API successfully")
+        else:
+            print(" Connection failed")
+            exit(1)
+
+        # Test response generation
+        print("\n[2/2] Testing response generation...")
+        response = await service.generate_response(
+            "Hi, I'm interested in learning about retirement planning",
+            conversation_history=[],
+            context={},
+        )
+        print(f" Response generated ({len(response)} characters)")
+        print(f"\nSample response:\n{response[:200]}...")
+
+        print("\n" + "=" * 60)
+        print(" Groq Service is working!")
+
+    asyncio.run(test_groq_service())
@@ -0,0 +1,114 @@
+"""
+Intent Router - Answers that don't need the LLM
+Serves FAQ questions straight from the knowledge base when the semantic
+matcher is confident, so the turn skips the Groq completion entirely. Also
+supplies best-effort knowledge answers while Groq is unavailable.
+"""
+
+import re
+from typing import Any, Dict, Optional
+
+from core.config import settings
+from knowledge.search_index import search_knowledge
+from knowledge.semantic_matcher import SemanticMatcher, semantic_matcher
+from services.qualification_service import QualificationService
+
+_QUESTION_PATTERN = re.compile(
+    r"^(?:what|what's|whats|how|when|where|why|who|which|can|could|do|does|did|is|are|"
+    r"will|would|should|may)\b"
+)
+
+
+class IntentRouter:
+    """Decides per turn whether a canned knowledge-base answer is enough."""
+
+    def __init__(
+        self,
+        qualification_service: QualificationService,
+        matcher: SemanticMatcher = semantic_matcher,
+    ):
+        self.qualification_service = qualification_service
+        self.matcher = matcher
+        self.counts = {"routed": 0, "llm": 0, "degraded": 0, "degraded_unanswered": 0}
+
+    def route(self, message: str, qualification_progress: int = 0) -> Optional[str]:
+        """
+        Answer a message from the FAQ if it is clearly one of its questions.
+
+        Only messages phrased as questions are considered, and the best FAQ
+        match must clear FAQ_MATCH_THRESHOLD and beat the runner-up by
+        FAQ_MATCH_MARGIN. The pending qualification question is appended so
+        the conversation keeps moving, as the LLM would.
+
+        Args:
+            message: User message
+            qualification_progress: Questions answered so far
+
+        Returns:
+            Reply text, or None if the LLM should answer
+        """
+        text = message.strip().lower()
+        if not (text.endswith("?") or _QUESTION_PATTERN.match(text)):
+            self.counts["llm"] += 1
+            return None
+
+        matches = self.matcher.match(text, k=2, source="faq")
+        best = matches[0][0] if matches else 0.0
+        runner_up = matches[1][0] if len(matches) > 1 else 0.0
+        if best < settings.FAQ_MATCH_THRESHOLD or best - runner_up < settings.FAQ_MATCH_MARGIN:
+            self.counts["llm"] += 1
+            return None
+
+        self.counts["routed"] += 1
+        return self._with_next_question(
+            matches[0][1]["payload"]["answer"], qualification_progress
+        )
+
+    def degraded_reply(self, message: str, qualification_progress: int = 0) -> Optional[str]:
+        """
+        Best knowledge-base answer for when the LLM is unavailable.
+
+        Looser than route(): any message form, and no margin over the
+        runner-up. Falls back to BM25 over the FAQ when no paraphrase matches.
+
+        Args:
+            message: User message
+            qualification_progress: Questions answered so far
+
+        Returns:
+            Reply text, or None if the knowledge base has nothing relevant
+        """
+        text = message.strip().lower()
+        answer = None
+
+        matches = self.matcher.match(
+            text, k=1, source="faq", min_score=settings.FAQ_MATCH_THRESHOLD
+        )
+        if matches:
+            answer = matches[0][1]["payload"]["answer"]
+        else:
+            results = search_knowledge(text, k=1, source="faq")
+            if results and results[0]["score"] >= settings.RAG_MIN_SCORE:
+                answer = results[0]["payload"]["answer"]
+
+        if not answer:
+            self.counts["degraded_unanswered"] += 1
+            return None
+
+        self.counts["degraded"] += 1
+        return self._with_next_question(answer, qualification_progress)
+
+    def _with_next_question(self, answer: str, qualification_progress: int) -> str:
+        """Append the pending qualification question so the conversation keeps moving"""
+        next_question = self.qualification_service.get_next_question(qualification_progress)
+        if next_question:
+            return f"{answer}\n\n{next_question['question']}"
+        return answer
+
+    def stats(self) -> Dict[str, Any]:
+        """Report how many turns skipped the LLM, and degraded-mode answers"""
+        total = self.counts["routed"] + self.counts["llm"]
+        return {
+            **self.counts,
+            "routed_rate": round(self.counts["routed"] / total, 3) if total else 0.0,
+        }
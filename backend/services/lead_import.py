@@ -0,0 +1,466 @@
+"""
+Lead Import - Bulk lead loading from CSV and JSON Lines files
+Rows are parsed as the file streams in, scored with QualificationService and
+written in batches (locked UPDATE of stored leads, INSERT ... ON CONFLICT
+(email) DO NOTHING for new ones), so a file of tens of thousands of leads
+costs a few statements per batch instead of a lookup and a commit per lead.
+"""
+
+import csv
+import io
+import json
+from collections import Counter
+from datetime import datetime
+from typing import Any, Dict, Iterable, Iterator, List, Optional, TextIO, Tuple, Union
+
+from sqlalchemy import bindparam, select, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from core.config import settings
+from models.lead import Lead
+from models.lead_status_count import adjust_status_count
+from services.qualification_service import QualificationService
+from utils.emails import EmailNotValidError, normalize_email
+
+FORMATS = ("csv", "jsonl")
+
+CONTENT_TYPES = {
+    "text/csv": "csv",
+    "application/csv": "csv",
+    "application/x-ndjson": "jsonl",
+    "application/jsonl": "jsonl",
+    "application/x-jsonlines": "jsonl",
+}
+
+# Qualification answers: mapped onto the question options, then scored
+QUALIFICATION_FIELDS = (
+    "state",
+    "age_range",
+    "retirement_timeline",
+    "investable_assets",
+    "current_annuity",
+    "concerns",
+    "goals",
+)
+CONTACT_FIELDS = ("name", "phone")
+
+# Columns an import overwrites on an existing lead (source and UTM are kept)
+UPDATE_COLUMNS = (
+    *CONTACT_FIELDS,
+    *QUALIFICATION_FIELDS,
+    "lead_score",
+    "qualification_status",
+    "updated_at",
+)
+
+# Rejected rows listed in the summary (the count covers all of them)
+MAX_REPORTED_ERRORS = 100
+
+def import_format(
+    requested: Optional[str] = None,
+    content_type: Optional[str] = None,
+    filename: Optional[str] = None,
+) -> str:
+    """
+    Pick the file format: explicit, else from the content type or extension.
+
+    Args:
+        requested: "csv" or "jsonl"
+        content_type: Content-Type header of an upload
+        filename: File name (.csv, .jsonl, .ndjson)
+
+    Returns:
+        "csv" or "jsonl"
+
+    Raises:
+        ValueError: Unknown or undetectable format
+    """
+    if requested:
+        if requested.lower() not in FORMATS:
+            raise ValueError(f"Unknown format {requested!r} (expected csv or jsonl)")
+        return requested.lower()
+
+    if content_type:
+        detected = CONTENT_TYPES.get(content_type.split(";")[0].strip().lower())
+        if detected:
+            return detected
+
+    if filename:
+        extension = filename.rsplit(".", 1)[-1].lower()
+        if extension in ("csv", "jsonl", "ndjson"):
+            return "csv" if extension == "csv" else "jsonl"
+
+    raise ValueError("Cannot tell the file format; pass format=csv or format=jsonl")
+
+
+class _ChunkReader(io.RawIOBase):
+    """Readable binary stream over an iterator of byte chunks"""
+
+    def __init__(self, chunks: Iterable[bytes]):
+        self._chunks = iter(chunks)
+        self._pending = memoryview(b"")
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        while not self._pending:
+            try:
+                self._pending = memoryview(next(self._chunks))
+            except StopIteration:
+                return 0
+        size = min(len(buffer), len(self._pending))
+        buffer[:size] = self._pending[:size]
+        self._pending = self._pending[size:]
+        return size
+
+
+def text_stream(chunks: Iterable[bytes]) -> TextIO:
+    """
+    UTF-8 text stream over byte chunks (e.g. a request body) as they arrive.
+
+    Args:
+        chunks: Byte chunks in order
+
+    Returns:
+        Text stream suitable for import_stream
+    """
+    return io.TextIOWrapper(
+        io.BufferedReader(_ChunkReader(chunks)), encoding="utf-8-sig", newline=""
+    )
+
+
+def _text(value: Any) -> Optional[str]:
+    """Stripped string, or None for missing / blank values"""
+    if value is None:
+        return None
+    value = str(value).strip()
+    return value or None
+
+
+class LeadImporter:
+    """Streams lead rows from a file into batched upserts keyed by email."""
+
+    def __init__(
+        self,
+        db: Session,
+        default_source: str = "import",
+        batch_size: Optional[int] = None,
+    ):
+        """
+        Args:
+            db: Database session (each batch is committed on it)
+            default_source: Source for rows without a source column
+            batch_size: Rows per upsert (default LEAD_IMPORT_BATCH_SIZE)
+        """
+        self.db = db
+        self.default_source = default_source
+        self.batch_size = batch_size or settings.LEAD_IMPORT_BATCH_SIZE
+        self.qualification_service = QualificationService()
+
+    def import_stream(self, stream: TextIO, fmt: str) -> Dict[str, Any]:
+        """
+        Import every row of a CSV (with header) or JSON Lines stream.
+
+        Rows are validated and scored one by one and written a batch at a
+        time; each batch is committed, so rows in earlier batches stay
+        imported if a later one fails. An email already in the database (or
+        earlier in the file) updates that lead: given fields replace stored
+        ones, missing fields are kept, and the score is recalculated when
+        any qualification answer is given.
+
+        Args:
+            stream: Text stream of the file
+            fmt: "csv" or "jsonl"
+
+        Returns:
+            Summary: rows, inserted, updated, rejected, batches and the first
+            MAX_REPORTED_ERRORS rejections ({"row", "error"}; rows numbered
+            from 1, not counting the CSV header)
+
+        Raises:
+            ValueError: Unknown format, CSV without an email column, or a
+                file that cannot be decoded or parsed
+        """
+        summary = {
+            "rows": 0,
+            "inserted": 0,
+            "updated": 0,
+            "rejected": 0,
+            "batches": 0,
+            "errors": [],
+        }
+        batch: Dict[str, Tuple[List[int], Dict[str, Any]]] = {}
+
+        for number, record in self._records(stream, fmt):
+            summary["rows"] += 1
+            try:
+                lead = self._parse(record)
+            except ValueError as e:
+                self._reject(summary, number, str(e))
+                continue
+
+            previous = batch.get(lead["email"])
+            if previous:
+                # Repeated email in the batch: later fields win
+                previous[0].append(number)
+                previous[1].update(lead)
+            else:
+                batch[lead["email"]] = ([number], lead)
+
+            if len(batch) >= self.batch_size:
+                self._flush(batch, summary)
+                batch = {}
+
+        if batch:
+            self._flush(batch, summary)
+
+        return summary
+
+    def _records(self, stream: TextIO, fmt: str) -> Iterator[Tuple[int, Union[str, dict]]]:
+        """(row number, CSV dict or JSON line) pairs, parsed as the stream is read"""
+        if fmt == "jsonl":
+            number = 0
+            for line in stream:
+                if line.strip():
+                    number += 1
+                    yield number, line
+            return
+
+        if fmt != "csv":
+            raise ValueError(f"Unknown format {fmt!r} (expected csv or jsonl)")
+
+        reader = csv.DictReader(stream)
+        try:
+            fieldnames = [name.strip().lower() for name in reader.fieldnames or []]
+            if "email" not in fieldnames:
+                raise ValueError("CSV header has no email column")
+            reader.fieldnames = fieldnames
+            for number, row in enumerate(reader, start=1):
+                yield number, row
+        except csv.Error as e:
+            raise ValueError(f"CSV parse error on line {reader.line_num}: {e}") from e
+
+    def _parse(self, record: Union[str, dict]) -> Dict[str, Any]:
+        """
+        Validate one row and map it onto lead columns.
+
+        Raises:
+            ValueError: The row cannot be imported (reason in the message)
+        """
+        if isinstance(record, str):
+            try:
+                record = json.loads(record)
+            except json.JSONDecodeError as e:
+                raise ValueError(f"Invalid JSON: {e.msg}")
+            if not isinstance(record, dict):
+                raise ValueError("JSON line is not an object")
+            record = {str(key).strip().lower(): value for key, value in record.items()}
+
+        email = _text(record.get("email"))
+        if not email:
+            raise ValueError("Missing email")
+        try:
+            email = normalize_email(email)
+        except EmailNotValidError as e:
+            raise ValueError(f"Invalid email: {e}")
+
+        lead = {"email": email}
+        for field in CONTACT_FIELDS:
+            value = _text(record.get(field))
+            if value:
+                lead[field] = value
+        for field in QUALIFICATION_FIELDS:
+            value = _text(record.get(field))
+            if value:
+                lead[field] = self.qualification_service.normalize_answer(field, value)
+
+        source = _text(record.get("source"))
+        if source:
+            lead["source"] = source
+
+        utm_params = record.get("utm_params")
+        if not isinstance(utm_params, dict):
+            utm_params = {
+                key: _text(value)
+                for key, value in record.items()
+                if key and key.startswith("utm_") and _text(value)
+            }
+        if utm_params:
+            lead["utm_params"] = utm_params
+
+        columns = Lead.__table__.c
+        for field, value in lead.items():
+            length = getattr(columns[field].type, "length", None)
+            if length and isinstance(value, str) and len(value) > length:
+                raise ValueError(f"{field} is longer than {length} characters")
+
+        return lead
+
+    def _flush(
+        self, batch: Dict[str, Tuple[List[int], Dict[str, Any]]], summary: Dict[str, Any]
+    ) -> None:
+        """Upsert one batch and commit; on a database error reject the whole batch"""
+        summary["batches"] += 1
+        try:
+            inserted, updated = self._write(batch)
+            self.db.commit()
+        except SQLAlchemyError as e:
+            self.db.rollback()
+            reason = f"Batch failed: {getattr(e, 'orig', None) or e}"
+            for numbers, _ in batch.values():
+                for number in numbers:
+                    self._reject(summary, number, reason)
+            return
+
+        # A repeated email updates the lead its first row wrote
+        repeats = sum(len(numbers) - 1 for numbers, _ in batch.values())
+        summary["inserted"] += inserted
+        summary["updated"] += updated + repeats
+
+    def _write(self, batch: Dict[str, Tuple[List[int], Dict[str, Any]]]) -> Tuple[int, int]:
+        """
+        Merge a batch with the stored leads, score it and write it.
+
+        Stored leads are locked before they are read, so the merge and the
+        status counter deltas use their current values. New emails are
+        inserted with ON CONFLICT (email) DO NOTHING; an email another
+        transaction created in the meantime is not returned by the insert,
+        and goes round again as a locked update.
+
+        Returns:
+            (inserted, updated) lead counts
+        """
+        inserted = updated = 0
+        status_deltas = Counter()
+        pending = list(batch)
+
+        while pending:
+            stored = self._lock_stored(pending)
+            now = datetime.utcnow()
+            updates, inserts = [], []
+            for email in pending:
+                current = stored.get(email)
+                row = self._merge(email, batch[email][1], current, now)
+                (updates if current else inserts).append((row, current))
+
+            if updates:
+                self._update([row for row, _ in updates])
+            created = self._insert([row for row, _ in inserts])
+
+            # Bulk writes skip the Lead mapper events, so counters move here
+            for row, current in updates:
+                status_deltas[current.qualification_status or ""] -= 1
+                status_deltas[row["qualification_status"] or ""] += 1
+            for row, _ in inserts:
+                if row["email"] in created:
+                    status_deltas[row["qualification_status"] or ""] += 1
+
+            inserted += len(created)
+            updated += len(updates)
+            pending = [row["email"] for row, _ in inserts if row["email"] not in created]
+
+        connection = self.db.connection()
+        for status, delta in status_deltas.items():
+            if delta:
+                adjust_status_count(connection, status, delta)
+
+        return inserted, updated
+
+    def _lock_stored(self, emails: List[str]) -> Dict[str, Any]:
+        """Stored leads for `emails`, locked until the batch commits"""
+        table = Lead.__table__
+        connection = self.db.connection()
+        if (
+            connection.dialect.name == "sqlite"
+            and not connection.connection.dbapi_connection.in_transaction
+        ):
+            # No row locks in SQLite: take the database write lock before reading
+            connection.exec_driver_sql("BEGIN IMMEDIATE")
+
+        return {
+            row.email: row
+            for row in self.db.execute(
+                select(
+                    table.c.email,
+                    table.c.lead_score,
+                    table.c.qualification_status,
+                    *(table.c[field] for field in CONTACT_FIELDS + QUALIFICATION_FIELDS),
+                )
+                .where(table.c.email.in_(emails))
+                .with_for_update()
+            )
+        }
+
+    def _merge(
+        self, email: str, lead: Dict[str, Any], current: Optional[Any], now: datetime
+    ) -> Dict[str, Any]:
+        """Column values for a lead: the row's fields over the stored ones, scored"""
+        row = {
+            field: lead.get(field) or (getattr(current, field) if current else None)
+            for field in CONTACT_FIELDS + QUALIFICATION_FIELDS
+        }
+        row.update(
+            email=email,
+            source=lead.get("source", self.default_source),
+            utm_params=lead.get("utm_params", {}),
+            updated_at=now if current else None,
+        )
+
+        if current is None or any(field in lead for field in QUALIFICATION_FIELDS):
+            answers = {field: row[field] for field in QUALIFICATION_FIELDS if row[field]}
+            score = self.qualification_service.calculate_score(answers)
+            row["lead_score"] = score
+            row["qualification_status"] = self.qualification_service.classify_lead(score)
+        else:
+            row["lead_score"] = current.lead_score
+            row["qualification_status"] = current.qualification_status
+
+        return row
+
+    def _update(self, rows: List[Dict[str, Any]]) -> None:
+        """UPDATE the (locked) stored leads, one executemany"""
+        table = Lead.__table__
+        self.db.execute(
+            update(table).where(table.c.email == bindparam("match_email")),
+            [
+                {"match_email": row["email"], **{column: row[column] for column in UPDATE_COLUMNS}}
+                for row in rows
+            ],
+        )
+
+    def _insert(self, rows: List[Dict[str, Any]]) -> set:
+        """
+        INSERT ... ON CONFLICT (email) DO NOTHING for new leads.
+
+        Returns:
+            Emails actually inserted (a conflicting email was created by
+            another transaction after it was looked up)
+        """
+        if not rows:
+            return set()
+
+        table = Lead.__table__
+        dialect_insert = {"sqlite": sqlite.insert, "postgresql": postgresql.insert}.get(
+            self.db.get_bind().dialect.name
+        )
+        if dialect_insert is None:
+            # A concurrent insert fails the batch with an IntegrityError
+            self.db.execute(table.insert(), rows)
+            return {row["email"] for row in rows}
+
+        statement = (
+            dialect_insert(table)
+            .on_conflict_do_nothing(index_elements=[table.c.email])
+            .returning(table.c.email)
+        )
+        return set(self.db.execute(statement, rows).scalars())
+
+    @staticmethod
+    def _reject(summary: Dict[str, Any], number: int, reason: str) -> None:
+        """Count a rejected row and keep the first few reasons"""
+        summary["rejected"] += 1
+        if len(summary["errors"]) < MAX_REPORTED_ERRORS:
+            summary["errors"].append({"row": number, "error": reason})
@@ -0,0 +1,252 @@
+"""
+Lead Search - Indexed name/email search for leads
+Picks a backend for the session's database: the FTS5 trigram index on SQLite,
+pg_trgm and tsvector on PostgreSQL (see migration 0006), ILIKE elsewhere.
+Results are ranked by how well they match; when nothing contains the query,
+close spellings are returned instead.
+"""
+
+import re
+from typing import Dict, List, Set
+
+from sqlalchemy import Float, Integer, desc, func, inspect, literal, literal_column, or_, select, text
+from sqlalchemy.orm import Query, Session
+
+from core.config import settings
+from models.lead import Lead
+
+# Fuzzy candidates pulled from the FTS5 index before similarity scoring
+FUZZY_CANDIDATES = 200
+
+_WORD_PATTERN = re.compile(r"[^\W_]+")
+
+
+def trigrams(value: str) -> Set[str]:
+    """
+    pg_trgm-style trigrams: each word lowercased and padded with two spaces
+    in front and one behind, so word starts weigh more.
+
+    Args:
+        value: Text to split
+
+    Returns:
+        Set of 3-character strings
+    """
+    grams = set()
+    for word in _WORD_PATTERN.findall(value.lower()):
+        padded = f"  {word} "
+        grams.update(padded[i : i + 3] for i in range(len(padded) - 2))
+    return grams
+
+
+def word_similarity(query: str, value: str) -> float:
+    """
+    Share of the query's trigrams that occur in `value` (0-1), like
+    pg_trgm's word_similarity.
+
+    Args:
+        query: Search text
+        value: Text searched (e.g. name and email)
+
+    Returns:
+        Similarity score
+    """
+    query_grams = trigrams(query)
+    if not query_grams:
+        return 0.0
+    return len(query_grams & trigrams(value)) / len(query_grams)
+
+
+class LeadSearch:
+    """Unindexed ILIKE substring search; used where no search index exists"""
+
+    name = "ilike"
+
+    def search(self, query: Query, search: str, limit: int, offset: int) -> List[Lead]:
+        """
+        Leads matching `search`, best first.
+
+        Args:
+            query: Lead query with any other filters already applied
+            search: Search text (name or email)
+            limit: Maximum results
+            offset: Pagination offset
+
+        Returns:
+            List of leads
+        """
+        return (
+            query.filter(
+                or_(
+                    Lead.name.icontains(search, autoescape=True),
+                    Lead.email.icontains(search, autoescape=True),
+                )
+            )
+            .order_by(desc(Lead.lead_score), desc(Lead.created_at))
+            .limit(limit)
+            .offset(offset)
+            .all()
+        )
+
+
+class SQLiteLeadSearch(LeadSearch):
+    """
+    FTS5 trigram index (leads_fts) on SQLite.
+
+    Every search term of 3+ characters must occur in the name or email
+    (substring, so prefixes match too), ranked by bm25. Shorter terms are
+    checked on the matched rows. If nothing matches, leads sharing trigrams
+    with the query are scored with word_similarity; close spellings need at
+    least one 3-character run in common with the lead.
+    """
+
+    name = "sqlite_fts5"
+
+    def search(self, query: Query, search: str, limit: int, offset: int) -> List[Lead]:
+        terms = search.split()
+        indexed = [term for term in terms if len(term) >= 3]
+        if not indexed:
+            return super().search(query, search, limit, offset)
+
+        for term in terms:
+            if len(term) < 3:
+                query = query.filter(
+                    or_(
+                        Lead.name.icontains(term, autoescape=True),
+                        Lead.email.icontains(term, autoescape=True),
+                    )
+                )
+
+        matched = self._match(query, " AND ".join(self._phrase(term) for term in indexed))
+        leads = matched.limit(limit).offset(offset).all()
+        if leads or (offset and matched.first() is not None):
+            return leads
+
+        return self._fuzzy(query, search, limit, offset)
+
+    def _fuzzy(self, query: Query, search: str, limit: int, offset: int) -> List[Lead]:
+        """Leads whose name or email is a close spelling of the query"""
+        grams = {
+            word[i : i + 3]
+            for word in _WORD_PATTERN.findall(search.lower())
+            for i in range(len(word) - 2)
+        }
+        if not grams:
+            return []
+
+        candidates = (
+            self._match(query, " OR ".join(self._phrase(gram) for gram in sorted(grams)))
+            .limit(FUZZY_CANDIDATES)
+            .all()
+        )
+        scored = [
+            (word_similarity(search, f"{lead.name or ''} {lead.email}"), lead)
+            for lead in candidates
+        ]
+        scored = [
+            (score, lead)
+            for score, lead in scored
+            if score >= settings.LEAD_SEARCH_FUZZY_THRESHOLD
+        ]
+        scored.sort(key=lambda item: (item[0], item[1].lead_score or 0), reverse=True)
+        return [lead for _, lead in scored[offset : offset + limit]]
+
+    @staticmethod
+    def _phrase(term: str) -> str:
+        """Quote a term as an FTS5 string (no query syntax inside)"""
+        return '"' + term.replace('"', '""') + '"'
+
+    @staticmethod
+    def _match(query: Query, expression: str) -> Query:
+        """Restrict to leads matching an FTS5 expression, best bm25 first"""
+        matches = (
+            text(
+                "SELECT rowid AS lead_id, bm25(leads_fts) AS rank "
+                "FROM leads_fts WHERE leads_fts MATCH :expression"
+            )
+            .bindparams(expression=expression)
+            .columns(lead_id=Integer, rank=Float)
+            .subquery("fts_matches")
+        )
+        return query.join(matches, Lead.id == matches.c.lead_id).order_by(
+            matches.c.rank, desc(Lead.lead_score)
+        )
+
+
+class PostgresLeadSearch(LeadSearch):
+    """
+    pg_trgm and tsvector on PostgreSQL.
+
+    A lead matches if its name or email contains the query (trigram GIN
+    index), every query word is a prefix of one of its words (tsvector GIN
+    index), or the query is a close spelling (word similarity at least
+    LEAD_SEARCH_FUZZY_THRESHOLD). Ranked by ts_rank plus word similarity.
+    """
+
+    name = "postgresql_trgm"
+
+    def search(self, query: Query, search: str, limit: int, offset: int) -> List[Lead]:
+        search_text = literal_column("leads.search_text")
+        search_vector = literal_column("leads.search_vector")
+
+        # Transaction-local threshold for the <% operator
+        query.session.execute(
+            select(
+                func.set_config(
+                    "pg_trgm.word_similarity_threshold",
+                    str(settings.LEAD_SEARCH_FUZZY_THRESHOLD),
+                    True,
+                )
+            )
+        )
+
+        conditions = [
+            search_text.icontains(search, autoescape=True),
+            literal(search).op("<%")(search_text),
+        ]
+        rank = func.word_similarity(search, search_text)
+
+        words = _WORD_PATTERN.findall(search.lower())
+        if words:
+            tsquery = func.to_tsquery("simple", " & ".join(f"{word}:*" for word in words))
+            conditions.append(search_vector.op("@@")(tsquery))
+            rank = rank + func.ts_rank(search_vector, tsquery)
+
+        return (
+            query.filter(or_(*conditions))
+            .order_by(desc(rank), desc(Lead.lead_score))
+            .limit(limit)
+            .offset(offset)
+            .all()
+        )
+
+
+# Backend per database URL (whether the SQLite index exists is checked once)
+_backends: Dict[str, LeadSearch] = {}
+
+
+def lead_search_backend(db: Session) -> LeadSearch:
+    """
+    Search backend for the session's database.
+
+    Args:
+        db: Database session
+
+    Returns:
+        LeadSearch instance
+    """
+    bind = db.get_bind()
+    key = str(bind.engine.url)
+    backend = _backends.get(key)
+
+    if backend is None:
+        dialect = bind.dialect.name
+        if dialect == "postgresql":
+            backend = PostgresLeadSearch()
+        elif dialect == "sqlite" and inspect(db.connection()).has_table("leads_fts"):
+            backend = SQLiteLeadSearch()
+        else:
+            backend = LeadSearch()
+        _backends[key] = backend
+
+    return backend
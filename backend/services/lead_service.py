@@ -6,24 +6,53 @@ Handles database operations for leads, scoring, and search/filtering.
 from typing import Optional, Dict, List, Any
 from datetime import datetime
 from sqlalchemy.orm import Session
-from sqlalchemy import desc, or_
+from sqlalchemy import desc, func
 
 import sys
 import os
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+from core.config import settings
+from core.database import AsyncSessionService
 from models.lead import Lead
+from models.lead_status_count import LeadStatusCount, recompute_status_counts
+from services.lead_search import lead_search_backend
+from utils.emails import EmailNotValidError, normalize_email
+from utils.pagination import Keyset, Page
 from services.qualification_service import QualificationService
 
 
+# Leads listing order: best score first, then newest (ids increase with
+# created_at; server-default timestamps can't be compared exactly on SQLite)
+LEAD_ORDER = Keyset("leads", Lead.lead_score, Lead.id, descending=True)
+
+
 class LeadService:
     """Service for managing leads and qualification scoring."""
 
-    def __init__(self, db: Session):
+    def __init__(self, db: Session, autocommit: bool = True):
+        """
+        Initialize service bound to a database session.
+
+        Args:
+            db: Database session
+            autocommit: Commit after each write. Pass False when the caller
+                runs several writes as one unit of work and commits itself;
+                writes are then only flushed.
+        """
         self.db = db
+        self.autocommit = autocommit
         self.qualification_service = QualificationService()
 
+    def _save(self, instance) -> None:
+        """Commit and refresh, or just flush inside a caller-managed unit of work"""
+        if self.autocommit:
+            self.db.commit()
+            self.db.refresh(instance)
+        else:
+            self.db.flush()
+
     def create_lead(
         self,
         name: str,
@@ -36,6 +65,9 @@ class LeadService:
         """
         Create a new lead.
 
+        The email is normalized like the bulk importer's, so both find the
+        same lead for the same address.
+
         Args:
             name: Lead's name
             email: Lead's email (must be unique)
@@ -46,7 +78,12 @@ class LeadService:
 
         Returns:
             Lead: Created lead object
+
+        Raises:
+            EmailNotValidError: Not a valid email address (a ValueError)
         """
+        email = normalize_email(email)
+
         # Check if lead already exists
         existing = self.get_lead_by_email(email)
         if existing:
@@ -95,8 +132,7 @@ class LeadService:
         lead = Lead(**lead_data)
 
         self.db.add(lead)
-        self.db.commit()
-        self.db.refresh(lead)
+        self._save(lead)
 
         return lead
 
@@ -117,11 +153,16 @@ class LeadService:
         Get lead by email.
 
         Args:
-            email: Email address
+            email: Email address (normalized before the lookup; an invalid
+                address is looked up as given)
 
         Returns:
             Lead or None if not found
         """
+        try:
+            email = normalize_email(email)
+        except EmailNotValidError:
+            pass
         return self.db.query(Lead).filter(Lead.email == email).first()
 
     def update_lead(
@@ -186,8 +227,7 @@ class LeadService:
 
         lead.updated_at = datetime.utcnow()
 
-        self.db.commit()
-        self.db.refresh(lead)
+        self._save(lead)
 
         return lead
 
@@ -231,6 +271,10 @@ class LeadService:
         """
         Search and filter leads.
 
+        A text query goes through the database's search index (see
+        services.lead_search): substring and prefix matches ranked by
+        relevance, or close spellings when nothing matches.
+
         Args:
             query: Optional search query (name or email)
             qualification_status: Optional status filter (High Value, Qualified, Warm, Cold)
@@ -242,13 +286,54 @@ class LeadService:
         Returns:
             List of leads
         """
-        db_query = self.db.query(Lead)
+        db_query = self._filter_leads(qualification_status, source, min_score)
 
-        # Text search
+        # Text search, ranked by relevance
         if query:
-            db_query = db_query.filter(
-                or_(Lead.name.ilike(f"%{query}%"), Lead.email.ilike(f"%{query}%"))
-            )
+            return lead_search_backend(self.db).search(db_query, query, limit, offset)
+
+        # Order by score and date
+        return LEAD_ORDER.apply(db_query).limit(limit).offset(offset).all()
+
+    def list_leads(
+        self,
+        qualification_status: Optional[str] = None,
+        source: Optional[str] = None,
+        min_score: Optional[int] = None,
+        limit: int = 50,
+        cursor: Optional[str] = None,
+    ) -> Page:
+        """
+        One page of leads, best score first, using keyset pagination.
+
+        Seeks past the previous page's last (lead_score, id), so deep pages
+        cost the same as the first.
+
+        Args:
+            qualification_status: Optional status filter (High Value, Qualified, Warm, Cold)
+            source: Optional source filter
+            min_score: Optional minimum score filter
+            limit: Page size
+            cursor: next_cursor from the previous page (None for the first)
+
+        Returns:
+            Page of leads and the cursor for the next page
+
+        Raises:
+            InvalidCursorError: The cursor is malformed
+        """
+        db_query = self._filter_leads(qualification_status, source, min_score)
+        rows = LEAD_ORDER.apply(db_query, cursor).limit(limit + 1).all()
+        return LEAD_ORDER.page(rows, limit)
+
+    def _filter_leads(
+        self,
+        qualification_status: Optional[str],
+        source: Optional[str],
+        min_score: Optional[int],
+    ):
+        """Lead query with the status, source and score filters applied"""
+        db_query = self.db.query(Lead)
 
         # Status filter
         if qualification_status:
@@ -264,10 +349,7 @@ class LeadService:
         if min_score is not None:
             db_query = db_query.filter(Lead.lead_score >= min_score)
 
-        # Order by score and date
-        db_query = db_query.order_by(desc(Lead.lead_score), desc(Lead.created_at))
-
-        return db_query.limit(limit).offset(offset).all()
+        return db_query
 
     def get_high_value_leads(self, limit: int = 20) -> List[Lead]:
         """
@@ -316,24 +398,70 @@ class LeadService:
             .all()
         )
 
+    def count_leads_by_status(self) -> Dict[str, int]:
+        """
+        Count leads per qualification status in one GROUP BY query.
+
+        Returns:
+            {status: count}; leads without a status are counted under ""
+        """
+        rows = (
+            self.db.query(Lead.qualification_status, func.count(Lead.id))
+            .group_by(Lead.qualification_status)
+            .all()
+        )
+        counts: Dict[str, int] = {}
+        for status, count in rows:
+            counts[status or ""] = counts.get(status or "", 0) + count
+        return counts
+
+    def get_status_counters(self) -> Dict[str, int]:
+        """
+        Read the maintained per-status counters (see models.lead_status_count).
+
+        Returns:
+            {status: count}; leads without a status are counted under ""
+        """
+        return {
+            row.status: row.count
+            for row in self.db.query(LeadStatusCount).all()
+            if row.count
+        }
+
+    def recompute_status_counters(self) -> Dict[str, int]:
+        """
+        Rebuild the per-status counters from the leads table.
+
+        Needed after writes that bypass the ORM (bulk imports, raw SQL).
+
+        Returns:
+            The rebuilt counters
+        """
+        recompute_status_counts(self.db.connection())
+        if self.autocommit:
+            self.db.commit()
+        return self.get_status_counters()
+
     def get_lead_stats(self) -> Dict[str, Any]:
         """
         Get lead statistics.
 
+        Reads the maintained counters (LEAD_STATUS_COUNTERS), otherwise one
+        GROUP BY over the leads table.
+
         Returns:
             Dictionary with lead counts by status
         """
-        total = self.db.query(Lead).count()
-        high_value = (
-            self.db.query(Lead)
-            .filter(Lead.qualification_status == "High Value")
-            .count()
-        )
-        qualified = (
-            self.db.query(Lead).filter(Lead.qualification_status == "Qualified").count()
+        counts = (
+            self.get_status_counters()
+            if settings.LEAD_STATUS_COUNTERS
+            else self.count_leads_by_status()
         )
-        warm = self.db.query(Lead).filter(Lead.qualification_status == "Warm").count()
-        cold = self.db.query(Lead).filter(Lead.qualification_status == "Cold").count()
+        total = sum(counts.values())
+        high_value = counts.get("High Value", 0)
+        qualified = counts.get("Qualified", 0)
+        warm = counts.get("Warm", 0)
+        cold = counts.get("Cold", 0)
 
         return {
             "total": total,
@@ -347,6 +475,66 @@ class LeadService:
         }
 
 
+class AsyncLeadService(AsyncSessionService):
+    """LeadService for an AsyncSession (read paths used by the API)."""
+
+    service_class = LeadService
+
+    async def get_lead(self, lead_id: int) -> Optional[Lead]:
+        """Get lead by ID (see LeadService.get_lead)"""
+        return await self._run("get_lead", lead_id)
+
+    async def search_leads(
+        self,
+        query: Optional[str] = None,
+        qualification_status: Optional[str] = None,
+        source: Optional[str] = None,
+        min_score: Optional[int] = None,
+        limit: int = 50,
+        offset: int = 0,
+    ) -> List[Lead]:
+        """Search and filter leads (see LeadService.search_leads)"""
+        return await self._run(
+            "search_leads",
+            query=query,
+            qualification_status=qualification_status,
+            source=source,
+            min_score=min_score,
+            limit=limit,
+            offset=offset,
+        )
+
+    async def list_leads(
+        self,
+        qualification_status: Optional[str] = None,
+        source: Optional[str] = None,
+        min_score: Optional[int] = None,
+        limit: int = 50,
+        cursor: Optional[str] = None,
+    ) -> Page:
+        """One page of leads (see LeadService.list_leads)"""
+        return await self._run(
+            "list_leads",
+            qualification_status=qualification_status,
+            source=source,
+            min_score=min_score,
+            limit=limit,
+            cursor=cursor,
+        )
+
+    async def get_high_value_leads(self, limit: int = 20) -> List[Lead]:
+        """Get high value leads (see LeadService.get_high_value_leads)"""
+        return await self._run("get_high_value_leads", limit=limit)
+
+    async def get_recent_leads(self, days: int = 7, limit: int = 50) -> List[Lead]:
+        """Get recent leads (see LeadService.get_recent_leads)"""
+        return await self._run("get_recent_leads", days=days, limit=limit)
+
+    async def get_lead_stats(self) -> Dict[str, Any]:
+        """Get lead statistics (see LeadService.get_lead_stats)"""
+        return await self._run("get_lead_stats")
+
+
 # Test function
 if __name__ == "__main__":
     from core.database import SessionLocal, init_db
@@ -3,8 +3,105 @@ Qualification Service - Lead Scoring Engine
 Handles qualification questions and lead scoring logic
 """
 
+import re
+from datetime import datetime
+from typing import Optional
+
 from core.config import settings
 
+US_STATES = {
+    "AL": "Alabama", "AK": "Alaska", "AZ": "Arizona", "AR": "Arkansas",
+    "CA": "California", "CO": "Colorado", "CT": "Connecticut", "DE": "Delaware",
+    "FL": "Florida", "GA": "Georgia", "HI": "Hawaii", "ID": "Idaho",
+    "IL": "Illinois", "IN": "Indiana", "IA": "Iowa", "KS": "Kansas",
+    "KY": "Kentucky", "LA": "Louisiana", "ME": "Maine", "MD": "Maryland",
+    "MA": "Massachusetts", "MI": "Michigan", "MN": "Minnesota", "MS": "Mississippi",
+    "MO": "Missouri", "MT": "Montana", "NE": "Nebraska", "NV": "Nevada",
+    "NH": "New Hampshire", "NJ": "New Jersey", "NM": "New Mexico", "NY": "New York",
+    "NC": "North Carolina", "ND": "North Dakota", "OH": "Ohio", "OK": "Oklahoma",
+    "OR": "Oregon", "PA": "Pennsylvania", "RI": "Rhode Island", "SC": "South Carolina",
+    "SD": "South Dakota", "TN": "Tennessee", "TX": "Texas", "UT": "Utah",
+    "VT": "Vermont", "VA": "Virginia", "WA": "Washington", "WV": "West Virginia",
+    "WI": "Wisconsin", "WY": "Wyoming", "DC": "District of Columbia",
+}
+
+# State codes that are also common English words ("ok", "hi", "in"); in a chat
+# reply they only count after "in" / "from"
+AMBIGUOUS_STATE_CODES = {"IN", "OR", "ME", "OK", "HI", "OH", "LA", "PA", "MA", "DE"}
+_STATE_CODE_LOCATION_PATTERN = re.compile(
+    r"\b(?:in|from|live in|living in|based in|reside in|state is)\s+([a-z]{2})[\s.!]*$"
+)
+
+# Longest names first so "west virginia" wins over "virginia"
+_STATE_NAME_PATTERN = re.compile(
+    r"\b("
+    + "|".join(
+        sorted((name.lower() for name in US_STATES.values()), key=len, reverse=True)
+    )
+    + r")\b"
+)
+
+_AGE_PATTERN = re.compile(
+    r"\b(?:i'?m|i am|age[d]?|turning|turned)\s+(\d{2})\b|\b(\d{2})\s*(?:years?|yrs?|y/?o)\s*old\b"
+)
+_AGE_DECADE_PATTERN = re.compile(r"\b(?:early|mid|late)?[- ]?(twenties|thirties|forties|fifties|sixties|seventies|eighties)\b")
+_DECADES = {
+    "twenties": 25, "thirties": 35, "forties": 45, "fifties": 55,
+    "sixties": 62, "seventies": 75, "eighties": 85,
+}
+
+_RETIRED_PATTERN = re.compile(
+    r"\b(?:already|i'?m|i am|we'?re|we are|i|we|been|fully|recently)\s+retired\b|^retired\b"
+)
+# "30 years from retirement" is a timeline, not an age
+_YEARS_TO_RETIREMENT_PATTERN = re.compile(
+    r"\b\d{1,2}\s*(?:more\s+)?(?:years?|yrs?)\s+(?:away\s+)?"
+    r"(?:from|until|till|to|before)\s+(?:my\s+|our\s+)?retir\w*"
+)
+_YEARS_PATTERN = re.compile(
+    r"\b(?:(\d{1,2})\s*(?:-|to)\s*)?(\d{1,2})\s*(?:more\s+)?(?:years?|yrs?)\b(?!\s*ago)"
+)
+_DC_PATTERN = re.compile(r"\bwashington,?\s+d\.?c\b|\bdistrict of columbia\b")
+_TARGET_YEAR_PATTERN = re.compile(r"\b(20[2-7]\d)\b")
+_NEXT_YEAR_PATTERN = re.compile(r"\b(?:next year|this year|within a year|a year|in a year|soon)\b")
+
+# Retirement plan names look like dollar amounts ("401k") and must be ignored
+_PLAN_NAME_PATTERN = re.compile(r"\b(?:401|403|457)\s*\(?[kb]\)?", re.IGNORECASE)
+_AMOUNT_PATTERN = re.compile(
+    r"(?P<qualifier>less than|under|below|over|more than|above)?\s*"
+    r"(?P<dollar>\$)?\s*(?P<number>\d+(?:,\d{3})*(?:\.\d+)?)\s*"
+    r"(?P<suffix>k\b|thousand\b|m\b|mm\b|mil\b|million\b|grand\b)?"
+)
+_AMOUNT_SUFFIXES = {
+    "k": 1_000, "thousand": 1_000, "grand": 1_000,
+    "m": 1_000_000, "mm": 1_000_000, "mil": 1_000_000, "million": 1_000_000,
+}
+_UNDISCLOSED_PATTERN = re.compile(r"\b(?:prefer not|rather not|not comfortable|private|none of your)\b")
+
+_UNSURE_PATTERN = re.compile(r"\b(?:not sure|unsure|don'?t know|do not know|no idea|maybe|not certain|can'?t remember)\b")
+_NO_PATTERN = re.compile(r"^(?:no|nope|nah)\b|\b(?:don'?t|do not|never|none|not yet|no annuit(?:y|ies))\b")
+_YES_PATTERN = re.compile(
+    r"^(?:yes|yeah|yep|yup|sure)\b|\b(?:i do|we do|i have|we have|i own|we own)\b(?! not|n'?t)"
+)
+
+# Keyword buckets for open-ended questions; a reply is confident only when it
+# matches exactly one bucket
+CONCERN_KEYWORDS = {
+    "Guaranteed income": r"guarantee|steady income|reliable income|paycheck|income",
+    "Market risk": r"market|volatil|crash|stock|lose money|losing money|downturn",
+    "Outliving my money": r"outliv|run out|running out|last long enough|longevity",
+    "Healthcare costs": r"health|medical|medicare|long[- ]term care|nursing",
+    "Taxes": r"\btax",
+    "Leaving a legacy": r"legacy|heirs|inherit|estate|leave .* to",
+}
+GOAL_KEYWORDS = {
+    "Maintain current lifestyle": r"lifestyle|maintain|comfortabl|same standard",
+    "Travel": r"travel|trip|see the world|cruise|rv\b",
+    "Support family": r"family|kids|grandkid|children|grandchildren",
+    "Start a business": r"business|start ?up|own company",
+    "Charitable giving": r"charit|donat|church|give back|nonprofit",
+}
+
 
 class QualificationService:
     """Service for lead qualification and scoring"""
@@ -91,6 +188,26 @@ class QualificationService:
         """Initialize qualification service"""
         self.max_questions = settings.QUALIFICATION_QUESTIONS_COUNT
 
+        # Rule-based extraction outcomes (fast-path hits avoid an LLM call)
+        self.extraction_counts = {"fast_path_hits": 0, "llm_fallbacks": 0}
+        self._keyword_patterns = {
+            "concerns": {
+                bucket: re.compile(pattern) for bucket, pattern in CONCERN_KEYWORDS.items()
+            },
+            "goals": {
+                bucket: re.compile(pattern) for bucket, pattern in GOAL_KEYWORDS.items()
+            },
+        }
+        self._extractors = {
+            "age_range": self._extract_age_range,
+            "retirement_timeline": self._extract_retirement_timeline,
+            "state": self._extract_state,
+            "investable_assets": self._extract_investable_assets,
+            "current_annuity": self._extract_current_annuity,
+            "concerns": lambda text: self._match_keywords("concerns", text),
+            "goals": lambda text: self._match_keywords("goals", text),
+        }
+
     def get_next_question(
         self, qualification_progress: int, answered_fields: dict = None
     ) -> dict:
@@ -122,6 +239,203 @@ class QualificationService:
 
         return None
 
+    def extract_answer(self, field: str, message: str) -> Optional[str]:
+        """
+        Deterministically extract the answer to a qualification question
+
+        Parses ages, dollar amounts, year spans, yes/no/unsure replies, states
+        and concern/goal keywords straight into the option values scored by
+        calculate_score. Returns None when the rules are not confident, in
+        which case the caller should fall back to LLM extraction.
+
+        Args:
+            field: Field of the pending question (e.g. "age_range")
+            message: Raw user message
+
+        Returns:
+            Canonical answer, or None if not confidently parsed
+        """
+        extractor = self._extractors.get(field)
+        answer = extractor(message.strip().lower()) if extractor else None
+
+        if answer:
+            self.extraction_counts["fast_path_hits"] += 1
+        else:
+            self.extraction_counts["llm_fallbacks"] += 1
+        return answer
+
+    def normalize_answer(self, field: str, value: str) -> str:
+        """
+        Map a free-form answer (e.g. from the LLM) onto the question's options
+
+        Args:
+            field: Qualification field
+            value: Extracted answer
+
+        Returns:
+            Matching option value, or the original value if none matches
+        """
+        # A state field value is a state, so "OK" / "PA" are postal codes here
+        if field == "state" and str(value).strip().upper() in US_STATES:
+            return US_STATES[str(value).strip().upper()]
+
+        question = next((q for q in self.QUESTIONS if q["field"] == field), None)
+        simplified = re.sub(r"[\s$]", "", str(value).lower())
+        for option in (question or {}).get("options", []):
+            if re.sub(r"[\s$]", "", option.lower()) == simplified:
+                return option
+
+        extractor = self._extractors.get(field)
+        return (extractor(str(value).strip().lower()) if extractor else None) or value
+
+    def extraction_stats(self) -> dict:
+        """Report rule-based extraction hit rate and LLM calls saved"""
+        hits = self.extraction_counts["fast_path_hits"]
+        attempts = hits + self.extraction_counts["llm_fallbacks"]
+        return {
+            **self.extraction_counts,
+            "llm_calls_saved": hits,
+            "hit_rate": round(hits / attempts, 3) if attempts else 0.0,
+        }
+
+    def _extract_age_range(self, text: str) -> Optional[str]:
+        """Parse "I'm 55", "62 years old", "in my fifties" or a bare age"""
+        text = _YEARS_TO_RETIREMENT_PATTERN.sub(" ", text)
+        age = None
+        match = _AGE_PATTERN.search(text)
+        if match:
+            age = int(match.group(1) or match.group(2))
+        elif re.fullmatch(r"\d{2}", text):
+            age = int(text)
+        else:
+            decade = _AGE_DECADE_PATTERN.search(text)
+            if decade:
+                age = _DECADES[decade.group(1)]
+
+        if age is None or not 18 <= age <= 110:
+            return None
+        if age <= 30:
+            return "20-30"
+        if age <= 50:
+            return "31-50"
+        if age <= 65:
+            return "51-65"
+        return "65+"
+
+    def _extract_retirement_timeline(self, text: str) -> Optional[str]:
+        """Parse "already retired", "in 3 years", "2030" or "next year" """
+        if re.search(r"\bnot (?:yet )?retired\b", text):
+            retired = False
+        else:
+            retired = bool(_RETIRED_PATTERN.search(text))
+
+        years = [
+            int(value) for span in _YEARS_PATTERN.findall(text) for value in span if value
+        ]
+        current_year = datetime.utcnow().year
+        for target_year in (int(value) for value in _TARGET_YEAR_PATTERN.findall(text)):
+            if target_year > current_year:
+                years.append(target_year - current_year)
+            elif not retired:
+                # A past or current target year: retired already, or a typo
+                return None
+        if not years and _NEXT_YEAR_PATTERN.search(text):
+            years = [1]
+
+        if retired:
+            return "Already retired" if not years else None
+        if not years:
+            return None
+
+        buckets = {self._timeline_bucket(span) for span in years}
+        # A range like "3-8 years" that straddles buckets is not confident
+        return buckets.pop() if len(buckets) == 1 else None
+
+    @staticmethod
+    def _timeline_bucket(years: int) -> Optional[str]:
+        """Map years until retirement onto a timeline option"""
+        if years <= 5:
+            return "1-5 years"
+        if years <= 10:
+            return "6-10 years"
+        if years <= 15:
+            return "11-15 years"
+        return "15+ years"
+
+    def _extract_state(self, text: str) -> Optional[str]:
+        """Parse a US state name or postal code"""
+        if _DC_PATTERN.search(text):
+            return US_STATES["DC"]
+
+        names = set(_STATE_NAME_PATTERN.findall(text))
+        if len(names) == 1:
+            return names.pop().title().replace(" Of ", " of ")
+        if names:
+            return None
+
+        code = text.strip(" .!").upper()
+        if code in US_STATES and code not in AMBIGUOUS_STATE_CODES:
+            return US_STATES[code]
+
+        location = _STATE_CODE_LOCATION_PATTERN.search(text)
+        if location and location.group(1).upper() in US_STATES:
+            return US_STATES[location.group(1).upper()]
+        return None
+
+    def _extract_investable_assets(self, text: str) -> Optional[str]:
+        """Parse "$300k", "1.2 million", "under 100,000" or "prefer not to say" """
+        if _UNDISCLOSED_PATTERN.search(text):
+            return "Prefer not to say"
+
+        amounts = []
+        for match in _AMOUNT_PATTERN.finditer(_PLAN_NAME_PATTERN.sub(" ", text)):
+            value = float(match.group("number").replace(",", ""))
+            suffix = match.group("suffix")
+            if suffix:
+                value *= _AMOUNT_SUFFIXES[suffix]
+            elif not match.group("dollar") and value < 1_000:
+                continue  # Bare small numbers are ages, years, counts...
+
+            qualifier = match.group("qualifier")
+            if qualifier in ("less than", "under", "below"):
+                value -= 1
+            elif qualifier:
+                value += 1
+            amounts.append(value)
+
+        # Several amounts (ranges, per-account breakdowns) go to the LLM
+        if len(amounts) != 1:
+            return None
+
+        amount = amounts[0]
+        if amount < 100_000:
+            return "Less than $100k"
+        if amount < 500_000:
+            return "$100k-$500k"
+        if amount <= 1_000_000:
+            return "$500k-$1M"
+        return "Over $1M"
+
+    def _extract_current_annuity(self, text: str) -> Optional[str]:
+        """Parse yes / no / not sure replies"""
+        if _UNSURE_PATTERN.search(text):
+            return "Not sure"
+
+        said_no = bool(_NO_PATTERN.search(text))
+        said_yes = bool(_YES_PATTERN.search(text))
+        if said_no == said_yes:
+            return None
+        return "No" if said_no else "Yes"
+
+    def _match_keywords(self, field: str, text: str) -> Optional[str]:
+        """Return the single keyword bucket a reply matches, if any"""
+        matches = [
+            bucket
+            for bucket, pattern in self._keyword_patterns[field].items()
+            if pattern.search(text)
+        ]
+        return matches[0] if len(matches) == 1 else None
+
     def calculate_score(self, answers: dict) -> int:
         """
         Calculate lead score based on qualification answers
@@ -288,7 +602,7 @@ if __name__ == "__main__":
     service = QualificationService()
 
     # Test getting questions
-    print("\n[1/3] Testing question flow...")
+    print("\n[1/4] Testing question flow...")
     for i in range(8):
         question = service.get_next_question(i)
         if question:
@@ -297,7 +611,7 @@ if __name__ == "__main__":
             print(f"  Q{i + 1}: Complete!")
 
     # Test scoring
-    print("\n[2/3] Testing lead scoring...")
+    print("\n[2/4] Testing lead scoring...")
     test_answers = {
         "age_range": "51-65",
         "retirement_timeline": "1-5 years",
@@ -311,8 +625,23 @@ if __name__ == "__main__":
     print(f"  Sample Score: {score}/100")
     print(f"  Classification: {classification}")
 
+    # Test rule-based extraction
+    print("\n[3/4] Testing rule-based extraction...")
+    samples = [
+        ("age_range", "I'm 55"),
+        ("retirement_timeline", "retiring in 3 years"),
+        ("state", "We live in North Carolina"),
+        ("investable_assets", "about $300k in my 401k"),
+        ("current_annuity", "no annuity"),
+        ("concerns", "I worry about running out of money"),
+        ("goals", "honestly it depends"),
+    ]
+    for field, message in samples:
+        print(f"  {message!r} -> {service.extract_answer(field, message)}")
+    print(f"  Stats: {service.extraction_stats()}")
+
     # Test appointment logic
-    print("\n[3/3] Testing appointment recommendation...")
+    print("\n[4/4] Testing appointment recommendation...")
     should_offer = service.should_offer_appointment(score, 6)
     print(f"  Should offer appointment: {should_offer}")
     if should_offer:
@@ -0,0 +1,233 @@
+"""
+Resilience - Deadlines and circuit breaking for upstream calls
+Keeps a slow or failing provider from holding every request hostage: each
+call gets a timeout carved out of the request's end-to-end budget, and a
+breaker fails calls fast while the provider is unhealthy.
+"""
+
+import asyncio
+import time
+from typing import Any, Awaitable, Dict, Optional
+
+
+class UpstreamUnavailableError(Exception):
+    """An upstream call was not attempted or did not finish in time"""
+
+
+class CircuitOpenError(UpstreamUnavailableError):
+    """The circuit breaker is rejecting calls"""
+
+
+class DeadlineExceeded(UpstreamUnavailableError):
+    """The request's time budget ran out"""
+
+
+class Deadline:
+    """Point in time by which a request must be answered"""
+
+    def __init__(self, budget_seconds: float):
+        """
+        Args:
+            budget_seconds: End-to-end time budget, starting now
+        """
+        self.budget_seconds = budget_seconds
+        self.expires_at = time.monotonic() + budget_seconds
+
+    def remaining(self) -> float:
+        """Seconds left (never negative)"""
+        return max(0.0, self.expires_at - time.monotonic())
+
+    def timeout(self, cap: float, minimum: float = 0.0) -> float:
+        """
+        Timeout for the next call: what is left of the budget, at most `cap`.
+
+        Args:
+            cap: Longest any single call may take
+            minimum: Below this much time left, don't start the call at all
+
+        Returns:
+            Timeout in seconds
+
+        Raises:
+            DeadlineExceeded: Less than `minimum` seconds remain
+        """
+        remaining = self.remaining()
+        if remaining <= minimum:
+            raise DeadlineExceeded(
+                f"{remaining:.2f}s left of a {self.budget_seconds:.1f}s budget"
+            )
+        return min(cap, remaining)
+
+
+class CircuitBreaker:
+    """
+    Consecutive-failure circuit breaker.
+
+    Closed: calls go through. After `failure_threshold` consecutive failures
+    (errors, timeouts, or calls slower than `slow_call_seconds`) it opens and
+    rejects calls for `reset_seconds`. Then it is half-open: a single probe
+    call is let through, and its outcome closes or re-opens the breaker.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int,
+        slow_call_seconds: float,
+        reset_seconds: float,
+    ):
+        """
+        Args:
+            name: Upstream name, used in errors and metrics
+            failure_threshold: Consecutive failures that open the breaker
+            slow_call_seconds: Successful calls slower than this count as failures
+            reset_seconds: How long the breaker stays open before probing
+        """
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.slow_call_seconds = slow_call_seconds
+        self.reset_seconds = reset_seconds
+
+        self.state = self.CLOSED
+        self.consecutive_failures = 0
+        self.opened_at: Optional[float] = None
+        self._probe_in_flight = False
+        self.counts = {
+            "calls": 0,
+            "failures": 0,
+            "slow_calls": 0,
+            "timeouts": 0,
+            "rejected": 0,
+            "opened": 0,
+        }
+
+    def allow(self) -> bool:
+        """Whether a call may be attempted now (reserves the probe if half-open)"""
+        if self.state == self.OPEN:
+            if time.monotonic() - self.opened_at < self.reset_seconds:
+                return False
+            self.state = self.HALF_OPEN
+
+        if self.state == self.HALF_OPEN:
+            if self._probe_in_flight:
+                return False
+            self._probe_in_flight = True
+
+        return True
+
+    def record_success(self, latency: float) -> None:
+        """Record a completed call; a slow one still counts as a failure"""
+        if latency > self.slow_call_seconds:
+            self.counts["slow_calls"] += 1
+            self.record_failure()
+            return
+
+        self._probe_in_flight = False
+        self.consecutive_failures = 0
+        self.state = self.CLOSED
+
+    def record_failure(self) -> None:
+        """Record a failed call, opening the breaker at the threshold"""
+        self._probe_in_flight = False
+        self.counts["failures"] += 1
+        self.consecutive_failures += 1
+        if self.state == self.HALF_OPEN or (
+            self.state == self.CLOSED
+            and self.consecutive_failures >= self.failure_threshold
+        ):
+            self.state = self.OPEN
+            self.opened_at = time.monotonic()
+            self.counts["opened"] += 1
+
+    async def call(self, awaitable: Awaitable, timeout: float) -> Any:
+        """
+        Await an upstream call under the breaker and a hard timeout.
+
+        Args:
+            awaitable: The call (a coroutine, not yet awaited)
+            timeout: Seconds before the call is cancelled
+
+        Returns:
+            The call's result
+
+        Raises:
+            CircuitOpenError: The breaker is open (the call is not made)
+            DeadlineExceeded: The call timed out
+        """
+        if not self.allow():
+            self.counts["rejected"] += 1
+            if asyncio.iscoroutine(awaitable):
+                awaitable.close()
+            raise CircuitOpenError(f"{self.name} circuit is open")
+
+        self.counts["calls"] += 1
+        start = time.monotonic()
+        try:
+            result = await asyncio.wait_for(awaitable, timeout)
+        except asyncio.TimeoutError:
+            self.counts["timeouts"] += 1
+            self.record_failure()
+            raise DeadlineExceeded(f"{self.name} call timed out after {timeout:.2f}s")
+        except asyncio.CancelledError:
+            # The caller went away; says nothing about the upstream
+            self._probe_in_flight = False
+            raise
+        except Exception:
+            self.record_failure()
+            raise
+
+        self.record_success(time.monotonic() - start)
+        return result
+
+    def stats(self) -> Dict[str, Any]:
+        """Report breaker state and call outcomes"""
+        return {
+            "state": self.state,
+            "consecutive_failures": self.consecutive_failures,
+            "open_for_seconds": round(time.monotonic() - self.opened_at, 1)
+            if self.state == self.OPEN
+            else 0.0,
+            **self.counts,
+        }
+
+
+if __name__ == "__main__":
+
+    async def test_resilience():
+        """Trip and recover a breaker against a fake upstream"""
+        print("Resilience")
+        print("=" * 60)
+
+        breaker = CircuitBreaker(
+            "fake", failure_threshold=3, slow_call_seconds=0.2, reset_seconds=0.5
+        )
+
+        async def upstream(delay: float) -> str:
+            await asyncio.sleep(delay)
+            return "ok"
+
+        for delay in (0.01, 1.0, 1.0, 1.0, 0.01):
+            try:
+                result = await breaker.call(upstream(delay), timeout=0.3)
+            except Exception as e:
+                result = type(e).__name__
+            print(f"   delay {delay:4.2f}s -> {result:<18} state={breaker.state}")
+
+        await asyncio.sleep(0.6)
+        result = await breaker.call(upstream(0.01), timeout=0.3)
+        print(f"   probe after reset -> {result}  state={breaker.state}")
+
+        deadline = Deadline(0.1)
+        await asyncio.sleep(0.15)
+        try:
+            deadline.timeout(cap=5.0, minimum=0.05)
+        except DeadlineExceeded as e:
+            print(f"   deadline: {e}")
+
+        print(f"\n{breaker.stats()}")
+
+    asyncio.run(test_resilience())
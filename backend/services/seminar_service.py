@@ -3,21 +3,154 @@ Seminar Service - Event Management
 Handles seminars, registrations, and attendance tracking.
 """
 
+import threading
 from typing import Optional, Dict, List, Any
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from sqlalchemy.orm import Session
-from sqlalchemy import desc, and_, or_
+from sqlalchemy import desc, and_, or_, event
 
 import sys
 import os
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+from core.config import settings
+from core.database import AsyncSessionService
+from utils.pagination import Keyset, Page
 from models.seminar import Seminar
 from models.seminar_registration import SeminarRegistration
 from models.lead import Lead
 
 
+class SeminarSnapshotCache:
+    """
+    In-process cache of the formatted upcoming-seminar list used in chat context.
+
+    Invalidated whenever a committed transaction touches the seminars table
+    (registrations, seeding, edits), so seat counts stay accurate. Entries
+    also expire after SEMINAR_CACHE_TTL_SECONDS and as soon as the first
+    seminar starts. The TTL bounds staleness from writes made by other
+    processes: a refreshed snapshot that differs from the expired one bumps
+    the version too, so anything keyed on the version (cached replies)
+    expires with it.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries: Dict[int, Dict[str, Any]] = {}
+        self.version = 0
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    def get(self, limit: int) -> Optional[List[Dict[str, Any]]]:
+        """Return the cached snapshot for a limit, or None if missing/expired"""
+        entry = self._entries.get(limit)
+        if entry and entry["version"] == self.version and datetime.utcnow() < entry["expires_at"]:
+            self.hits += 1
+            return [dict(seminar) for seminar in entry["seminars"]]
+
+        self.misses += 1
+        return None
+
+    def put(
+        self,
+        limit: int,
+        seminars: List[Dict[str, Any]],
+        version: int,
+        first_start: Optional[datetime],
+    ) -> None:
+        """
+        Store a snapshot built while the cache was at `version`
+
+        Snapshots read before a concurrent invalidation are discarded. A
+        snapshot that replaces a different one (changed by another process,
+        or a seminar has started) bumps the version.
+        """
+        expires_at = datetime.utcnow() + timedelta(seconds=settings.SEMINAR_CACHE_TTL_SECONDS)
+        if first_start and first_start < expires_at:
+            expires_at = first_start
+
+        with self._lock:
+            if version != self.version:
+                return
+            previous = self._entries.get(limit)
+            if previous and previous["seminars"] != seminars:
+                self._entries = {}
+                self.version += 1
+                self.invalidations += 1
+            self._entries[limit] = {
+                "seminars": seminars,
+                "version": self.version,
+                "expires_at": expires_at,
+            }
+
+    def invalidate(self) -> None:
+        """Drop all snapshots and bump the version"""
+        with self._lock:
+            self._entries = {}
+            self.version += 1
+            self.invalidations += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """Report cache effectiveness"""
+        lookups = self.hits + self.misses
+        return {
+            "version": self.version,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+            "invalidations": self.invalidations,
+        }
+
+
+seminar_snapshot_cache = SeminarSnapshotCache()
+
+_SEMINAR_TABLES = {Seminar.__tablename__, SeminarRegistration.__tablename__}
+
+
+@event.listens_for(Session, "before_flush")
+def _track_seminar_changes(session, flush_context, instances):
+    """Flag sessions that add, change or delete seminars or registrations"""
+    for instance in (*session.new, *session.dirty, *session.deleted):
+        if isinstance(instance, (Seminar, SeminarRegistration)):
+            session.info["seminars_changed"] = True
+            return
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _track_seminar_bulk_changes(orm_execute_state):
+    """Flag bulk query().update()/delete() against the seminar tables"""
+    if orm_execute_state.is_update or orm_execute_state.is_delete:
+        mapper = orm_execute_state.bind_mapper
+        if mapper is not None and mapper.local_table.name in _SEMINAR_TABLES:
+            orm_execute_state.session.info["seminars_changed"] = True
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_on_commit(session):
+    """Invalidate the seminar snapshot once seminar changes are committed"""
+    if session.info.pop("seminars_changed", False):
+        seminar_snapshot_cache.invalidate()
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_on_rollback(session):
+    """Rolled-back changes never reached the database"""
+    session.info.pop("seminars_changed", None)
+
+
+def _as_naive_utc(value: datetime) -> datetime:
+    """Normalize a possibly timezone-aware datetime to naive UTC"""
+    if value.tzinfo is not None:
+        return value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+
+# Upcoming seminars listing order: soonest first
+SEMINAR_ORDER = Keyset("seminars", Seminar.date, Seminar.id)
+
+
 class SeminarService:
     """Service for managing seminars and registrations."""
 
@@ -89,6 +222,30 @@ class SeminarService:
         Returns:
             List of upcoming seminars
         """
+        return SEMINAR_ORDER.apply(self._upcoming_query(topic)).limit(limit).all()
+
+    def page_upcoming_seminars(
+        self, limit: int = 10, topic: Optional[str] = None, cursor: Optional[str] = None
+    ) -> Page:
+        """
+        One page of upcoming seminars, soonest first, using keyset pagination.
+
+        Args:
+            limit: Page size
+            topic: Optional topic filter
+            cursor: next_cursor from the previous page (None for the first)
+
+        Returns:
+            Page of seminars and the cursor for the next page
+
+        Raises:
+            InvalidCursorError: The cursor is malformed
+        """
+        rows = SEMINAR_ORDER.apply(self._upcoming_query(topic), cursor).limit(limit + 1).all()
+        return SEMINAR_ORDER.page(rows, limit)
+
+    def _upcoming_query(self, topic: Optional[str] = None):
+        """Query for scheduled seminars that have not started"""
         query = self.db.query(Seminar).filter(
             and_(Seminar.date >= datetime.utcnow(), Seminar.status.in_(["scheduled", "upcoming"]))
         )
@@ -96,7 +253,39 @@ class SeminarService:
         if topic:
             query = query.filter(Seminar.topic == topic)
 
-        return query.order_by(Seminar.date).limit(limit).all()
+        return query
+
+    def get_upcoming_snapshot(self, limit: int = 5) -> List[Dict[str, Any]]:
+        """
+        Get formatted upcoming seminars for chat context (cached).
+
+        Args:
+            limit: Maximum seminars
+
+        Returns:
+            List of seminar dicts with display date and seat availability
+        """
+        cached = seminar_snapshot_cache.get(limit)
+        if cached is not None:
+            return cached
+
+        version = seminar_snapshot_cache.version
+        seminars = self.list_upcoming_seminars(limit=limit)
+        snapshot = [
+            {
+                "id": seminar.id,
+                "title": seminar.title,
+                "date": seminar.date.strftime("%B %d, %Y at %I:%M %p") if seminar.date else "TBD",
+                "location_type": seminar.location_type,
+                "available_seats": seminar.available_seats,
+                "is_full": seminar.is_full,
+            }
+            for seminar in seminars
+        ]
+        first_start = _as_naive_utc(seminars[0].date) if seminars and seminars[0].date else None
+
+        seminar_snapshot_cache.put(limit, snapshot, version, first_start)
+        return [dict(seminar) for seminar in snapshot]
 
     def register_attendee(
         self,
@@ -332,6 +521,54 @@ class SeminarService:
         }
 
 
+class AsyncSeminarService(AsyncSessionService):
+    """SeminarService for an AsyncSession (API read paths and registration)."""
+
+    service_class = SeminarService
+
+    async def get_seminar(self, seminar_id: int) -> Optional[Seminar]:
+        """Get seminar by ID (see SeminarService.get_seminar)"""
+        return await self._run("get_seminar", seminar_id)
+
+    async def list_upcoming_seminars(
+        self, limit: int = 10, topic: Optional[str] = None
+    ) -> List[Seminar]:
+        """List upcoming seminars (see SeminarService.list_upcoming_seminars)"""
+        return await self._run("list_upcoming_seminars", limit=limit, topic=topic)
+
+    async def page_upcoming_seminars(
+        self, limit: int = 10, topic: Optional[str] = None, cursor: Optional[str] = None
+    ) -> Page:
+        """One page of upcoming seminars (see SeminarService.page_upcoming_seminars)"""
+        return await self._run(
+            "page_upcoming_seminars", limit=limit, topic=topic, cursor=cursor
+        )
+
+    async def register_attendee(
+        self,
+        seminar_id: int,
+        lead_id: Optional[int] = None,
+        guest_name: Optional[str] = None,
+        guest_email: Optional[str] = None,
+        guest_phone: Optional[str] = None,
+        reminder_preference: str = "email",
+    ) -> SeminarRegistration:
+        """Register for a seminar (see SeminarService.register_attendee)"""
+        return await self._run(
+            "register_attendee",
+            seminar_id=seminar_id,
+            lead_id=lead_id,
+            guest_name=guest_name,
+            guest_email=guest_email,
+            guest_phone=guest_phone,
+            reminder_preference=reminder_preference,
+        )
+
+    async def get_seminar_stats(self, seminar_id: int) -> Dict[str, Any]:
+        """Get seminar statistics (see SeminarService.get_seminar_stats)"""
+        return await self._run("get_seminar_stats", seminar_id)
+
+
 # Test function
 if __name__ == "__main__":
     from core.database import SessionLocal, init_db
@@ -0,0 +1,95 @@
+"""
+Summary Service - Rolling conversation summaries
+Compresses older turns into Conversation.summary in the background so the
+prompt sent each turn stays roughly constant in size.
+"""
+
+import asyncio
+from typing import Any, Dict, Set
+
+from core.config import settings
+from core.database import SessionLocal
+from services.conversation_service import ConversationService
+from services.groq_service import GroqService
+
+
+class ConversationSummarizer:
+    """
+    Schedules summary refreshes off the request path.
+
+    Each refresh runs as its own task with its own database session, at most
+    one per conversation at a time.
+    """
+
+    def __init__(self, groq_service: GroqService):
+        self.groq_service = groq_service
+        self._tasks: Set[asyncio.Task] = set()
+        self._in_flight: Set[str] = set()
+        self.counts = {"scheduled": 0, "refreshed": 0, "failed": 0}
+
+    @staticmethod
+    def needs_refresh(unsummarized_messages: int) -> bool:
+        """Whether enough messages are waiting outside the verbatim window"""
+        return unsummarized_messages >= (
+            settings.SUMMARY_WINDOW_MESSAGES + settings.SUMMARY_BATCH_MESSAGES
+        )
+
+    def schedule(self, session_id: str) -> None:
+        """
+        Refresh a conversation's summary in the background.
+
+        Must be called from a running event loop; a refresh already running
+        for the same session makes this a no-op.
+
+        Args:
+            session_id: Session identifier
+        """
+        if session_id in self._in_flight:
+            return
+
+        self._in_flight.add(session_id)
+        self.counts["scheduled"] += 1
+        task = asyncio.create_task(self._refresh(session_id))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _refresh(self, session_id: str) -> None:
+        """Fold all but the most recent window of messages into the summary"""
+        db = SessionLocal()
+        try:
+            conversation_service = ConversationService(db)
+            conversation = conversation_service.get_conversation(session_id)
+            if not conversation:
+                return
+
+            messages = conversation_service.get_unsummarized_messages(conversation)
+            to_fold = messages[: -settings.SUMMARY_WINDOW_MESSAGES]
+            if not to_fold:
+                return
+
+            summary = await self.groq_service.summarize_conversation(
+                conversation.summary,
+                [{"role": m.role, "content": m.content} for m in to_fold],
+            )
+            if not summary:
+                self.counts["failed"] += 1
+                return
+
+            if conversation_service.update_summary(conversation, summary, to_fold[-1].seq):
+                self.counts["refreshed"] += 1
+        except Exception as e:
+            db.rollback()
+            self.counts["failed"] += 1
+            print(f"Error refreshing conversation summary: {e}")
+        finally:
+            db.close()
+            self._in_flight.discard(session_id)
+
+    def stats(self) -> Dict[str, Any]:
+        """Report refresh activity"""
+        return {**self.counts, "in_flight": len(self._in_flight)}
+
+    async def aclose(self) -> None:
+        """Let pending refreshes finish on shutdown"""
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
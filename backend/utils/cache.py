@@ -0,0 +1,173 @@
+"""
+In-process caching helpers
+Bounded LRU cache with per-entry TTL and hit/miss counters, and single-flight
+coalescing of concurrent identical async calls.
+"""
+
+import asyncio
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional
+
+
+class TTLCache:
+    """
+    Least-recently-used cache whose entries also expire after a TTL.
+
+    Entries can be tied to a generation (e.g. a data snapshot version): the
+    first lookup with a new generation drops everything cached under the old
+    one.
+    """
+
+    def __init__(self, max_entries: int, ttl_seconds: float):
+        """
+        Args:
+            max_entries: Maximum cached entries (0 disables the cache)
+            ttl_seconds: Seconds an entry stays valid
+        """
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.generation: Optional[Hashable] = None
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def get(self, key: Hashable, generation: Optional[Hashable] = None) -> Optional[Any]:
+        """
+        Look up a value.
+
+        Args:
+            key: Cache key
+            generation: Current data generation; a change clears the cache
+
+        Returns:
+            Cached value, or None on a miss
+        """
+        if not self.max_entries:
+            return None
+
+        with self._lock:
+            self._check_generation(generation)
+            entry = self._entries.get(key)
+            if entry and entry[1] > time.monotonic():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[0]
+
+            if entry:
+                del self._entries[key]
+            self.misses += 1
+            return None
+
+    def put(self, key: Hashable, value: Any, generation: Optional[Hashable] = None) -> None:
+        """Store a value, evicting the least recently used entry when full"""
+        if not self.max_entries:
+            return
+
+        with self._lock:
+            self._check_generation(generation)
+            self._entries[key] = (value, time.monotonic() + self.ttl_seconds)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        """Drop all entries"""
+        with self._lock:
+            self._entries.clear()
+            self.invalidations += 1
+
+    def _check_generation(self, generation: Optional[Hashable]) -> None:
+        """Invalidate when the data generation moves on (lock held)"""
+        if generation != self.generation:
+            if self._entries:
+                self._entries.clear()
+                self.invalidations += 1
+            self.generation = generation
+
+    def stats(self) -> Dict[str, Any]:
+        """Report cache effectiveness"""
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+        }
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent async calls that share a key into one call.
+
+    The first caller for a key starts the call; callers arriving while it is
+    in flight await the same result (or exception). Nothing is kept once the
+    call finishes - pair with TTLCache for reuse after that. The shared call
+    is cancelled only when every caller waiting on it has been cancelled.
+    """
+
+    def __init__(self):
+        self._calls: Dict[Hashable, asyncio.Task] = {}
+        self._waiters: Dict[Hashable, int] = {}
+        self.calls = 0
+        self.coalesced = 0
+
+    async def do(self, key: Hashable, call: Callable[[], Awaitable]) -> Any:
+        """
+        Run `call()` unless an identical call is already in flight.
+
+        Args:
+            key: Identity of the call (e.g. a prompt hash)
+            call: Starts the call; invoked only by the first caller
+
+        Returns:
+            The shared call's result
+        """
+        task = self._calls.get(key)
+        if task is None:
+            task = asyncio.ensure_future(call())
+            self._calls[key] = task
+            self._waiters[key] = 0
+            task.add_done_callback(lambda done: self._finish(key, done))
+            self.calls += 1
+        else:
+            self.coalesced += 1
+
+        self._waiters[key] += 1
+        try:
+            return await asyncio.shield(task)
+        except asyncio.CancelledError:
+            if not task.done():
+                self._waiters[key] -= 1
+                if not self._waiters[key]:
+                    # Nobody wants the result; a new caller starts afresh
+                    del self._calls[key]
+                    del self._waiters[key]
+                    task.cancel()
+            raise
+
+    def _finish(self, key: Hashable, task: asyncio.Task) -> None:
+        """Forget a finished call so the next one for its key starts fresh"""
+        if self._calls.get(key) is task:
+            del self._calls[key]
+            del self._waiters[key]
+        if not task.cancelled():
+            task.exception()  # Retrieved here so an unawaited failure isn't logged
+
+    def stats(self) -> Dict[str, Any]:
+        """Report how many calls were shared"""
+        requests = self.calls + self.coalesced
+        return {
+            "in_flight": len(self._calls),
+            "upstream_calls": self.calls,
+            "coalesced": self.coalesced,
+            "coalesced_rate": round(self.coalesced / requests, 3) if requests else 0.0,
+        }
@@ -3,18 +3,22 @@ ProVision Brokerage Chatbot - Main Orchestrator
 Coordinates all services to create an intelligent AI assistant for insurance sales.
 """
 
+import asyncio
 import uuid
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, AsyncIterator, Tuple
 from datetime import datetime
 
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
+from sqlalchemy.orm.exc import StaleDataError
 
 from core.config import settings
-from services.groq_service import GroqService
-from services.qualification_service import QualificationService
-from services.conversation_service import ConversationService
+from services.conversation_service import ConversationConflictError, ConversationService
 from services.lead_service import LeadService
-from services.calcom_service import CalComService
+from services.container import ServiceContainer
+from services.resilience import Deadline
+from models.conversation import Conversation
 
 
 class ProVisionChatbot:
@@ -29,23 +33,30 @@ class ProVisionChatbot:
     - Database persistence
     """
 
-    def __init__(self, db: Session):
+    def __init__(self, db: Session, services: Optional[ServiceContainer] = None):
         """
-        Initialize chatbot with all services.
+        Bind chatbot to a request's database session.
 
         Args:
             db: Database session
+            services: Shared service container (built on the fly if omitted,
+                e.g. for scripts)
         """
         self.db = db
+        services = services or ServiceContainer()
 
-        # Initialize services
-        self.groq_service = GroqService()
-        self.qualification_service = QualificationService()
-        self.conversation_service = ConversationService(db)
-        self.lead_service = LeadService(db)
-        self.calcom_service = CalComService()
+        # Shared, stateless services (process lifetime)
+        self.groq_service = services.groq_service
+        self.qualification_service = services.qualification_service
+        self.calcom_service = services.calcom_service
+        self.summarizer = services.summarizer
+        self.intent_router = services.intent_router
+        self.session_locks = services.session_locks
+        self.write_conflicts = services.write_conflicts
 
-        print(" ProVision Chatbot initialized successfully!")
+        # Session-bound services (request lifetime); the chatbot owns commits
+        self.conversation_service = ConversationService(db, autocommit=False)
+        self.lead_service = LeadService(db, autocommit=False)
 
     async def process_message(
         self,
@@ -59,7 +70,29 @@ class ProVisionChatbot:
         """
         Process a user message and generate AI response.
 
-        This is the main entry point for the chatbot.
+        This is the main entry point for the chatbot. Qualification extraction
+        and response generation both depend only on the user message and
+        history, so by default the two LLM calls run concurrently and the
+        extracted answer is reconciled into the response metadata afterwards
+        (see CONCURRENT_QUALIFICATION_EXTRACTION).
+
+        The turn is one unit of work: reads happen up front, and every write
+        (conversation, both messages, qualification, lead) is committed once
+        after the LLM calls. If response generation fails, the turn is rolled
+        back - nothing is saved and progress does not advance - and the
+        fallback reply is returned so the user can simply resend.
+
+        Every LLM call is bounded by the turn's REQUEST_BUDGET_SECONDS
+        deadline. When Groq fails, times out or its circuit breaker is open,
+        the reply is served from cached answers or the knowledge base where
+        possible (degraded mode) and the turn is saved as usual.
+
+        Turns for the same session are serialized within this worker; across
+        workers, a turn whose conversation changed after it was read is
+        re-applied on the fresh state (see _save_turn).
+
+        The session is synchronous, so the read and write phases run in the
+        threadpool; only the LLM calls run on the event loop.
 
         Args:
             message: User's message
@@ -72,107 +105,525 @@ class ProVisionChatbot:
         Returns:
             Dictionary with response, qualification status, and next actions
         """
-        # Generate session ID if not provided
-        if not session_id:
-            session_id = str(uuid.uuid4())
+        session_id = session_id or str(uuid.uuid4())
+
+        async with self.session_locks.hold(session_id):
+            turn = await run_in_threadpool(
+                self._begin_turn,
+                message,
+                session_id,
+                channel,
+                user_email,
+                user_name,
+                page_context,
+            )
 
-        # Get or create conversation
-        conversation = self.conversation_service.get_or_create_conversation(
-            session_id=session_id, channel=channel
-        )
+            try:
+                if settings.CONCURRENT_QUALIFICATION_EXTRACTION:
+                    qualification_intent, ai_response = await asyncio.gather(
+                        self._extract_qualification(turn),
+                        self._generate(turn),
+                    )
+                    self._apply_qualification(turn, qualification_intent)
+                else:
+                    # Sequential: the response is generated with the updated context
+                    qualification_intent = await self._extract_qualification(turn)
+                    self._apply_qualification(turn, qualification_intent)
+                    ai_response = await self._generate(turn)
+            except Exception as e:
+                print(f"Chat turn rolled back, LLM call failed: {type(e).__name__}: {e}")
+                self.db.rollback()
+                return self._build_response(
+                    turn, self.groq_service._fallback_response(), turn["initial_progress"]
+                )
+
+            return await self._persist_turn(turn, qualification_intent, ai_response)
+
+    async def stream_message(
+        self,
+        message: str,
+        session_id: Optional[str] = None,
+        channel: str = "web",
+        user_email: Optional[str] = None,
+        user_name: Optional[str] = None,
+        page_context: Optional[str] = None,
+    ) -> AsyncIterator[Tuple[str, Any]]:
+        """
+        Process a user message, streaming the AI response as it is generated.
+
+        Same flow as process_message, but yields ("token", text) events while
+        Groq generates and a final ("done", response_dict) event once the turn
+        has been committed. Qualification extraction runs in the background
+        while tokens stream. If the consumer stops iterating (client
+        disconnect) or the stream fails, the upstream call and the extraction
+        are cancelled and the turn is rolled back. The session lock is held
+        until the stream finishes.
+
+        Yields:
+            (event, payload) tuples
+        """
+        session_id = session_id or str(uuid.uuid4())
+
+        async with self.session_locks.hold(session_id):
+            turn = await run_in_threadpool(
+                self._begin_turn,
+                message,
+                session_id,
+                channel,
+                user_email,
+                user_name,
+                page_context,
+            )
+            extraction = asyncio.create_task(self._extract_qualification(turn))
+
+            chunks = []
+            stream = self._stream(turn)
+            try:
+                async for chunk in stream:
+                    chunks.append(chunk)
+                    yield "token", chunk
+            except Exception as e:
+                extraction.cancel()
+                self.db.rollback()
+                if chunks:
+                    raise
+
+                # Nothing streamed yet: same semantics as process_message
+                print(f"Chat turn rolled back, LLM call failed: {type(e).__name__}: {e}")
+                fallback = self.groq_service._fallback_response()
+                yield "token", fallback
+                yield "done", self._build_response(
+                    turn, fallback, turn["initial_progress"]
+                )
+                return
+            except BaseException:
+                extraction.cancel()
+                self.db.rollback()
+                raise
+            finally:
+                await stream.aclose()
+
+            qualification_intent = await extraction
+            self._apply_qualification(turn, qualification_intent)
+            yield "done", await self._persist_turn(
+                turn, qualification_intent, "".join(chunks)
+            )
 
-        # Save user message
-        self.conversation_service.add_message(
-            session_id=session_id, role="user", content=message
+    def _begin_turn(
+        self,
+        message: str,
+        session_id: Optional[str],
+        channel: str,
+        user_email: Optional[str],
+        user_name: Optional[str],
+        page_context: Optional[str],
+    ) -> Dict[str, Any]:
+        """
+        Read phase of a turn: load conversation state and build the AI context.
+
+        Nothing is written here, and the read transaction is ended before
+        returning, so the turn holds neither a write lock nor a pooled
+        connection during LLM calls. _complete_turn checks out a connection
+        again and re-checks the version read here. The turn's deadline
+        starts here.
+
+        Returns:
+            Turn state consumed by _apply_qualification and _complete_turn
+        """
+        turn = {
+            "session_id": session_id,
+            "message": message,
+            "channel": channel,
+            "user_email": user_email,
+            "user_name": user_name,
+            "page_context": page_context,
+            "deadline": Deadline(settings.REQUEST_BUDGET_SECONDS),
+        }
+        self._load_conversation_state(turn)
+
+        # Knowledge-base answer that makes the LLM call unnecessary
+        turn["routed_reply"] = (
+            self.intent_router.route(message, turn["progress"])
+            if settings.INTENT_ROUTER_ENABLED
+            else None
         )
 
-        # Get conversation history
-        message_history = self.conversation_service.get_message_history(session_id)
+        # Return the connection to the pool while the LLM calls run
+        self.db.rollback()
+        return turn
+
+    def _load_conversation_state(self, turn: Dict[str, Any]) -> None:
+        """
+        Read the conversation's current state into the turn.
+
+        Also used to rebase a turn onto fresh state after a write conflict.
+
+        Args:
+            turn: Turn state (updated in place)
+        """
+        session_id = turn["session_id"]
+
+        # Existing conversation, or an unsaved one with default state
+        conversation = self.conversation_service.get_conversation(session_id)
+        message_history = []
+        if conversation:
+            # Messages not yet folded into the rolling summary; bounded even if
+            # the background summary refresh falls behind
+            message_history = self.conversation_service.get_message_history(
+                session_id,
+                limit=settings.SUMMARY_WINDOW_MESSAGES + settings.SUMMARY_BATCH_MESSAGES,
+                after_seq=conversation.summary_through_seq or 0,
+            )
+        else:
+            conversation = Conversation(
+                session_id=session_id,
+                channel=turn["channel"],
+                qualification_progress=0,
+                qualification_answers={},
+                is_qualified=False,
+                appointment_booked=False,
+            )
 
         # Build context for AI
-        context = self._build_context(conversation, user_email, user_name)
-        
+        context = self._build_context(conversation, turn["user_email"], turn["user_name"])
+
         # Add page context if provided
-        if page_context:
-            context["page"] = page_context
-
-        # Check if we're in qualification flow
-        current_progress = conversation.qualification_progress
-        qualification_answers = conversation.qualification_answers or {}
-
-        # Extract qualification data from user message if in qualification flow
-        if current_progress < 7:
-            # Use AI to extract qualification intent (NOT async)
-            qualification_intent = self.groq_service.extract_qualification_intent(
-                message
-            )
+        if turn["page_context"]:
+            context["page"] = turn["page_context"]
 
-            # Get next question
-            next_question = self.qualification_service.get_next_question(
-                current_progress
-            )
+        # Older turns reach the LLM through the rolling summary
+        if conversation.summary:
+            context["conversation_summary"] = conversation.summary
 
-            # If AI found an answer, save it
-            if qualification_intent and next_question:
-                question_field = next_question["field"]
-
-                # Extract answer from AI analysis
-                if "answer" in qualification_intent:
-                    qualification_answers[question_field] = qualification_intent[
-                        "answer"
-                    ]
-                    current_progress += 1
-
-                    # Update conversation
-                    self.conversation_service.update_qualification(
-                        session_id=session_id,
-                        progress=current_progress,
-                        answers=qualification_answers,
-                    )
+        progress = conversation.qualification_progress or 0
 
-                    # Calculate score if qualification complete
-                    if current_progress >= 7:
-                        lead_score = self.qualification_service.calculate_score(
-                            qualification_answers
-                        )
-                        is_qualified = (
-                            self.qualification_service.should_offer_appointment(
-                                lead_score
-                            )
-                        )
-
-                        # Create or update lead
-                        if user_email:
-                            lead = self.lead_service.create_lead(
-                                name=user_name or "Unknown",
-                                email=user_email,
-                                source=channel,
-                                qualification_answers=qualification_answers,
-                            )
-
-                            # Link conversation to lead
-                            self.conversation_service.link_to_lead(session_id, lead.id)
-
-                            # Update context
-                            context["lead_id"] = lead.id
-                            context["lead_score"] = lead_score
-                            context["is_qualified"] = is_qualified
-
-        # Generate AI response
-        ai_response = self.groq_service.generate_response(
-            user_message=message,
-            conversation_history=message_history[-10:],  # Last 10 messages for context
+        turn.update(
+            # A conversation this turn creates starts at version 1
+            version=conversation.version or 1,
+            history=message_history,
             context=context,
+            initial_progress=progress,
+            progress=progress,
+            answers=dict(conversation.qualification_answers or {}),
+            qualification_changed=False,
+        )
+
+    async def _generate(self, turn: Dict[str, Any]) -> str:
+        """
+        Generate the AI response for a turn
+
+        Raises on LLM failure only if degraded mode has no answer either.
+        """
+        if turn["routed_reply"]:
+            return turn["routed_reply"]
+
+        try:
+            return await self.groq_service.generate_response(
+                user_message=turn["message"],
+                conversation_history=turn["history"],
+                context=turn["context"],
+                fallback=False,
+                deadline=turn["deadline"],
+            )
+        except Exception as e:
+            reply = self._degraded_reply(turn, e)
+            if reply is None:
+                raise
+            return reply
+
+    async def _stream(self, turn: Dict[str, Any]) -> AsyncIterator[str]:
+        """
+        Stream the AI response for a turn
+
+        If the LLM fails before the first token, a degraded-mode answer is
+        yielded instead; otherwise failures are raised.
+        """
+        if turn["routed_reply"]:
+            yield turn["routed_reply"]
+            return
+
+        stream = self.groq_service.stream_response(
+            user_message=turn["message"],
+            conversation_history=turn["history"],
+            context=turn["context"],
+            fallback=False,
+            deadline=turn["deadline"],
+        )
+        started = False
+        try:
+            async for chunk in stream:
+                started = True
+                yield chunk
+        except Exception as e:
+            reply = None if started else self._degraded_reply(turn, e)
+            if reply is None:
+                raise
+            yield reply
+        finally:
+            await stream.aclose()
+
+    def _degraded_reply(self, turn: Dict[str, Any], error: Exception) -> Optional[str]:
+        """
+        Answer without the LLM: a cached reply to the same message, else the
+        best knowledge-base answer.
+
+        Args:
+            turn: Turn state from _begin_turn
+            error: Why the LLM call failed
+
+        Returns:
+            Reply text, or None if there is nothing better than the fallback
+        """
+        reply = self.groq_service.cached_response(turn["message"], turn["context"])
+        if reply is None:
+            reply = self.intent_router.degraded_reply(turn["message"], turn["progress"])
+        if reply is not None:
+            print(f"Degraded reply served, LLM call failed: {type(error).__name__}: {error}")
+        return reply
+
+    async def _extract_qualification(self, turn: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Extract qualification data from the user message.
+
+        Tries the rule-based extractor for the pending question first and only
+        calls the LLM when the rules are not confident. LLM output is
+        normalized onto the scored option values.
+
+        Args:
+            turn: Turn state from _begin_turn
+
+        Returns:
+            Extracted fields (empty once qualification is complete)
+        """
+        next_question = self.qualification_service.get_next_question(turn["progress"])
+        if not next_question:
+            return {}
+
+        field = next_question["field"]
+        if settings.RULE_BASED_QUALIFICATION:
+            answer = self.qualification_service.extract_answer(field, turn["message"])
+            if answer:
+                return {field: answer}
+
+        intent = await self.groq_service.extract_qualification_intent(
+            turn["message"], deadline=turn["deadline"]
+        )
+        return {
+            key: self.qualification_service.normalize_answer(key, value)
+            for key, value in intent.items()
+        }
+
+    def _apply_qualification(
+        self, turn: Dict[str, Any], qualification_intent: Dict[str, Any]
+    ) -> None:
+        """
+        Reconcile extracted qualification data into the turn.
+
+        Saves the answer to the pending question, advances progress and scores
+        the lead once qualification completes, updating the turn context so
+        the response metadata reflects the new state. Persistence happens in
+        _complete_turn.
+
+        Args:
+            turn: Turn state from _begin_turn (updated in place)
+            qualification_intent: Fields extracted from the user message
+        """
+        if not qualification_intent:
+            return
+
+        context = turn["context"]
+        current_progress = turn["progress"]
+        qualification_answers = turn["answers"]
+
+        # Get next question
+        next_question = self.qualification_service.get_next_question(current_progress)
+        if not next_question:
+            return
+
+        # Extract answer for the pending question from AI analysis
+        question_field = next_question["field"]
+        answer = qualification_intent.get(question_field) or qualification_intent.get(
+            "answer"
         )
+        if not answer:
+            return
+
+        qualification_answers[question_field] = answer
+        current_progress += 1
+        turn["progress"] = current_progress
+        turn["qualification_changed"] = True
+        context["qualification_progress"] = current_progress
+        context["qualification_answers"] = qualification_answers
+
+        # Calculate score if qualification complete
+        if current_progress >= 7:
+            lead_score = self.qualification_service.calculate_score(
+                qualification_answers
+            )
+            context["lead_score"] = lead_score
+            context["is_qualified"] = self.qualification_service.should_offer_appointment(
+                lead_score, current_progress
+            )
 
-        # Save AI response
-        self.conversation_service.add_message(
-            session_id=session_id, role="assistant", content=ai_response
+    async def _persist_turn(
+        self,
+        turn: Dict[str, Any],
+        qualification_intent: Dict[str, Any],
+        ai_response: str,
+    ) -> Dict[str, Any]:
+        """
+        Save a turn off the event loop, then schedule a summary refresh.
+
+        Args:
+            turn: Turn state, qualification already applied
+            qualification_intent: Fields extracted from the user message
+            ai_response: Full AI response text
+
+        Returns:
+            Dictionary with response, qualification status, and next actions
+        """
+        response = await run_in_threadpool(
+            self._save_turn, turn, qualification_intent, ai_response
         )
 
+        # This turn added two messages; compress older ones off the request path
+        if turn.get("saved") and self.summarizer.needs_refresh(len(turn["history"]) + 2):
+            self.summarizer.schedule(turn["session_id"])
+
+        return response
+
+    def _save_turn(
+        self,
+        turn: Dict[str, Any],
+        qualification_intent: Dict[str, Any],
+        ai_response: str,
+    ) -> Dict[str, Any]:
+        """
+        Persist a turn, rebasing it if another worker wrote the conversation first.
+
+        On a conflict the conversation is re-read and the extracted answer is
+        re-applied to the fresh state. An answer for a question that has since
+        been answered no longer matches the pending question, so it cannot be
+        counted twice. The reply is kept as generated.
+
+        Args:
+            turn: Turn state, qualification already applied
+            qualification_intent: Fields extracted from the user message
+            ai_response: Full AI response text
+
+        Returns:
+            Dictionary with response, qualification status, and next actions
+        """
+        for attempt in range(settings.CONVERSATION_WRITE_RETRIES + 1):
+            try:
+                return self._complete_turn(turn, ai_response)
+            except ConversationConflictError as e:
+                self.write_conflicts["conflicts"] += 1
+                if attempt == settings.CONVERSATION_WRITE_RETRIES:
+                    self.write_conflicts["retries_exhausted"] += 1
+                    print(f"Chat turn rolled back, conversation kept changing: {e}")
+                    return self._build_response(
+                        turn,
+                        self.groq_service._fallback_response(),
+                        turn["initial_progress"],
+                    )
+
+                self._load_conversation_state(turn)
+                self._apply_qualification(turn, qualification_intent)
+
+    def _complete_turn(self, turn: Dict[str, Any], ai_response: str) -> Dict[str, Any]:
+        """
+        Write phase of a turn: persist everything and commit once.
+
+        Args:
+            turn: Turn state from _begin_turn
+            ai_response: Full AI response text
+
+        Returns:
+            Dictionary with response, qualification status, and next actions
+
+        Raises:
+            ConversationConflictError: The conversation changed since it was
+                read (the turn is rolled back)
+        """
+        session_id = turn["session_id"]
+        context = turn["context"]
+        current_progress = turn["progress"]
+
+        try:
+            conversation = self.conversation_service.get_or_create_conversation(
+                session_id=session_id, channel=turn["channel"]
+            )
+            # Version check against the state this turn read
+            self.conversation_service.touch(conversation, expected_version=turn["version"])
+
+            # Save user message
+            self.conversation_service.add_message(
+                session_id=session_id, role="user", content=turn["message"]
+            )
+
+            # Update conversation
+            if turn["qualification_changed"]:
+                self.conversation_service.update_qualification(
+                    session_id=session_id,
+                    progress=current_progress,
+                    answers=turn["answers"],
+                    is_qualified=context.get("is_qualified", False),
+                )
+
+                # Create or update lead
+                if current_progress >= 7 and turn["user_email"]:
+                    lead = self.lead_service.create_lead(
+                        name=turn["user_name"] or "Unknown",
+                        email=turn["user_email"],
+                        source=turn["channel"],
+                        qualification_answers=turn["answers"],
+                    )
+
+                    # Link conversation to lead
+                    self.conversation_service.link_to_lead(session_id, lead.id)
+                    context["lead_id"] = lead.id
+
+            # Save AI response
+            self.conversation_service.add_message(
+                session_id=session_id, role="assistant", content=ai_response
+            )
+
+            self.db.commit()
+        except ConversationConflictError:
+            self.db.rollback()
+            raise
+        except (StaleDataError, IntegrityError) as e:
+            # Another writer updated the conversation, created it, or took the
+            # next message seq first
+            self.db.rollback()
+            raise ConversationConflictError(str(e)) from e
+        except Exception:
+            self.db.rollback()
+            raise
+
+        turn["saved"] = True
+        return self._build_response(turn, ai_response, current_progress)
+
+    def _build_response(
+        self, turn: Dict[str, Any], ai_response: str, current_progress: int
+    ) -> Dict[str, Any]:
+        """
+        Build the response object for a turn.
+
+        Args:
+            turn: Turn state from _begin_turn
+            ai_response: AI response text
+            current_progress: Qualification progress to report
+
+        Returns:
+            Dictionary with response, qualification status, and next actions
+        """
+        context = turn["context"]
+
         # Build response object
         response = {
-            "session_id": session_id,
+            "session_id": turn["session_id"],
             "message": ai_response,
             "qualification_progress": current_progress,
             "total_questions": 7,
@@ -232,26 +683,15 @@ class ProVisionChatbot:
                 context["lead_score"] = lead.lead_score
                 context["qualification_status"] = lead.qualification_status
 
-        # Add upcoming seminars info
+        # Add upcoming seminars info (cached snapshot, invalidated on seat changes)
         try:
-            from services.seminar_service import SeminarService
-            seminar_service = SeminarService(self.db)
-            upcoming_seminars = seminar_service.list_upcoming_seminars(limit=5)
-            
+            from services.seminar_service import SeminarService, seminar_snapshot_cache
+            upcoming_seminars = SeminarService(self.db).get_upcoming_snapshot(limit=5)
+            # Cached replies that quoted seminar details expire with the snapshot
+            context["seminar_version"] = seminar_snapshot_cache.version
+
             if upcoming_seminars:
-                seminars_info = []
-                for seminar in upcoming_seminars:
-                    seminar_data = {
-                        "id": seminar.id,
-                        "title": seminar.title,
-                        "date": seminar.date.strftime("%B %d, %Y at %I:%M %p") if seminar.date else "TBD",
-                        "location_type": seminar.location_type,
-                        "available_seats": seminar.available_seats,
-                        "is_full": seminar.is_full
-                    }
-                    seminars_info.append(seminar_data)
-                
-                context["upcoming_seminars"] = seminars_info
+                context["upcoming_seminars"] = upcoming_seminars
         except Exception as e:
             print(f"Warning: Could not fetch seminars for context: {e}")
             context["upcoming_seminars"] = []
@@ -287,12 +727,31 @@ class ProVisionChatbot:
         )
 
         if booking_result["success"]:
+            # Don't interleave with a chat turn writing the same conversation
+            async with self.session_locks.hold(session_id):
+                await run_in_threadpool(
+                    self._record_booking, session_id, booking_result, start_time
+                )
+
+        return booking_result
+
+    def _record_booking(
+        self, session_id: str, booking_result: Dict[str, Any], start_time: datetime
+    ) -> None:
+        """
+        Persist a confirmed booking and commit (runs in the threadpool).
+
+        Args:
+            session_id: Session ID
+            booking_result: Successful result from Cal.com
+            start_time: Appointment start time
+        """
+        try:
             # Mark conversation as booked
-            self.conversation_service.mark_appointment_booked(session_id)
+            conversation = self.conversation_service.mark_appointment_booked(session_id)
 
             # Update lead if exists
-            conversation = self.conversation_service.get_conversation(session_id)
-            if conversation and conversation.lead_id:
+            if conversation.lead_id:
                 lead = self.lead_service.get_lead(conversation.lead_id)
                 if lead:
                     # Create appointment record in database
@@ -306,9 +765,11 @@ class ProVisionChatbot:
                         source=conversation.channel,
                     )
                     self.db.add(appointment)
-                    self.db.commit()
 
-        return booking_result
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
 
     def get_conversation_summary(self, session_id: str) -> Dict[str, Any]:
         """
@@ -328,12 +789,14 @@ class ProVisionChatbot:
         summary = {
             "session_id": conversation.session_id,
             "channel": conversation.channel,
-            "message_count": len(conversation.messages) if conversation.messages else 0,
+            "message_count": self.conversation_service.count_messages(session_id),
             "qualification_progress": f"{conversation.qualification_progress}/7",
             "is_qualified": conversation.is_qualified,
             "appointment_booked": conversation.appointment_booked,
             "created_at": conversation.created_at.isoformat(),
-            "updated_at": conversation.updated_at.isoformat(),
+            "updated_at": conversation.last_updated.isoformat()
+            if conversation.last_updated
+            else None,
         }
 
         # Add lead info if available
@@ -0,0 +1,46 @@
+"""
+Email address helpers
+One normalization for every path that stores or looks up a lead email (API,
+chat, bulk import), matching what pydantic's EmailStr produces, so the same
+address always maps to the same lead.
+"""
+
+import re
+from functools import lru_cache
+
+from email_validator import EmailNotValidError, validate_email
+
+__all__ = ["EmailNotValidError", "normalize_email"]
+
+# Plain ASCII local part (RFC 5322 dot-atom); anything else gets the full check
+_DOT_ATOM = re.compile(
+    r"[A-Za-z0-9!#$%&'*+/=?^_`{|}~-]+(?:\.[A-Za-z0-9!#$%&'*+/=?^_`{|}~-]+)*"
+)
+
+
+@lru_cache(maxsize=4096)
+def _normalized_domain(domain: str) -> str:
+    """Validated, normalized email domain (a file repeats a handful of domains)"""
+    return validate_email(f"lead@{domain}", check_deliverability=False).domain
+
+
+def normalize_email(email: str) -> str:
+    """
+    Validate an email address and normalize it the way EmailStr does.
+
+    The domain check (IDNA) dominates email_validator's cost, so it is
+    cached per domain.
+
+    Args:
+        email: Email address
+
+    Returns:
+        Normalized address
+
+    Raises:
+        EmailNotValidError: Not a valid address
+    """
+    local, _, domain = email.rpartition("@")
+    if len(local) <= 64 and len(email) <= 254 and _DOT_ATOM.fullmatch(local):
+        return f"{local}@{_normalized_domain(domain)}"
+    return validate_email(email, check_deliverability=False).normalized
@@ -0,0 +1,56 @@
+"""
+In-process locking helpers
+Async locks keyed by an identifier (e.g. a chat session), created on demand
+and dropped once nobody holds or waits for them.
+"""
+
+import asyncio
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, Hashable, List
+
+
+class KeyedLock:
+    """
+    One asyncio.Lock per key.
+
+    Work for the same key runs one at a time, in arrival order; different
+    keys never wait on each other. Only serializes within one event loop
+    (one worker process).
+    """
+
+    def __init__(self):
+        self._locks: Dict[Hashable, List[Any]] = {}  # key -> [lock, users]
+        self.acquisitions = 0
+        self.contended = 0
+
+    @asynccontextmanager
+    async def hold(self, key: Hashable) -> AsyncIterator[None]:
+        """
+        Hold the lock for `key` for the duration of the block.
+
+        Args:
+            key: Identifier to serialize on
+        """
+        entry = self._locks.get(key)
+        if entry is None:
+            entry = self._locks[key] = [asyncio.Lock(), 0]
+        entry[1] += 1
+        self.acquisitions += 1
+        if entry[0].locked():
+            self.contended += 1
+
+        try:
+            async with entry[0]:
+                yield
+        finally:
+            entry[1] -= 1
+            if not entry[1]:
+                del self._locks[key]
+
+    def stats(self) -> Dict[str, Any]:
+        """Report lock usage"""
+        return {
+            "active_keys": len(self._locks),
+            "acquisitions": self.acquisitions,
+            "contended": self.contended,
+        }
@@ -0,0 +1,145 @@
+"""
+Keyset (cursor) pagination helpers
+Pages continue from the last row seen (WHERE sort_key < last_value) instead
+of skipping OFFSET rows, so every page costs the same as the first and rows
+do not shift between pages when earlier rows change. The cursor handed to
+clients is opaque: base64 of the last row's sort key.
+"""
+
+import base64
+import binascii
+import json
+from datetime import datetime
+from typing import Any, List, NamedTuple, Optional
+
+from sqlalchemy import DateTime, tuple_
+
+
+class InvalidCursorError(ValueError):
+    """The cursor is malformed or belongs to a different listing"""
+
+
+class Page(NamedTuple):
+    """One page of results and the cursor for the next (None on the last page)"""
+
+    items: List[Any]
+    next_cursor: Optional[str]
+
+
+class Keyset:
+    """
+    Sort order for a paginated listing: one or more columns, all ascending or
+    all descending, ending in a unique column (the primary key) so the order
+    is total. Sort columns must not be NULL.
+    """
+
+    def __init__(self, name: str, *columns, descending: bool = False):
+        """
+        Args:
+            name: Listing name, embedded in cursors so one listing's cursor
+                is rejected by another
+            *columns: Mapped columns to sort by, most significant first
+            descending: Sort direction for every column
+        """
+        self.name = name
+        self.columns = columns
+        self.descending = descending
+
+    def apply(self, statement, cursor: Optional[str] = None):
+        """
+        Order a query and, given a cursor, start after the row it points at.
+
+        Args:
+            statement: select() or ORM Query over the listing's entity
+            cursor: next_cursor from the previous page, or None for page 1
+
+        Returns:
+            The statement with ORDER BY (and the seek condition)
+
+        Raises:
+            InvalidCursorError: The cursor cannot be decoded
+        """
+        if cursor:
+            key = tuple_(*self.columns)
+            values = tuple_(*self.decode(cursor))
+            statement = statement.where(key < values if self.descending else key > values)
+
+        return statement.order_by(
+            *(column.desc() if self.descending else column.asc() for column in self.columns)
+        )
+
+    def page(self, rows: List[Any], limit: int) -> Page:
+        """
+        Build a page from rows fetched with LIMIT limit + 1.
+
+        The extra row only signals that another page exists.
+
+        Args:
+            rows: Up to limit + 1 rows, in this keyset's order
+            limit: Page size
+
+        Returns:
+            Page with at most `limit` items
+        """
+        if len(rows) <= limit:
+            return Page(list(rows), None)
+        items = list(rows[:limit])
+        return Page(items, self.encode(items[-1]))
+
+    def encode(self, row: Any) -> str:
+        """Opaque cursor pointing at `row`"""
+        values = []
+        for column in self.columns:
+            value = getattr(row, column.key)
+            values.append(value.isoformat() if isinstance(value, datetime) else value)
+        payload = json.dumps({"k": self.name, "v": values}, separators=(",", ":"))
+        return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+    def decode(self, cursor: str) -> List[Any]:
+        """
+        Sort-key values from a cursor.
+
+        Raises:
+            InvalidCursorError: Malformed, or made by another listing
+        """
+        try:
+            padded = cursor + "=" * (-len(cursor) % 4)
+            payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+            if payload["k"] != self.name or len(payload["v"]) != len(self.columns):
+                raise InvalidCursorError("Cursor does not belong to this listing")
+            return [
+                self._decode_value(column, value)
+                for column, value in zip(self.columns, payload["v"])
+            ]
+        except InvalidCursorError:
+            raise
+        except (binascii.Error, UnicodeDecodeError, ValueError, KeyError, TypeError) as e:
+            raise InvalidCursorError("Malformed cursor") from e
+
+    @staticmethod
+    def _decode_value(column, value: Any) -> Any:
+        """
+        A cursor value as its column's Python type.
+
+        JSON values are checked against the column type so a tampered cursor
+        fails here instead of comparing e.g. an integer column to a string.
+
+        Raises:
+            InvalidCursorError: The value does not fit the column
+        """
+        if value is None:
+            return None
+        if isinstance(column.type, DateTime):
+            if not isinstance(value, str):
+                raise InvalidCursorError("Malformed cursor")
+            return datetime.fromisoformat(value)
+
+        try:
+            python_type = column.type.python_type
+        except NotImplementedError:
+            return value
+        if python_type is float and isinstance(value, int) and not isinstance(value, bool):
+            return float(value)
+        if type(value) is not python_type:
+            raise InvalidCursorError("Malformed cursor")
+        return value
@@ -0,0 +1,37 @@
+"""
+Token estimation helpers
+Approximates LLM token counts without shipping a tokenizer.
+"""
+
+# Llama-family tokenizers average roughly 4 characters per token on English text
+CHARS_PER_TOKEN = 4
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Estimate the number of tokens in a piece of text.
+
+    Args:
+        text: Text to measure
+
+    Returns:
+        Approximate token count (0 for empty text)
+    """
+    if not text:
+        return 0
+    return max(1, round(len(text) / CHARS_PER_TOKEN))
+
+
+def estimate_message_tokens(messages: list) -> int:
+    """
+    Estimate tokens for a chat completion messages array.
+
+    Adds a small per-message overhead for role and formatting tokens.
+
+    Args:
+        messages: List of {"role": ..., "content": ...} dicts
+
+    Returns:
+        Approximate token count
+    """
+    return sum(estimate_tokens(message["content"]) + 4 for message in messages)